@@ -0,0 +1,126 @@
+"""
+Бенчмарки горячих путей SDK на ответах ISS полного размера.
+
+- json.loads и parse_table/merge_tables — снимок TQBR и все облигации;
+- Share/Bond.model_validate — все строки снимка;
+- SearchService._rank_results — ответ поиска на 1000 строк;
+- TTLCache.get_or_set — попадания и промахи с вытеснением.
+
+Работает без сети (см. benchmarks/payloads.py). Результаты можно дописать
+в benchmarks/results/history.jsonl и сравнить с предыдущим запуском.
+
+Запуск:
+    python -m benchmarks.bench_hotpaths [--repeat 7] [--only search] [--save]
+"""
+
+import argparse
+import json
+
+from benchmarks import payloads
+from benchmarks.harness import last_run, measure, report, save
+from pymoex.core.cache import TTLCache
+from pymoex.core.search_index import row_keys
+from pymoex.models.bond import Bond
+from pymoex.models.share import Share
+from pymoex.services.search import SearchService
+from pymoex.utils.table import merge_tables, parse_table
+
+BOND_BLOCKS = ("securities", "marketdata", "marketdata_yields")
+
+
+def cases():
+    """Пары (имя, функция, число элементов за вызов)."""
+    tqbr = payloads.tqbr_board()
+    bonds = payloads.bond_universe()
+    search = payloads.search_page()
+
+    tqbr_raw = json.dumps(tqbr, ensure_ascii=False).encode()
+    bonds_raw = json.dumps(bonds, ensure_ascii=False).encode()
+
+    share_rows = len(tqbr["securities"]["data"])
+    bond_rows = len(bonds["securities"]["data"])
+
+    securities = parse_table(tqbr["securities"])
+    marketdata = parse_table(tqbr["marketdata"])
+    share_records = [{**s, **m} for s, m in zip(securities, marketdata)]
+    bond_columns, bond_table = merge_tables([bonds[b] for b in BOND_BLOCKS])
+    bond_records = [dict(zip(bond_columns, row)) for row in bond_table]
+
+    search_rows = parse_table(search["securities"])
+    search_keys = [row_keys(r) for r in search_rows]
+    service = SearchService(session=None, cache=None)
+
+    cache_keys = [f"share:S{i:03d}" for i in range(1000)]
+    # Заполняется прогревочным прогоном measure()
+    warm_cache = TTLCache(ttl=3600)
+
+    async def cache_hits():
+        for key in cache_keys:
+            await warm_cache.get_or_set(key, _factory)
+
+    async def cache_misses():
+        cache = TTLCache(ttl=60, maxsize=500)
+        for key in cache_keys:
+            await cache.get_or_set(key, _factory)
+
+    yield "json.loads tqbr", lambda: json.loads(tqbr_raw), share_rows
+    yield "json.loads bonds", lambda: json.loads(bonds_raw), bond_rows
+    yield "parse_table tqbr", lambda: parse_table(tqbr["securities"]), share_rows
+    yield "parse_table bonds", lambda: parse_table(bonds["securities"]), bond_rows
+    yield (
+        "merge_tables bonds",
+        lambda: merge_tables([bonds[b] for b in BOND_BLOCKS]),
+        bond_rows,
+    )
+    yield (
+        "Share.model_validate tqbr",
+        lambda: [Share.model_validate(r) for r in share_records],
+        share_rows,
+    )
+    yield (
+        "Bond.model_validate bonds",
+        # Валидатор Bond дописывает колонки в словарь — работаем с копиями
+        lambda: [Bond.model_validate(dict(r)) for r in bond_records],
+        bond_rows,
+    )
+    yield (
+        "row_keys search",
+        lambda: [row_keys(r) for r in search_rows],
+        len(search_rows),
+    )
+    yield (
+        "_rank_results search",
+        lambda: service._rank_results(search_rows, "банк", search_keys),
+        len(search_rows),
+    )
+    yield "TTLCache.get_or_set hit", cache_hits, len(cache_keys)
+    yield "TTLCache.get_or_set miss", cache_misses, len(cache_keys)
+
+
+def _factory():
+    return 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--only", help="только бенчмарки, имя которых содержит строку")
+    parser.add_argument(
+        "--save", action="store_true", help="дописать результаты в историю"
+    )
+    args = parser.parse_args()
+
+    results = []
+    for name, fn, items in cases():
+        if args.only and args.only not in name:
+            continue
+        results.append(measure(name, fn, items=items, repeat=args.repeat))
+
+    report(results, last_run())
+
+    if args.save:
+        save(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Время импорта пакета без клиента и с клиентом (в отдельных процессах).
+
+Запуск:
+    python -m benchmarks.bench_import [--runs 5]
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+def import_time(module: str, runs: int) -> float:
+    """Лучшее время import module в новом интерпретаторе (секунды)."""
+    code = (
+        "import time; t = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - t)"
+    )
+    return min(
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(runs)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    package = import_time("pymoex", args.runs)
+    client = import_time("pymoex.client", args.runs)
+
+    print(f"import pymoex:        {package * 1000:8.1f} ms")
+    print(f"import pymoex.client: {client * 1000:8.1f} ms")
+    print(f"ratio:                {client / package:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
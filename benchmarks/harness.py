@@ -0,0 +1,143 @@
+"""
+Замер времени и памяти для бенчмарков и история результатов.
+
+Время — лучший и медианный прогон (time.perf_counter) после прогрева,
+память — отдельный прогон под tracemalloc (пик и удержанный объем),
+чтобы трассировка не искажала время.
+"""
+
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable
+
+HISTORY = Path(__file__).parent / "results" / "history.jsonl"
+
+
+@dataclass
+class Result:
+    name: str
+    items: int  # элементов за один прогон (строк, запросов)
+    best_ms: float
+    median_ms: float
+    items_per_sec: float
+    peak_kib: float
+    retained_kib: float
+
+
+def measure(
+    name: str, fn: Callable[[], Any], items: int = 1, repeat: int = 7, warmup: int = 1
+) -> Result:
+    """
+    Замерить функцию (или корутинную функцию).
+
+    :param name: имя бенчмарка
+    :param fn: функция без аргументов; корутины выполняются в event loop
+    :param items: сколько элементов обрабатывает один вызов (для throughput)
+    :param repeat: число замеряемых прогонов
+    :param warmup: число прогонов прогрева
+    """
+    run = _runner(fn)
+
+    for _ in range(warmup):
+        run()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    value = run()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+
+    best = min(times)
+    return Result(
+        name=name,
+        items=items,
+        best_ms=best * 1000,
+        median_ms=statistics.median(times) * 1000,
+        items_per_sec=items / best if best else float("inf"),
+        peak_kib=(peak - base) / 1024,
+        retained_kib=(current - base) / 1024,
+    )
+
+
+def report(results: list[Result], previous: dict[str, dict] | None = None) -> None:
+    """Напечатать таблицу результатов (и изменение к предыдущему запуску)."""
+    previous = previous or {}
+
+    header = f"{'benchmark':<34}{'best ms':>10}{'items/s':>14}{'peak KiB':>11}"
+    print(header + f"{'retained':>11}{'vs last':>10}")
+    for r in results:
+        delta = ""
+        if r.name in previous and previous[r.name]["best_ms"]:
+            change = r.best_ms / previous[r.name]["best_ms"] - 1
+            delta = f"{change:+.0%}"
+        print(
+            f"{r.name:<34}{r.best_ms:>10.2f}{r.items_per_sec:>14,.0f}"
+            f"{r.peak_kib:>11,.0f}{r.retained_kib:>11,.0f}{delta:>10}"
+        )
+
+
+def last_run(path: Path = HISTORY) -> dict[str, dict]:
+    """Результаты последнего сохраненного запуска (имя -> результат)."""
+    if not path.exists():
+        return {}
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    if not lines:
+        return {}
+
+    run = json.loads(lines[-1])
+    return {r["name"]: r for r in run["results"]}
+
+
+def save(results: list[Result], path: Path = HISTORY) -> None:
+    """
+    Дописать запуск в историю (JSON Lines): время, коммит, версия Python.
+    """
+    run = {
+        "at": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": [asdict(r) for r in results],
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(json.dumps(run, ensure_ascii=False) + "\n")
+
+
+def _runner(fn: Callable[[], Any]) -> Callable[[], Any]:
+    if not asyncio.iscoroutinefunction(fn):
+        return fn
+
+    loop = asyncio.new_event_loop()
+    return lambda: loop.run_until_complete(fn())
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip()
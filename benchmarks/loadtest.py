@@ -0,0 +1,327 @@
+"""
+Нагрузочный тест MoexClient: тысячи корутин вызывают share(), bond() и find()
+с неравномерным (Zipf) распределением ключей через локальный заменитель ISS.
+
+Отчет: запросов в секунду, обращений к бирже (upstream), доля попаданий
+в кэши и задержки p50/p99/p999. Несколько --config сравниваются в одной
+таблице, каждый запуск начинается с пустого клиента.
+
+По умолчанию заменитель работает внутри процесса (pymoex.testing.StandIn),
+ответы ISS генерируются и записываются при первом обращении. С --url клиент
+ходит в отдельный сервер (python -m pymoex.testing.standin), тогда pool
+ограничивает пул соединений httpx.
+
+Запуск:
+    python -m benchmarks.loadtest [--requests 100000] [--concurrency 10000]
+        [--latency 0.02] [--config price_ttl=60] [--config cache_size=100]
+        [--config policy=lru] [--config cache_bytes=5000000]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import statistics
+import time
+from dataclasses import dataclass, field
+from itertools import accumulate
+
+import httpx
+
+from benchmarks import payloads
+from pymoex.client import MoexClient
+from pymoex.core.config import MoexSettings
+from pymoex.exceptions import MoexError
+from pymoex.testing import Cassette, StandIn
+
+# Доли операций share : bond : find
+DEFAULT_MIX = "6:3:1"
+
+_INSTRUMENT = re.compile(
+    r"/markets/(shares|bonds)/(?:boards/(\w+)/)?securities/(\w+)"
+)
+
+
+@dataclass
+class Config:
+    """Параметры клиента для одного прогона."""
+
+    name: str
+    price_ttl: int = 60
+    search_ttl: int = 300
+    cache_size: int | None = None  # maxsize кэшей акций, облигаций и поиска
+    cache_bytes: int | None = None  # max_bytes кэшей акций, облигаций и поиска
+    policy: str = "tinylfu"  # политика вытеснения кэшей
+    pool: int = 100  # соединений httpx (только с --url)
+
+    @classmethod
+    def parse(cls, text: str) -> "Config":
+        """Конфигурация из строки вида 'price_ttl=5,cache_size=100,policy=lru'."""
+        values = {}
+        for part in filter(None, text.split(",")):
+            name, _, value = part.partition("=")
+            value = value.strip()
+            values[name.strip()] = int(value) if value.isdigit() else value
+        return cls(name=text or "default", **values)
+
+    def settings(self, **overrides) -> MoexSettings:
+        limits = {"cache_policy": self.policy}
+        if self.cache_size is not None:
+            limits.update(price_cache_size=self.cache_size)
+            limits.update(search_cache_size=self.cache_size)
+        if self.cache_bytes is not None:
+            limits.update(price_cache_bytes=self.cache_bytes)
+            limits.update(search_cache_bytes=self.cache_bytes)
+        return MoexSettings(**limits, **overrides)
+
+
+@dataclass
+class Report:
+    config: Config
+    requests: int
+    errors: int
+    seconds: float
+    upstream: int | None
+    hit_ratios: dict[str, float]
+    latencies: list[float] = field(repr=False)
+
+    @property
+    def rps(self) -> float:
+        return self.requests / self.seconds
+
+    def percentile(self, q: float) -> float:
+        """Задержка в миллисекундах (q от 0 до 1)."""
+        ordered = self.latencies
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+def synthetic_iss(request: httpx.Request) -> httpx.Response:
+    """
+    Ответы ISS для любых акций, облигаций и поисковых запросов.
+    """
+    path = request.url.path
+
+    if path.endswith("/securities.json") and "/markets/" not in path:
+        return httpx.Response(200, json=_search_page(request.url.params))
+
+    match = _INSTRUMENT.search(path)
+    if match is None:
+        return httpx.Response(404)
+
+    market, board, ticker = match.groups()
+    if market == "shares":
+        board = board or "TQBR"
+        blocks = ("securities", "marketdata")
+        columns = (payloads.SHARE_SECURITIES, payloads.SHARE_MARKETDATA)
+    else:
+        board = board or "TQCB"
+        blocks = ("securities", "marketdata", "marketdata_yields")
+        columns = (
+            payloads.BOND_SECURITIES,
+            payloads.BOND_MARKETDATA,
+            payloads.BOND_YIELDS,
+        )
+
+    rng = random.Random(ticker)
+    data = {}
+    for block, cols in zip(blocks, columns):
+        row = [payloads.column_value(rng, c, 0, ticker, board) for c in cols]
+        data[block] = {"columns": cols, "data": [row]}
+    data["securities"]["data"][0][columns[0].index("SHORTNAME")] = ticker
+
+    return httpx.Response(200, json=data)
+
+
+def _search_page(params) -> dict:
+    # 30 совпадений на запрос: первая страница поиска (50 строк) полная
+    query = params.get("q", "")
+    start = int(params.get("start", 0))
+    limit = int(params.get("limit", 100))
+
+    columns = params.get("securities.columns", "").split(",")
+
+    rows = []
+    for i in range(start, min(30, start + limit)):
+        row = {
+            "secid": f"{query.upper()}{i}",
+            "shortname": f"{query} {i}",
+            "name": f"ПАО {query} {i}",
+            "isin": f"RU000C{i:06d}",
+            "is_traded": 1,
+            "emitent_title": f"{query} {i}",
+            "type": "common_share",
+            "group": "stock_shares",
+            "primary_boardid": "TQBR",
+            "marketprice_boardid": "TQBR",
+        }
+        rows.append([row.get(c) for c in columns])
+
+    return {"securities": {"columns": columns, "data": rows}}
+
+
+def make_plan(args) -> list[tuple[str, str]]:
+    """Последовательность операций (вид, ключ) с Zipf-распределением ключей."""
+    rng = random.Random(args.seed)
+
+    universes = {
+        "share": [f"S{i:04d}" for i in range(args.shares)],
+        "bond": [f"RU000A{i:06d}" for i in range(args.bonds)],
+        "find": [f"{w.lower()}{i}" for i in range(10) for w in payloads.WORDS],
+    }
+    weights = {
+        kind: list(accumulate(1 / rank**args.skew for rank in range(1, len(u) + 1)))
+        for kind, u in universes.items()
+    }
+
+    mix = [int(x) for x in args.mix.split(":")]
+    kinds = rng.choices(("share", "bond", "find"), weights=mix, k=args.requests)
+
+    return [
+        (kind, rng.choices(universes[kind], cum_weights=weights[kind])[0])
+        for kind in kinds
+    ]
+
+
+async def run(config: Config, plan: list[tuple[str, str]], args) -> Report:
+    standin = None
+    if args.url:
+        settings = config.settings(base_url=args.url)
+        limits = httpx.Limits(
+            max_connections=config.pool, max_keepalive_connections=config.pool
+        )
+        transport = httpx.AsyncHTTPTransport(limits=limits)
+    else:
+        standin = StandIn(
+            _CASSETTE,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            seed=args.seed,
+            upstream=httpx.MockTransport(synthetic_iss),
+        )
+        transport = standin.transport()
+        settings = config.settings()
+
+    client = MoexClient(
+        price_ttl=config.price_ttl,
+        search_ttl=config.search_ttl,
+        transport=transport,
+        settings=settings,
+    )
+
+    calls = {"share": client.share, "bond": client.bond, "find": client.find}
+    operations = iter(plan)
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for kind, key in operations:
+            start = time.perf_counter()
+            try:
+                await calls[kind](key)
+            except MoexError:
+                errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    started = time.perf_counter()
+    async with client:
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+        seconds = time.perf_counter() - started
+        stats = client.cache_stats()
+
+    latencies.sort()
+    return Report(
+        config=config,
+        requests=len(latencies),
+        errors=errors,
+        seconds=seconds,
+        upstream=standin.stats.requests if standin else None,
+        hit_ratios={n: stats[n].hit_ratio for n in ("shares", "bonds", "search")},
+        latencies=latencies,
+    )
+
+
+# Ответы заменителя общие для всех прогонов (заполняются прогревом)
+_CASSETTE = Cassette()
+
+
+def print_reports(reports: list[Report]) -> None:
+    print(
+        f"{'config':<30}{'req/s':>10}{'upstream':>10}{'errors':>8}"
+        f"{'hit shr':>9}{'hit bnd':>9}{'hit srch':>9}"
+        f"{'p50 ms':>9}{'p99 ms':>9}{'p999 ms':>9}"
+    )
+    for r in reports:
+        upstream = "-" if r.upstream is None else str(r.upstream)
+        print(
+            f"{r.config.name:<30}{r.rps:>10,.0f}{upstream:>10}{r.errors:>8}"
+            f"{r.hit_ratios['shares']:>9.1%}{r.hit_ratios['bonds']:>9.1%}"
+            f"{r.hit_ratios['search']:>9.1%}"
+            f"{r.percentile(0.5):>9.2f}{r.percentile(0.99):>9.2f}"
+            f"{r.percentile(0.999):>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--concurrency", type=int, default=10_000)
+    parser.add_argument("--shares", type=int, default=2000, help="размер вселенной")
+    parser.add_argument("--bonds", type=int, default=5000, help="размер вселенной")
+    parser.add_argument("--skew", type=float, default=1.1, help="показатель Zipf")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="доли share:bond:find")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.005)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--url", help="базовый URL отдельного заменителя ISS")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--config",
+        action="append",
+        help=(
+            "параметры клиента: price_ttl, search_ttl, cache_size, cache_bytes, "
+            "policy, pool"
+        ),
+    )
+    parser.add_argument("--json", action="store_true", help="вывести отчет в JSON")
+    args = parser.parse_args()
+
+    plan = make_plan(args)
+    configs = [Config.parse(c) for c in args.config or [""]]
+
+    # Прогрев: ответы ISS генерируются один раз, вне замера
+    if not args.url:
+        asyncio.run(run(configs[0], plan, args))
+
+    reports = [asyncio.run(run(config, plan, args)) for config in configs]
+
+    if args.json:
+        print(
+            json.dumps(
+                [
+                    {
+                        "config": r.config.name,
+                        "rps": r.rps,
+                        "upstream": r.upstream,
+                        "errors": r.errors,
+                        "hit_ratios": r.hit_ratios,
+                        "p50_ms": r.percentile(0.5),
+                        "p99_ms": r.percentile(0.99),
+                        "p999_ms": r.percentile(0.999),
+                        "mean_ms": statistics.fmean(r.latencies) * 1000,
+                    }
+                    for r in reports
+                ],
+                indent=2,
+            )
+        )
+    else:
+        print_reports(reports)
+
+
+if __name__ == "__main__":
+    main()
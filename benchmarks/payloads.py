@@ -0,0 +1,211 @@
+"""
+Ответы ISS для бенчмарков.
+
+Если в benchmarks/fixtures лежат записанные ответы (python -m benchmarks.record),
+используются они. Иначе ответ генерируется детерминированно: те же блоки
+и колонки, что у ISS, сопоставимое число строк и доля пустых значений.
+"""
+
+import gzip
+import json
+import random
+from datetime import date, timedelta
+from pathlib import Path
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# Колонки ответов ISS в том порядке, в котором их отдает биржа
+SHARE_SECURITIES = (
+    "SECID BOARDID SHORTNAME PREVPRICE LOTSIZE FACEVALUE STATUS BOARDNAME DECIMALS "
+    "SECNAME REMARKS MARKETCODE INSTRID SECTORID MINSTEP PREVWAPRICE FACEUNIT "
+    "PREVDATE ISSUESIZE ISIN LATNAME REGNUMBER PREVLEGALCLOSEPRICE CURRENCYID "
+    "SECTYPE LISTLEVEL SETTLEDATE"
+).split()
+
+SHARE_MARKETDATA = (
+    "SECID BOARDID BID BIDDEPTH OFFER OFFERDEPTH SPREAD BIDDEPTHT OFFERDEPTHT OPEN "
+    "LOW HIGH LAST LASTCHANGE LASTCHANGEPRCNT QTY VALUE VALUE_USD WAPRICE "
+    "LASTCNGTOLASTWAPRICE WAPTOPREVWAPRICEPRCNT WAPTOPREVWAPRICE CLOSEPRICE "
+    "MARKETPRICETODAY MARKETPRICE LASTTOPREVPRICE NUMTRADES VOLTODAY VALTODAY "
+    "VALTODAY_USD ETFSETTLEPRICE TRADINGSTATUS UPDATETIME LASTBID LASTOFFER "
+    "LCLOSEPRICE LCURRENTPRICE MARKETPRICE2 NUMBIDS NUMOFFERS CHANGE TIME HIGHBID "
+    "LOWOFFER PRICEMINUSPREVWAPRICE OPENPERIODPRICE SEQNUM SYSTIME "
+    "CLOSINGAUCTIONPRICE CLOSINGAUCTIONVOLUME ISSUECAPITALIZATION "
+    "ISSUECAPITALIZATION_UPDATETIME ETFSETTLECURRENCY VALTODAY_RUR TRADINGSESSION"
+).split()
+
+BOND_SECURITIES = (
+    "SECID BOARDID SHORTNAME PREVWAPRICE YIELDATPREVWAPRICE COUPONVALUE NEXTCOUPON "
+    "ACCRUEDINT PREVPRICE LOTSIZE FACEVALUE BOARDNAME STATUS MATDATE DECIMALS "
+    "COUPONPERIOD ISSUESIZE PREVLEGALCLOSEPRICE PREVDATE SECNAME REMARKS MARKETCODE "
+    "INSTRID SECTORID MINSTEP FACEUNIT BUYBACKPRICE BUYBACKDATE ISIN LATNAME "
+    "REGNUMBER CURRENCYID ISSUESIZEPLACED LISTLEVEL SECTYPE COUPONPERCENT OFFERDATE "
+    "SETTLEDATE LOTVALUE FACEVALUEONSETTLEDATE CALLOPTIONDATE PUTOPTIONDATE "
+    "DATEYIELDFROMISSUER BONDTYPE BONDSUBTYPE"
+).split()
+
+BOND_MARKETDATA = (
+    "SECID BID BIDDEPTH OFFER OFFERDEPTH SPREAD BIDDEPTHT OFFERDEPTHT OPEN LOW HIGH "
+    "LAST LASTCHANGE LASTCHANGEPRCNT QTY VALUE YIELD VALUE_USD WAPRICE "
+    "LASTCNGTOLASTWAPRICE WAPTOPREVWAPRICEPRCNT WAPTOPREVWAPRICE YIELDATWAPRICE "
+    "YIELDTOPREVYIELD CLOSEYIELD CLOSEPRICE MARKETPRICETODAY MARKETPRICE "
+    "LASTTOPREVPRICE NUMTRADES VOLTODAY VALTODAY VALTODAY_USD BOARDID TRADINGSTATUS "
+    "UPDATETIME DURATION NUMBIDS NUMOFFERS CHANGE TIME HIGHBID LOWOFFER "
+    "PRICEMINUSPREVWAPRICE LASTBID LASTOFFER LCURRENTPRICE LCLOSEPRICE MARKETPRICE2 "
+    "ADMITTEDQUOTE OPENPERIODPRICE SEQNUM SYSTIME VALTODAY_RUR YIELDTOOFFER "
+    "YIELDLASTCOUPON TRADINGSESSION"
+).split()
+
+BOND_YIELDS = (
+    "SECID BOARDID PRICE YIELDDATE ZCYCMOMENT YIELDDATETYPE EFFECTIVEYIELD DURATION "
+    "ZSPREADBP GSPREADBP WAPRICE EFFECTIVEYIELDWAPRICE DURATIONWAPRICE IR ICPI BEI "
+    "CBR YIELDTOOFFER YIELDLASTCOUPON TRADEMOMENT SEQNUM SYSTIME"
+).split()
+
+SEARCH_COLUMNS = (
+    "id secid shortname regnumber name isin is_traded emitent_id emitent_title "
+    "emitent_inn emitent_okpo gosreg type group primary_boardid marketprice_boardid"
+).split()
+
+WORDS = (
+    "Сбербанк Газпром Лукойл Роснефть Норникель Татнефть Новатэк Сургутнефтегаз "
+    "Полюс Магнит Северсталь Мосбиржа Яндекс Аэрофлот Банк ВТБ Альфа Совкомбанк "
+    "Русгидро Интер РАО МТС Ростелеком Лизинг Финанс Капитал Девелопмент Энерго"
+).split()
+
+_BOND_BOARDS = ("TQOB", "TQCB", "TQIR", "TQOD", "PACT")
+
+
+def load(name: str, factory) -> dict:
+    """
+    Записанный ответ fixtures/{name}.json.gz или сгенерированный factory().
+    """
+    path = FIXTURES / f"{name}.json.gz"
+    if path.exists():
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return json.load(f)
+    return factory()
+
+
+def tqbr_board() -> dict:
+    """Снимок режима TQBR: /engines/stock/markets/shares/boards/TQBR/securities.json"""
+    return load("tqbr_board", lambda: _shares_board(260))
+
+
+def bond_universe() -> dict:
+    """Все облигации: /engines/stock/markets/bonds/securities.json"""
+    return load("bond_universe", lambda: _bond_universe(3200))
+
+
+def search_page() -> dict:
+    """Ответ поиска на 1000 строк: /securities.json?q=банк&limit=1000"""
+    return load("search_1000", lambda: _search(1000))
+
+
+def column_value(rng: random.Random, column: str, i: int, secid: str, board: str):
+    """Случайное значение колонки ISS (тип по имени колонки, как у биржи)."""
+    if column == "SECID":
+        return secid
+    if column == "BOARDID":
+        return board
+    if column in ("SHORTNAME", "SECNAME", "LATNAME", "BOARDNAME", "REMARKS"):
+        return f"{rng.choice(WORDS)} {i}"
+    if column == "ISIN":
+        return f"RU000A{i:06d}"
+    if column == "REGNUMBER":
+        return f"4B02-{i:05d}-00000-B" if rng.random() < 0.8 else None
+    if column in ("FACEUNIT", "CURRENCYID", "ETFSETTLECURRENCY"):
+        return rng.choice(("SUR", "SUR", "SUR", "USD", "CNY"))
+    if "DATE" in column or column == "NEXTCOUPON":
+        if rng.random() < 0.15:
+            return rng.choice((None, "0000-00-00"))
+        return (date(2025, 1, 1) + timedelta(days=rng.randint(-30, 9000))).isoformat()
+    if column in ("UPDATETIME", "TIME"):
+        return f"{rng.randint(10, 18):02d}:{rng.randint(0, 59):02d}:00"
+    if column in ("SYSTIME", "TRADEMOMENT", "ZCYCMOMENT"):
+        return "2025-01-10 18:50:00"
+    if column in ("STATUS", "TRADINGSTATUS", "TRADINGSESSION", "ADMITTEDQUOTE"):
+        return rng.choice(("A", "T", "N", None))
+    if column in ("LOTSIZE", "DECIMALS", "LISTLEVEL", "COUPONPERIOD", "DURATION"):
+        return rng.randint(1, 3000)
+    if column in ("SECTYPE", "BONDTYPE", "BONDSUBTYPE", "SECTORID", "MARKETCODE"):
+        return rng.choice(("1", "2", "3", "6", "8", "ОФЗ", "Корпоративная"))
+    if column == "INSTRID":
+        return rng.choice(("EQIN", "EQOB", "EQDB"))
+    if column == "YIELDDATETYPE":
+        return rng.choice(("MATDATE", "OFFERDATE"))
+    # Числовые колонки: часть пустая, как у неликвидных бумаг
+    if rng.random() < 0.25:
+        return None
+    if column in ("VOLTODAY", "ISSUESIZE", "ISSUESIZEPLACED", "NUMTRADES", "QTY"):
+        return rng.randint(0, 10**7)
+    return round(rng.uniform(0.01, 1500.0), 4)
+
+
+def _table(rng, columns, keys) -> dict:
+    return {
+        "columns": list(columns),
+        "data": [
+            [column_value(rng, c, i, secid, board) for c in columns]
+            for i, (secid, board) in enumerate(keys)
+        ],
+    }
+
+
+def _shares_board(n: int, seed: int = 1) -> dict:
+    rng = random.Random(seed)
+    keys = [(f"S{i:03d}", "TQBR") for i in range(n)]
+    return {
+        "securities": _table(rng, SHARE_SECURITIES, keys),
+        "marketdata": _table(rng, SHARE_MARKETDATA, keys),
+    }
+
+
+def _bond_universe(n: int, seed: int = 2) -> dict:
+    rng = random.Random(seed)
+
+    keys = []
+    for i in range(n):
+        secid = f"RU000A{i:06d}"
+        # Часть бумаг торгуется в нескольких режимах
+        boards = [rng.choice(_BOND_BOARDS[:4])]
+        if rng.random() < 0.1:
+            boards.append("PACT")
+        keys.extend((secid, b) for b in boards)
+
+    return {
+        "securities": _table(rng, BOND_SECURITIES, keys),
+        "marketdata": _table(rng, BOND_MARKETDATA, keys),
+        "marketdata_yields": _table(rng, BOND_YIELDS, keys),
+    }
+
+
+def _search(n: int, seed: int = 3) -> dict:
+    rng = random.Random(seed)
+    groups = ("stock_shares", "stock_bonds", "stock_bonds", "stock_etf", "stock_dr")
+
+    data = []
+    for i in range(n):
+        title = f"ПАО {rng.choice(WORDS)} {rng.choice(WORDS)}"
+        data.append(
+            [
+                i,
+                f"X{i:04d}" if i % 7 else f"BANK{i}",
+                f"{rng.choice(WORDS)} {i}",
+                f"1-01-{i:05d}-A",
+                f"{title} банк {i}" if i % 3 == 0 else title,
+                f"RU000B{i:06d}",
+                rng.randint(0, 1),
+                rng.randint(1, 5000),
+                title,
+                f"{rng.randint(10**9, 10**10 - 1)}",
+                f"{rng.randint(10**7, 10**8 - 1)}",
+                None,
+                "common_share",
+                rng.choice(groups),
+                rng.choice(("TQBR", "TQCB", "TQOB")),
+                rng.choice(("TQBR", "TQCB", "TQOB")),
+            ]
+        )
+
+    return {"securities": {"columns": list(SEARCH_COLUMNS), "data": data}}
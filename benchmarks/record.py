@@ -0,0 +1,68 @@
+"""
+Запись реальных ответов ISS для бенчмарков (нужна сеть).
+
+Ответы сохраняются в benchmarks/fixtures/*.json.gz; если файлы есть,
+benchmarks/payloads.py использует их вместо сгенерированных.
+
+Запуск:
+    python -m benchmarks.record [--query банк]
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+
+from benchmarks.payloads import FIXTURES
+from pymoex.core import endpoints
+from pymoex.core.session import MoexSession
+from pymoex.services.search import ISS_PAGE
+
+SEARCH_ROWS = 1000
+
+
+async def record(query: str) -> None:
+    session = MoexSession()
+    try:
+        _write("tqbr_board", await session.get(endpoints.shares("TQBR")))
+        _write("bond_universe", await session.get(endpoints.bonds()))
+
+        # Поиск отдается страницами по ISS_PAGE строк — склеиваем в один блок
+        search = None
+        for start in range(0, SEARCH_ROWS, ISS_PAGE):
+            page = await session.get(
+                endpoints.search(),
+                {"q": query, "limit": ISS_PAGE, "start": start, "iss.meta": "off"},
+            )
+            block = page["securities"]
+            if search is None:
+                search = page
+            else:
+                search["securities"]["data"].extend(block["data"])
+            if len(block["data"]) < ISS_PAGE:
+                break
+        _write("search_1000", search)
+    finally:
+        await session.close()
+
+
+def _write(name: str, data: dict) -> None:
+    FIXTURES.mkdir(parents=True, exist_ok=True)
+    path = FIXTURES / f"{name}.json.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+    rows = len(data.get("securities", {}).get("data", []))
+    print(f"{path}: {rows} rows")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--query", default="банк")
+    args = parser.parse_args()
+
+    asyncio.run(record(args.query))
+
+
+if __name__ == "__main__":
+    main()
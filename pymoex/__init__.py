@@ -1,28 +1,49 @@
 import logging
-
-from pymoex.client import MoexClient
-from pymoex.core.config import MoexSettings
-from pymoex.models.enums import InstrumentType
-
-from .api import (
-    find_bonds,
-    find_shares,
-    get_bond,
-    get_share,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
-try:
-    settings = MoexSettings()
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
-    logger.setLevel(log_level)
-except Exception:
-    logger.setLevel(logging.INFO)
+# Экспорты пакета загружаются при первом обращении (PEP 562): import pymoex
+# не тянет httpx, pydantic-модели и сервисы. Уровень логирования задается
+# при первом чтении настроек (pymoex.core.config.get_settings).
+_EXPORTS = {
+    "MoexClient": "pymoex.client",
+    "MoexSettings": "pymoex.core.config",
+    "get_settings": "pymoex.core.config",
+    "InstrumentType": "pymoex.models.enums",
+    "get_share": "pymoex.api",
+    "get_bond": "pymoex.api",
+    "find_shares": "pymoex.api",
+    "find_bonds": "pymoex.api",
+}
+
+if TYPE_CHECKING:
+    from pymoex.api import find_bonds, find_shares, get_bond, get_share
+    from pymoex.client import MoexClient
+    from pymoex.core.config import MoexSettings, get_settings
+    from pymoex.models.enums import InstrumentType
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_EXPORTS])
+
 
 __all__ = [
     "MoexClient",
+    "MoexSettings",
+    "get_settings",
     "InstrumentType",
     "get_share",
     "get_bond",
@@ -0,0 +1,6 @@
+"""
+Аналитика поверх данных MOEX.
+
+Модули, которым нужен NumPy, устанавливаются extra-зависимостью:
+    uv add "pymoex[analytics]"
+"""
@@ -0,0 +1,249 @@
+"""
+Скринер облигаций по снимку рынка.
+
+Индексы строятся один раз при создании скринера:
+- числовые поля — отсортированные массивы значений и префиксные битовые
+  маски, поэтому диапазон превращается в маску за O(n/64) операций;
+- категориальные поля — битовая маска на каждое значение.
+
+Фильтры — это маски (Mask), они комбинируются через &, | и ~,
+а отбор и сортировка топ-N не перебирают модели.
+"""
+
+import bisect
+import heapq
+from typing import Any, Iterable, Iterator
+
+from pymoex.models.bond import Bond
+
+# Поля с диапазонными запросами
+NUMERIC_FIELDS = (
+    "effective_yield",
+    "mat_date",
+    "offer_date",
+    "duration",
+    "value_today",
+    "coupon_percent",
+    "last_price",
+)
+
+# Поля с запросами на равенство
+CATEGORICAL_FIELDS = (
+    "list_level",
+    "bond_type",
+    "bond_sub_type",
+    "sector_id",
+    "currency_id",
+    "face_unit",
+    "board_id",
+)
+
+
+class Mask:
+    """
+    Множество облигаций скринера (битовая маска по номерам строк).
+    """
+
+    __slots__ = ("bits", "size")
+
+    def __init__(self, bits: int, size: int):
+        self.bits = bits
+        self.size = size
+
+    def __and__(self, other: "Mask") -> "Mask":
+        return Mask(self.bits & other.bits, self.size)
+
+    def __or__(self, other: "Mask") -> "Mask":
+        return Mask(self.bits | other.bits, self.size)
+
+    def __invert__(self) -> "Mask":
+        return Mask(~self.bits & ((1 << self.size) - 1), self.size)
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __contains__(self, idx: int) -> bool:
+        return bool(self.bits >> idx & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def __repr__(self) -> str:
+        return f"<Mask {len(self)}/{self.size}>"
+
+
+class _NumericIndex:
+    """
+    Отсортированный индекс числового поля с префиксными масками.
+
+    prefix[i] — маска первых i строк в порядке возрастания значения,
+    поэтому маска диапазона [a, b) равна prefix[b] ^ prefix[a].
+    """
+
+    __slots__ = ("values", "ids", "prefix", "by_id")
+
+    def __init__(self, pairs: list[tuple[Any, int]]):
+        self.by_id = {i: v for v, i in pairs}
+
+        pairs.sort()
+        self.values = [v for v, _ in pairs]
+        self.ids = [i for _, i in pairs]
+
+        self.prefix = [0]
+        acc = 0
+        for i in self.ids:
+            acc |= 1 << i
+            self.prefix.append(acc)
+
+    def range_bits(self, low: Any = None, high: Any = None) -> int:
+        start = bisect.bisect_left(self.values, low) if low is not None else 0
+        end = (
+            bisect.bisect_right(self.values, high)
+            if high is not None
+            else len(self.values)
+        )
+        if start >= end:
+            return 0
+        return self.prefix[end] ^ self.prefix[start]
+
+
+class BondScreener:
+    """
+    Индексированный скринер облигаций.
+
+    Пример:
+        screener = BondScreener(await client.bonds.snapshot())
+        mask = screener.screen(
+            effective_yield=(15, 25),  # границы включительно
+            mat_date=(date(2026, 1, 1), date(2028, 12, 31)),
+            list_level={1, 2},
+            currency_id="SUR",
+        )
+        best = screener.top(mask, 10, by="effective_yield")
+    """
+
+    def __init__(self, bonds: Iterable[Bond]):
+        """
+        :param bonds: облигации (список или Snapshot)
+        """
+        self.bonds: list[Bond] = list(bonds)
+        size = len(self.bonds)
+
+        numeric: dict[str, list[tuple[Any, int]]] = {f: [] for f in NUMERIC_FIELDS}
+        self._categories: dict[str, dict[Any, int]] = {
+            f: {} for f in CATEGORICAL_FIELDS
+        }
+
+        for idx, bond in enumerate(self.bonds):
+            bit = 1 << idx
+
+            for field in NUMERIC_FIELDS:
+                value = getattr(bond, field)
+                if value is not None:
+                    numeric[field].append((value, idx))
+
+            for field in CATEGORICAL_FIELDS:
+                value = getattr(bond, field)
+                cats = self._categories[field]
+                cats[value] = cats.get(value, 0) | bit
+
+        self._numeric = {f: _NumericIndex(p) for f, p in numeric.items()}
+        self._all = Mask((1 << size) - 1, size)
+
+    def __len__(self) -> int:
+        return len(self.bonds)
+
+    # --- Фильтры ---
+
+    def all(self) -> Mask:
+        """Все облигации."""
+        return self._all
+
+    def between(self, field: str, low: Any = None, high: Any = None) -> Mask:
+        """
+        Значение числового поля в диапазоне [low, high] (границы включительно).
+
+        Облигации без значения поля не попадают в результат.
+        """
+        index = self._numeric_index(field)
+        return Mask(index.range_bits(low, high), len(self.bonds))
+
+    def equals(self, field: str, *values: Any) -> Mask:
+        """
+        Значение категориального поля равно одному из values.
+        """
+        cats = self._categories.get(field)
+        if cats is None:
+            raise ValueError(f"Field {field!r} is not a categorical index")
+
+        bits = 0
+        for value in values:
+            bits |= cats.get(value, 0)
+        return Mask(bits, len(self.bonds))
+
+    def screen(self, **conditions: Any) -> Mask:
+        """
+        Комбинация условий (логическое И).
+
+        - числовое поле: кортеж (low, high), None — без границы;
+        - категориальное поле: значение или множество значений.
+        """
+        mask = self._all
+
+        for field, condition in conditions.items():
+            if field in self._numeric:
+                low, high = condition
+                mask = mask & self.between(field, low, high)
+            elif isinstance(condition, (set, frozenset, list, tuple)):
+                mask = mask & self.equals(field, *condition)
+            else:
+                mask = mask & self.equals(field, condition)
+
+        return mask
+
+    # --- Результаты ---
+
+    def select(self, mask: Mask) -> list[Bond]:
+        """Облигации из маски (в исходном порядке)."""
+        return [self.bonds[i] for i in mask]
+
+    def top(
+        self, mask: Mask, n: int, by: str, descending: bool = True
+    ) -> list[Bond]:
+        """
+        Первые n облигаций маски, упорядоченные по числовому полю.
+
+        :param mask: отобранные облигации
+        :param n: сколько вернуть
+        :param by: числовое поле сортировки
+        :param descending: по убыванию (по умолчанию)
+        """
+        index = self._numeric_index(by)
+        count = len(mask)
+
+        # Разреженная маска: сортируем только отобранные строки
+        if count * 8 < len(index.ids):
+            ids = [i for i in mask if i in index.by_id]
+            pick = heapq.nlargest if descending else heapq.nsmallest
+            ids = pick(n, ids, key=index.by_id.__getitem__)
+            return [self.bonds[i] for i in ids]
+
+        # Плотная маска: идем по отсортированному индексу до n совпадений
+        order = reversed(index.ids) if descending else iter(index.ids)
+        result = []
+        for i in order:
+            if i in mask:
+                result.append(self.bonds[i])
+                if len(result) == n:
+                    break
+        return result
+
+    def _numeric_index(self, field: str) -> _NumericIndex:
+        index = self._numeric.get(field)
+        if index is None:
+            raise ValueError(f"Field {field!r} is not a numeric index")
+        return index
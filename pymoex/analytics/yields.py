@@ -0,0 +1,311 @@
+"""
+Векторный расчет доходности и риск-метрик облигаций.
+
+Все облигации обрабатываются одновременно: денежные потоки хранятся
+в матрицах (облигация x платеж), доходность к погашению решается
+векторным методом Ньютона с защитой бисекцией.
+
+Соглашения:
+- время в годах ACT/365 от даты расчетов;
+- эффективная годовая доходность (годовое начисление), как EFFECTIVEYIELD в ISS;
+- цены и потоки в валюте номинала за одну облигацию, цена — "грязная" (с НКД).
+"""
+
+from datetime import date
+from typing import NamedTuple, Sequence
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "pymoex.analytics.yields requires numpy: uv add 'pymoex[analytics]'"
+    ) from e
+
+# Границы поиска доходности (доли): от -99% до 1000% годовых
+YIELD_LOWER = -0.99
+YIELD_UPPER = 10.0
+
+
+class CashflowMatrix(NamedTuple):
+    """
+    Денежные потоки набора облигаций, выровненные по ширине.
+
+    times     — время до платежа в годах, shape (n_bonds, n_flows)
+    amounts   — сумма платежа (0 для пустых ячеек), shape (n_bonds, n_flows)
+    projected — в потоках облигации есть спрогнозированные купоны
+                (неизвестные купоны флоатеров), shape (n_bonds,)
+    """
+
+    times: np.ndarray
+    amounts: np.ndarray
+    projected: np.ndarray | None = None
+
+    def __len__(self) -> int:
+        return self.times.shape[0]
+
+
+class BondMetrics(NamedTuple):
+    """
+    Риск-метрики набора облигаций (массивы длины n_bonds).
+
+    ytm        — эффективная доходность к погашению (доли)
+    macaulay   — дюрация Маколея (годы)
+    modified   — модифицированная дюрация
+    convexity  — выпуклость
+    dv01       — изменение цены при сдвиге доходности на 1 б.п. (в валюте)
+    """
+
+    ytm: np.ndarray
+    macaulay: np.ndarray
+    modified: np.ndarray
+    convexity: np.ndarray
+    dv01: np.ndarray
+
+
+def cashflow_matrix(
+    settle: date,
+    dates: Sequence[np.ndarray],
+    amounts: Sequence[np.ndarray],
+    projected: Sequence[bool] | None = None,
+) -> CashflowMatrix:
+    """
+    Собрать матрицу потоков из расписаний отдельных облигаций.
+
+    Платежи в дату расчетов и раньше отбрасываются.
+
+    :param settle: дата расчетов
+    :param dates: даты платежей по каждой облигации (datetime64[D])
+    :param amounts: суммы платежей (купон + погашение номинала)
+    :param projected: признак спрогнозированных потоков по каждой облигации
+    """
+    settle_d = np.datetime64(settle, "D")
+
+    kept_t = []
+    kept_a = []
+    for d, a in zip(dates, amounts):
+        d = np.asarray(d, dtype="datetime64[D]")
+        a = np.asarray(a, dtype=np.float64)
+        future = d > settle_d
+
+        kept_t.append((d[future] - settle_d).astype(np.float64) / 365.0)
+        kept_a.append(a[future])
+
+    width = max((len(t) for t in kept_t), default=0)
+    times = np.zeros((len(kept_t), width))
+    flows = np.zeros((len(kept_t), width))
+
+    for i, (t, a) in enumerate(zip(kept_t, kept_a)):
+        times[i, : len(t)] = t
+        flows[i, : len(a)] = a
+
+    if projected is None:
+        flags = np.zeros(len(kept_t), dtype=bool)
+    else:
+        flags = np.asarray(projected, dtype=bool)
+
+    return CashflowMatrix(times, flows, flags)
+
+
+# date.toordinal() для 1970-01-01 (начало отсчета datetime64)
+_EPOCH_ORDINAL = 719163
+
+
+def cashflows_from_schedules(
+    settle: date, schedules: Sequence, project: bool = True
+) -> CashflowMatrix:
+    """
+    Матрица потоков по расписаниям BondSchedule (купоны + погашения номинала).
+
+    Массивы расписаний переводятся в NumPy без поэлементного копирования.
+
+    Будущие купоны флоатеров еще не объявлены (NaN). С project они
+    заменяются текущим купоном, а облигация отмечается в cf.projected;
+    без него доходность такой облигации — NaN. Облигация без единого
+    известного купона получает NaN в любом случае.
+
+    :param settle: дата расчетов
+    :param schedules: расписания облигаций (в нужном порядке)
+    :param project: прогнозировать неизвестные купоны текущим купоном
+    """
+    dates = []
+    amounts = []
+    projected = []
+    for schedule in schedules:
+        ordinals, values = schedule.cashflows(after=settle, project=project)
+        days = np.frombuffer(ordinals, dtype=np.int32) - _EPOCH_ORDINAL
+        dates.append(days.astype("datetime64[D]"))
+        amounts.append(np.frombuffer(values, dtype=np.float64))
+        projected.append(project and schedule.unknown_coupons(after=settle) > 0)
+
+    return cashflow_matrix(settle, dates, amounts, projected)
+
+
+def dirty_prices(bonds: Sequence) -> np.ndarray:
+    """
+    Грязные цены из моделей Bond (NaN, если цены нет).
+    """
+    return np.array(
+        [
+            float(b.last_dirty_price) if b.last_dirty_price is not None else np.nan
+            for b in bonds
+        ]
+    )
+
+
+def present_value(yields: np.ndarray, cf: CashflowMatrix) -> np.ndarray:
+    """
+    Грязная цена при заданных доходностях.
+    """
+    discount = (1.0 + np.asarray(yields)[:, None]) ** -cf.times
+    return (cf.amounts * discount).sum(axis=1)
+
+
+def solve_yields(
+    prices: np.ndarray,
+    cf: CashflowMatrix,
+    guess: np.ndarray | float = 0.1,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """
+    Доходность к погашению для всех облигаций одновременно.
+
+    Метод Ньютона с поддержкой интервала: если шаг выходит за границы,
+    выполняется бисекция. Облигации без будущих потоков или с ценой вне
+    достижимого диапазона получают NaN.
+
+    :param prices: грязные цены (в валюте за облигацию)
+    :param cf: матрица денежных потоков
+    :param guess: начальное приближение
+    :param tol: точность по доходности
+    :param max_iter: максимум итераций
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    n = len(prices)
+
+    y = np.broadcast_to(np.asarray(guess, dtype=np.float64), (n,)).copy()
+    lo = np.full(n, YIELD_LOWER)
+    hi = np.full(n, YIELD_UPPER)
+
+    # Цена убывает по доходности: проверяем, что решение внутри интервала
+    valid = (
+        (cf.amounts.sum(axis=1) > 0)
+        & (prices > 0)
+        & (present_value(hi, cf) <= prices)
+        & (present_value(lo, cf) >= prices)
+    )
+    active = valid.copy()
+
+    t = cf.times
+    a = cf.amounts
+
+    for _ in range(max_iter):
+        if not active.any():
+            break
+
+        ya = y[active]
+        ta = t[active]
+        aa = a[active]
+
+        discount = (1.0 + ya[:, None]) ** -ta
+        pv = (aa * discount).sum(axis=1)
+        dpv = -(ta * aa * discount).sum(axis=1) / (1.0 + ya)
+
+        f = pv - prices[active]
+
+        # Сужаем интервал: цена выше рыночной -> доходность выше текущей
+        lo_a = np.where(f > 0, ya, lo[active])
+        hi_a = np.where(f > 0, hi[active], ya)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = f / dpv
+        y_new = ya - step
+
+        outside = ~np.isfinite(y_new) | (y_new <= lo_a) | (y_new >= hi_a)
+        y_new = np.where(outside, 0.5 * (lo_a + hi_a), y_new)
+
+        idx = np.flatnonzero(active)
+        y[idx] = y_new
+        lo[idx] = lo_a
+        hi[idx] = hi_a
+
+        done = (np.abs(y_new - ya) < tol) | (hi_a - lo_a < tol)
+        active[idx[done]] = False
+
+    y[~valid] = np.nan
+    return y
+
+
+def risk_metrics(yields: np.ndarray, cf: CashflowMatrix) -> BondMetrics:
+    """
+    Дюрация, выпуклость и DV01 при заданных доходностях.
+    """
+    y = np.asarray(yields, dtype=np.float64)[:, None]
+    t = cf.times
+    a = cf.amounts
+
+    discount = (1.0 + y) ** -t
+    pv_flows = a * discount
+    price = pv_flows.sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        macaulay = (t * pv_flows).sum(axis=1) / price
+        modified = macaulay / (1.0 + y[:, 0])
+        convexity = (t * (t + 1.0) * pv_flows).sum(axis=1) / (
+            price * (1.0 + y[:, 0]) ** 2
+        )
+
+    dv01 = modified * price * 1e-4
+
+    return BondMetrics(y[:, 0], macaulay, modified, convexity, dv01)
+
+
+def analyze(
+    prices: np.ndarray, cf: CashflowMatrix, guess: np.ndarray | float = 0.1
+) -> BondMetrics:
+    """
+    Доходность и риск-метрики по рыночным (грязным) ценам.
+
+    :param prices: грязные цены (в валюте за облигацию)
+    :param cf: матрица денежных потоков
+    :param guess: начальное приближение доходности
+    """
+    return risk_metrics(solve_yields(prices, cf, guess=guess), cf)
+
+
+def scalar_ytm(
+    price: float,
+    times: Sequence[float],
+    amounts: Sequence[float],
+    tol: float = 1e-10,
+    max_iter: int = 100,
+) -> float:
+    """
+    Доходность одной облигации обычным циклом (эталон для проверки и бенчмарка).
+    """
+    lo, hi = YIELD_LOWER, YIELD_UPPER
+    y = 0.1
+
+    for _ in range(max_iter):
+        pv = 0.0
+        dpv = 0.0
+        for t, a in zip(times, amounts):
+            v = (1.0 + y) ** -t
+            pv += a * v
+            dpv -= t * a * v / (1.0 + y)
+
+        f = pv - price
+        if f > 0:
+            lo = y
+        else:
+            hi = y
+
+        y_new = y - f / dpv if dpv else (lo + hi) / 2
+        if not lo < y_new < hi:
+            y_new = (lo + hi) / 2
+
+        if abs(y_new - y) < tol:
+            return y_new
+        y = y_new
+
+    return y
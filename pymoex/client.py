@@ -1,14 +1,34 @@
 import asyncio
+from datetime import date
+from typing import TYPE_CHECKING
 
-from pymoex.core.cache import TTLCache
+from pymoex.core.cache import CacheStats, TTLCache
+from pymoex.core.registry import InstrumentRef
 from pymoex.core.session import MoexSession
 from pymoex.models.bond import Bond
-from pymoex.models.enums import InstrumentType
+from pymoex.models.calendar import TradingCalendar
+from pymoex.models.candles import Candles
+from pymoex.models.currency import CrossRates, CurrencyPair
+from pymoex.models.enums import CandleInterval, InstrumentType
+from pymoex.models.future import Future
+from pymoex.models.index import IndexBasket, IndexConstituent
+from pymoex.models.schedule import BondSchedule
 from pymoex.models.search import Search
 from pymoex.models.share import Share
 from pymoex.services.bonds import BondsService
+from pymoex.services.calendar import CalendarService
+from pymoex.services.candles import CandlesService
+from pymoex.services.currency import CurrencyService
+from pymoex.services.directory import SecuritiesDirectory
+from pymoex.services.futures import FuturesService
+from pymoex.services.history import HistoryService
+from pymoex.services.index import IndexService
 from pymoex.services.search import SearchService
 from pymoex.services.shares import SharesService
+from pymoex.services.warmup import Warmer
+
+if TYPE_CHECKING:
+    from pymoex.core.config import MoexSettings
 
 
 class MoexClient:
@@ -16,32 +36,133 @@ class MoexClient:
     Асинхронный клиент для работы с ISS API Московской биржи.
     """
 
-    def __init__(self, price_ttl: int = 60, search_ttl: int = 300):
+    def __init__(
+        self,
+        price_ttl: int = 60,
+        search_ttl: int = 300,
+        local_search: bool = False,
+        use_registry: bool = False,
+        transport=None,
+        settings: "MoexSettings | None" = None,
+        shared_session: bool = False,
+    ):
         """
         :param price_ttl: время жизни кэша цен (акции и облигации) в секундах
         :param search_ttl: время жизни кэша поиска в секундах
+        :param local_search: искать по локальной копии справочника вместо ISS
+        :param use_registry: определять SECID и режим торгов по локальному
+            справочнику и запрашивать котировки сразу из нужного режима
+        :param transport: транспорт httpx для сессии (например,
+            pymoex.testing.ReplayTransport для работы без биржи)
+        :param settings: настройки клиента; None — общие настройки из окружения
+        :param shared_session: использовать общую для процесса HTTP-сессию
+            (один пул соединений и объединение запросов для всех клиентов)
         """
 
-        self.session = MoexSession()
+        if shared_session:
+            if transport is not None:
+                raise ValueError("transport cannot be used with shared_session")
+            self.session = MoexSession.shared(settings)
+        else:
+            self.session = MoexSession(transport=transport, settings=settings)
+
+        settings = self.session.settings
+        policy = settings.cache_policy
+
+        # Кэши (лимиты и политика вытеснения — из настроек)
+        def price_cache() -> TTLCache:
+            return TTLCache(
+                ttl=price_ttl,
+                maxsize=settings.price_cache_size,
+                max_bytes=settings.price_cache_bytes,
+                policy=policy,
+            )
+
+        self.cache_shares = price_cache()
+        self.cache_bonds = price_cache()
+        self.cache_futures = price_cache()
+        self.cache_currency = TTLCache(ttl=price_ttl, maxsize=200, policy=policy)
+        self.cache_search = TTLCache(
+            ttl=search_ttl,
+            maxsize=settings.search_cache_size,
+            max_bytes=settings.search_cache_bytes,
+            policy=policy,
+        )
+
+        # Выбранные режимы торгов: меняются редко, поэтому долгий TTL
+        self.cache_boards = TTLCache(
+            ttl=settings.board_ttl, maxsize=10000, policy=policy
+        )
+
+        # Составы индексов (веса пересчитываются биржей раз в день)
+        self.cache_index = TTLCache(ttl=settings.index_ttl, maxsize=200, policy=policy)
 
-        # Кэши
-        self.cache_shares = TTLCache(ttl=price_ttl, maxsize=1000)
-        self.cache_bonds = TTLCache(ttl=price_ttl, maxsize=1000)
-        self.cache_search = TTLCache(ttl=search_ttl, maxsize=2000)
+        # Свечи
+        self.cache_candles = TTLCache(ttl=price_ttl, maxsize=500, policy=policy)
+
+        # Расписания платежей облигаций меняются только по событиям эмитента
+        self.cache_schedules = TTLCache(
+            ttl=settings.schedule_ttl, maxsize=20000, policy=policy
+        )
+
+        # Расписания торгов движков (TTL котировок вне торговой сессии)
+        self.cache_calendar = TTLCache(ttl=settings.calendar_ttl, maxsize=10)
+        self.calendar = CalendarService(
+            self.session, self.cache_calendar, settings.closed_price_ttl
+        )
+        price_calendar = self.calendar if settings.trading_calendar else None
+
+        # Локальный справочник инструментов (загружается при первом обращении)
+        self.directory = SecuritiesDirectory(
+            self.session,
+            path=settings.cache_dir / "securities.json",
+            ttl=settings.directory_ttl,
+        )
 
         # Сервисы
-        self.shares = SharesService(self.session, self.cache_shares)
-        self.bonds = BondsService(self.session, self.cache_bonds)
-        self.search = SearchService(self.session, self.cache_search)
+        registry_dir = self.directory if use_registry else None
+        search_dir = self.directory if local_search else None
+
+        self.shares = SharesService(
+            self.session,
+            self.cache_shares,
+            registry_dir,
+            self.cache_boards,
+            calendar=price_calendar,
+        )
+        self.bonds = BondsService(
+            self.session,
+            self.cache_bonds,
+            registry_dir,
+            self.cache_boards,
+            self.cache_schedules,
+            calendar=price_calendar,
+        )
+        self.search = SearchService(self.session, self.cache_search, search_dir)
+        self.futures = FuturesService(
+            self.session, self.cache_futures, registry_dir, self.cache_boards
+        )
+        self.currency = CurrencyService(
+            self.session, self.cache_currency, registry_dir, self.cache_boards
+        )
+        self.index = IndexService(self.session, self.cache_index, self.shares)
+        self.candles_service = CandlesService(self.session, self.cache_candles)
+
+        # История и свечи с локальным хранением (хранилище открывается лениво)
+        self.history_service = HistoryService(self.session)
+
+        # Фоновый прогрев кэшей (keep_warm)
+        self._warmers: list[Warmer] = []
 
     async def close(self) -> None:
         """
-        Закрыть HTTP-сессию и очистить кэши.
+        Остановить прогрев кэшей, закрыть HTTP-сессию и очистить кэши.
         """
+        warmers, self._warmers = self._warmers, []
+        for warmer in warmers:
+            await warmer.stop()
 
-        caches = [self.cache_shares, self.cache_bonds, self.cache_search]
-
-        for c in caches:
+        for c in self._caches().values():
             try:
                 res = c.clear()
 
@@ -50,9 +171,68 @@ class MoexClient:
             except Exception:
                 pass
 
+        self.history_service.close()
+
         if self.session:
             await self.session.close()
 
+    def cache_stats(self) -> dict[str, CacheStats]:
+        """
+        Счетчики попаданий, промахов и вытеснений по кэшам клиента.
+
+        :return: словарь имя кэша -> CacheStats
+        """
+        return {name: cache.stats for name, cache in self._caches().items()}
+
+    def _caches(self) -> dict[str, TTLCache]:
+        return {
+            "shares": self.cache_shares,
+            "bonds": self.cache_bonds,
+            "futures": self.cache_futures,
+            "currency": self.cache_currency,
+            "search": self.cache_search,
+            "boards": self.cache_boards,
+            "schedules": self.cache_schedules,
+            "candles": self.cache_candles,
+            "index": self.cache_index,
+            "calendar": self.cache_calendar,
+        }
+
+    async def keep_warm(
+        self,
+        shares: list[str] | None = None,
+        bonds: list[str] | None = None,
+        searches: list[str] | None = None,
+        concurrency: int | None = None,
+    ) -> Warmer:
+        """
+        Загрузить котировки и результаты поиска заранее и обновлять их в фоне
+        до истечения TTL, чтобы share(), bond() и find() всегда попадали в кэш.
+
+        Котировки загружаются снимками рынка (одним запросом на сотню бумаг).
+        Прогрев останавливается в close() (или warmer.stop()).
+
+        :param shares: тикеры акций
+        :param bonds: SECID или ISIN облигаций
+        :param searches: поисковые запросы
+        :param concurrency: одновременных загрузок (по умолчанию
+            MOEX_WARM_CONCURRENCY)
+        :return: Warmer (счетчики refreshes / errors)
+        """
+        warmer = Warmer(
+            self.shares,
+            self.bonds,
+            self.search,
+            shares,
+            bonds,
+            searches,
+            concurrency or self.session.settings.warm_concurrency,
+        )
+        await warmer.start()
+        self._warmers.append(warmer)
+
+        return warmer
+
     async def share(self, ticker: str) -> Share:
         """
         Получить данные по акции.
@@ -71,37 +251,222 @@ class MoexClient:
         """
         return await self.bonds.get_bond(ticker)
 
+    async def future(self, ticker: str) -> Future:
+        """
+        Получить данные по фьючерсному контракту.
+
+        Для расчетов по многим контрактам используйте client.futures.snapshot()
+        или client.futures.chain(asset_code) — один запрос на весь режим торгов.
+
+        :param ticker: код контракта (например, 'SiH4')
+        :return: модель Future
+        """
+        return await self.futures.get_future(ticker)
+
+    async def currency_pair(self, ticker: str) -> CurrencyPair:
+        """
+        Получить данные по валютной паре или металлу.
+
+        :param ticker: торговый код (например, 'USD000UTSTOM')
+        :return: модель CurrencyPair
+        """
+        return await self.currency.get_pair(ticker)
+
+    async def fx_rates(self) -> CrossRates:
+        """
+        Получить таблицу курсов валют к рублю (один запрос на режим CETS).
+
+        Пересчет сумм после загрузки — локальный поиск по словарю:
+            rates = await client.fx_rates()
+            rub = rates.convert(bond.face_value, bond.face_unit)
+
+        :return: CrossRates
+        """
+        return await self.currency.rates()
+
+    async def index_constituents(
+        self, index_id: str, on_date: date | None = None
+    ) -> list[IndexConstituent]:
+        """
+        Получить состав индекса и веса бумаг.
+
+        :param index_id: код индекса (например, 'IMOEX')
+        :param on_date: дата состава; None — последний доступный
+        :return: список IndexConstituent
+        """
+        return await self.index.constituents(index_id, on_date)
+
+    async def index_basket(
+        self, index_id: str, board: str | None = None
+    ) -> IndexBasket[Share]:
+        """
+        Получить состав индекса вместе с котировками всех бумаг
+        (один запрос снимка режима торгов на всю корзину).
+
+        :param index_id: код индекса (например, 'IMOEX')
+        :param board: режим торгов котировок (по умолчанию TQBR)
+        :return: IndexBasket: пары (бумага индекса, Share)
+        """
+        return await self.index.basket(index_id, board)
+
+    async def candles(
+        self,
+        ticker: str,
+        interval: CandleInterval | int = CandleInterval.DAY_1,
+        date_from: date | None = None,
+        date_till: date | None = None,
+        market: str = "shares",
+    ) -> Candles:
+        """
+        Получить свечи инструмента.
+
+        Если для того же диапазона уже загружены свечи меньшего интервала,
+        запрошенный интервал собирается из них без запроса к ISS.
+
+        :param ticker: торговый код
+        :param interval: интервал свечей (CandleInterval или число ISS)
+        :param date_from: начало периода
+        :param date_till: конец периода
+        :param market: рынок ('shares', 'bonds', ...)
+        :return: колоночный набор свечей Candles
+        """
+        return await self.candles_service.get_candles(
+            ticker, interval, date_from, date_till, market
+        )
+
+    async def history(
+        self,
+        ticker: str,
+        board: str,
+        date_from: date | None = None,
+        date_till: date | None = None,
+        market: str = "shares",
+    ) -> Candles:
+        """
+        Получить дневную историю торгов инструмента в режиме торгов.
+
+        История хранится локально (MOEX_STORE_BACKEND): при повторном вызове
+        из ISS загружаются только дни, которых нет в хранилище.
+
+        :param ticker: торговый код
+        :param board: режим торгов (например, 'TQBR')
+        :param date_from: начало периода
+        :param date_till: конец периода
+        :param market: рынок ('shares', 'bonds', ...)
+        :return: дневные свечи Candles
+        """
+        return await self.history_service.history(
+            ticker, board, date_from, date_till, market
+        )
+
+    async def sync_history(
+        self,
+        tickers: list[str],
+        board: str,
+        date_from: date | None = None,
+        market: str = "shares",
+    ) -> dict[str, int | Exception]:
+        """
+        Догрузить в локальное хранилище дневную историю списка инструментов.
+
+        Ошибка загрузки одного инструмента не прерывает остальные:
+        вместо количества строк для него возвращается исключение.
+
+        :param tickers: торговые коды
+        :param board: режим торгов
+        :param date_from: начало загрузки (ряды догружаются до этой даты)
+        :param market: рынок ('shares', 'bonds', ...)
+        :return: словарь тикер -> количество загруженных строк или исключение
+        """
+        return await self.history_service.sync_history(
+            tickers, board, date_from, market
+        )
+
+    async def schedule(self, isin: str) -> BondSchedule:
+        """
+        Получить расписание платежей облигации (купоны, амортизации, оферты).
+
+        :param isin: ISIN или торговый код
+        :return: модель BondSchedule
+        """
+        return await self.bonds.schedule(isin)
+
+    async def schedules(self, isins: list[str]) -> dict[str, BondSchedule]:
+        """
+        Получить расписания платежей для списка облигаций.
+
+        :param isins: ISIN или торговые коды
+        :return: словарь ISIN -> BondSchedule
+        """
+        return await self.bonds.schedules(isins)
+
+    async def trading_calendar(self, engine: str = "stock") -> TradingCalendar:
+        """
+        Получить расписание торгов движка (рабочие дни и часы торгов).
+
+        :param engine: движок ('stock', 'futures', 'currency')
+        :return: модель TradingCalendar
+        """
+        return await self.calendar.calendar(engine)
+
     async def find(
-        self, query: str, instrument_type: InstrumentType | str | None = None
+        self,
+        query: str,
+        instrument_type: InstrumentType | str | None = None,
+        traded_only: bool = False,
     ) -> list[Search]:
         """
         Поиск инструментов по строке.
 
         :param query: строка поиска (тикер, имя, ISIN)
         :param instrument_type: 'share', 'bond' или None (всё)
+        :param traded_only: только инструменты, которые сейчас торгуются
         :return: список найденных инструментов
         """
-        return await self.search.find(query, instrument_type)
+        return await self.search.find(query, instrument_type, traded_only)
 
-    async def find_bonds(self, query: str):
+    async def find_bonds(self, query: str, traded_only: bool = False):
         """
         Поиск облигаций по строке.
 
         :param query: строка поиска (тикер, имя, ISIN)
-        :param instrument_type:с'bond'
+        :param traded_only: только инструменты, которые сейчас торгуются
         :return: список найденных облигаций
         """
-        return await self.search.find(query, InstrumentType.BOND)
+        return await self.search.find(query, InstrumentType.BOND, traded_only)
 
-    async def find_shares(self, query: str):
+    async def find_shares(self, query: str, traded_only: bool = False):
         """
         Поиск акций по строке.
 
         :param query: строка поиска (тикер, имя, ISIN)
-        :param instrument_type: 'share'
+        :param traded_only: только инструменты, которые сейчас торгуются
         :return: список найденных акций
         """
-        return await self.search.find(query, InstrumentType.SHARE)
+        return await self.search.find(query, InstrumentType.SHARE, traded_only)
+
+    async def resolve(self, identifier: str) -> InstrumentRef | None:
+        """
+        Найти инструмент по ISIN, SECID или регистрационному номеру
+        в локальном справочнике.
+
+        :param identifier: идентификатор инструмента
+        :return: InstrumentRef (SECID, основной режим торгов, группа) или None
+        """
+        registry = await self.directory.registry()
+        return registry.resolve(identifier)
+
+    async def resolve_many(
+        self, identifiers: list[str]
+    ) -> dict[str, InstrumentRef | None]:
+        """
+        Массово сопоставить идентификаторы инструментам без запросов к ISS.
+
+        :param identifiers: ISIN, SECID или регистрационные номера
+        :return: словарь идентификатор -> InstrumentRef (или None)
+        """
+        registry = await self.directory.registry()
+        return registry.resolve_many(identifiers)
 
     async def __aenter__(self) -> "MoexClient":
         return self
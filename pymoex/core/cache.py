@@ -2,7 +2,10 @@ import asyncio
 import logging
 import time
 from collections import OrderedDict
-from typing import Any, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from pymoex.utils.sizeof import approx_size
 
 logger = logging.getLogger(__name__)
 
@@ -10,45 +13,164 @@ logger = logging.getLogger(__name__)
 _now = time.monotonic
 
 
+@dataclass
+class CacheStats:
+    """Счетчики обращений к кэшу."""
+
+    hits: int = 0
+    misses: int = 0  # промахи (в т.ч. протухшие записи), вызвавшие загрузку
+    waits: int = 0  # запросы, дождавшиеся уже идущей загрузки (coalescing)
+    probes: int = 0  # get() без значения и без идущей загрузки (не промахи)
+    evictions: int = 0  # вытеснено по maxsize / max_bytes
+    rejections: int = 0  # новые записи, не допущенные политикой tinylfu
+    expirations: int = 0  # удалено по TTL
+
+    @property
+    def hit_ratio(self) -> float:
+        """Доля запросов, обслуженных без загрузки (попадания и ожидания)."""
+        total = self.hits + self.misses + self.waits
+        return (self.hits + self.waits) / total if total else 0.0
+
+
+class FrequencySketch:
+    """
+    Count-Min Sketch: приблизительная частота обращений к ключам
+    (4 строки счетчиков до 15). Каждые sample обращений счетчики делятся
+    пополам, поэтому старая популярность постепенно забывается.
+    """
+
+    DEPTH = 4
+    MAX_COUNT = 15
+
+    # Множители хэша для строк (мультипликативное хэширование по старшим битам)
+    SEEDS = (
+        0x9E3779B97F4A7C15,
+        0xC2B2AE3D27D4EB4F,
+        0x165667B19E3779F9,
+        0xD6E8FEB86659FD93,
+    )
+
+    def __init__(self, capacity: int):
+        """
+        :param capacity: ожидаемое число ключей в кэше
+        """
+        bits = max(6, (max(capacity, 1) * 4 - 1).bit_length())
+        self._shift = 64 - bits
+        self._rows = [bytearray(1 << bits) for _ in range(self.DEPTH)]
+        self._sample = 10 * max(capacity, 16)
+        self._additions = 0
+
+    def increment(self, key: str) -> None:
+        for row, i in zip(self._rows, self._indexes(key)):
+            if row[i] < self.MAX_COUNT:
+                row[i] += 1
+
+        self._additions += 1
+        if self._additions >= self._sample:
+            self._reset()
+
+    def estimate(self, key: str) -> int:
+        return min(row[i] for row, i in zip(self._rows, self._indexes(key)))
+
+    def _indexes(self, key: str) -> list[int]:
+        h = hash(key) & 0xFFFFFFFFFFFFFFFF
+        return [
+            ((h * seed) & 0xFFFFFFFFFFFFFFFF) >> self._shift for seed in self.SEEDS
+        ]
+
+    def _reset(self) -> None:
+        self._rows = [bytearray(c >> 1 for c in row) for row in self._rows]
+        self._additions //= 2
+
+
 class TTLCache:
     """
     Продвинутый асинхронный TTL-кэш.
 
     Особенности:
     - Thread-safe (asyncio).
-    - LRU вытеснение.
+    - LRU вытеснение по числу записей (maxsize) и/или по приблизительному
+      размеру значений в байтах (max_bytes).
+    - Политика tinylfu (W-TinyLFU): новые записи попадают в маленькое окно
+      и вытесняют запись основной области, только если к ним обращаются
+      чаще. Разовый проход по множеству ключей не вымывает горячие записи.
     - Request Coalescing: защита от одновременных одинаковых запросов (через Future).
     """
 
-    def __init__(self, ttl: int = 30, maxsize: Optional[int] = None):
+    # Доля окна новых записей в политике tinylfu
+    WINDOW = 0.01
+
+    def __init__(
+        self,
+        ttl: int = 30,
+        maxsize: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        policy: str = "lru",
+        sizeof: Callable[[Any], int] = approx_size,
+    ):
+        """
+        :param ttl: время жизни записей по умолчанию (секунды)
+        :param maxsize: максимум записей (None — без ограничения)
+        :param max_bytes: бюджет памяти на значения (None — без ограничения)
+        :param policy: 'lru' или 'tinylfu'
+        :param sizeof: оценка размера значения (используется с max_bytes)
+        """
+        if policy not in ("lru", "tinylfu"):
+            raise ValueError(f"Unknown cache policy: {policy!r}")
+
         self.ttl = int(ttl)
         self.maxsize = int(maxsize) if maxsize is not None else None
+        self.max_bytes = int(max_bytes) if max_bytes is not None else None
+        self.policy = policy
+        self.sizeof = sizeof
 
         # Хранение: key -> (value, expires_at)
         self._data: dict[str, tuple[Any, float]] = {}
-        # Порядок LRU
+        # Порядок LRU (основная область)
         self._order = OrderedDict()
 
+        # Размеры значений (только при max_bytes)
+        self._sizes: dict[str, int] = {}
+        self._bytes = 0
+
+        # Окно новых записей и частоты обращений (только для tinylfu)
+        self._window = OrderedDict()
+        self._sketch = (
+            FrequencySketch(self.maxsize or 1024) if policy == "tinylfu" else None
+        )
+
         # Очередь ожидающих запросов: key -> asyncio.Future
         self._pending: dict[str, asyncio.Future] = {}
 
         self._lock = asyncio.Lock()
 
+        self.stats = CacheStats()
+
     def _now(self) -> float:
         return _now()
 
     async def get(self, key: str) -> Optional[Any]:
         """
         Получить значение. Если оно сейчас грузится другим запросом — подождать его.
+
+        Отсутствие значения учитывается в stats.probes, а не в stats.misses:
+        get() ничего не загружает (например, поиск проверяет префиксы запроса).
         """
         async with self._lock:
+            self._record_access_locked(key)
+
             # Пробуем найти готовое
             val = self._get_from_data_locked(key)
             if val is not None:
+                self.stats.hits += 1
                 return val
 
             # Если не нашли, проверяем, не грузится ли оно прямо сейчас
             future = self._pending.get(key)
+            if future:
+                self.stats.waits += 1
+            else:
+                self.stats.probes += 1
 
         # Ждем снаружи лока
         if future:
@@ -59,21 +181,33 @@ class TTLCache:
 
         return None
 
-    async def get_or_set(self, key: str, factory, ttl: Optional[int] = None):
+    async def get_or_set(
+        self,
+        key: str,
+        factory,
+        ttl: Optional[int | Callable[[Any], Optional[int]]] = None,
+    ):
         """
         Получить или создать. Гарантирует, что factory вызовется 1 раз для ключа.
+
+        :param ttl: время жизни записи; функция от загруженного значения
+            (например, по торговому статусу инструмента); None — self.ttl
         """
         async with self._lock:
+            self._record_access_locked(key)
+
             # Быстрая проверка наличия
             val = self._get_from_data_locked(key)
             if val is not None:
                 logger.debug(f"Cache HIT: {key}")
+                self.stats.hits += 1
                 return val
 
             # Проверка: не грузит ли кто-то уже?
             if key in self._pending:
                 logger.debug(f"Cache WAIT: {key} (coalescing)")
                 future = self._pending[key]
+                self.stats.waits += 1
                 # Мы не инициаторы, поэтому просто запомнили future и пойдем ждать
                 im_initiator = False
             else:
@@ -81,6 +215,7 @@ class TTLCache:
                 logger.debug(f"Cache MISS: {key} -> loading...")
                 future = asyncio.Future()
                 self._pending[key] = future
+                self.stats.misses += 1
                 im_initiator = True
 
         # --- БЛОК ОЖИДАНИЯ ---
@@ -95,14 +230,15 @@ class TTLCache:
                 result = await result
 
             # Сохраняем результат
+            if callable(ttl):
+                ttl = ttl(result)
             expires_at = self._now() + (int(ttl) if ttl is not None else self.ttl)
+            size = self.sizeof(result) if self.max_bytes is not None else 0
 
             async with self._lock:
                 # Проверяем, не удалили ли pending, пока мы работали
                 if key in self._pending:
-                    self._data[key] = (result, expires_at)
-                    self._order[key] = True
-                    self._move_to_end_locked(key)
+                    self._store_locked(key, result, expires_at, size)
 
                     # Убираем из pending
                     self._pending.pop(key, None)
@@ -130,9 +266,10 @@ class TTLCache:
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         expires_at = self._now() + (int(ttl) if ttl is not None else self.ttl)
+        size = self.sizeof(value) if self.max_bytes is not None else 0
         async with self._lock:
-            self._data[key] = (value, expires_at)
-            self._move_to_end_locked(key)
+            self._record_access_locked(key)
+            self._store_locked(key, value, expires_at, size)
             self._evict_if_needed_locked()
 
     async def delete(self, key: str) -> None:
@@ -144,6 +281,9 @@ class TTLCache:
         async with self._lock:
             self._data.clear()
             self._order.clear()
+            self._window.clear()
+            self._sizes.clear()
+            self._bytes = 0
 
     # --- Приватные хелперы ---
 
@@ -156,12 +296,36 @@ class TTLCache:
         val, expires_at = item
         if self._now() > expires_at:
             self._delete_locked(key)
+            self.stats.expirations += 1
             return None
 
         self._move_to_end_locked(key)
         return val
 
+    def _store_locked(self, key: str, value: Any, expires_at: float, size: int):
+        self._data[key] = (value, expires_at)
+
+        if self.max_bytes is not None:
+            self._bytes += size - self._sizes.get(key, 0)
+            self._sizes[key] = size
+
+        if key in self._order or key in self._window:
+            self._move_to_end_locked(key)
+        elif self._sketch is not None:
+            # Новые записи сначала попадают в окно
+            self._window[key] = True
+        else:
+            self._order[key] = True
+
+    def _record_access_locked(self, key: str):
+        if self._sketch is not None:
+            self._sketch.increment(key)
+
     def _move_to_end_locked(self, key: str):
+        if key in self._window:
+            self._window.move_to_end(key, last=True)
+            return
+
         try:
             self._order.move_to_end(key, last=True)
         except KeyError:
@@ -170,10 +334,56 @@ class TTLCache:
     def _delete_locked(self, key: str):
         self._data.pop(key, None)
         self._order.pop(key, None)
+        self._window.pop(key, None)
+        self._bytes -= self._sizes.pop(key, 0)
+
+    def _over_limit(self) -> bool:
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            return True
+        return self.max_bytes is not None and self._bytes > self.max_bytes
+
+    def _window_full(self) -> bool:
+        if len(self._window) <= 1:
+            return False
+        if self.maxsize is not None:
+            if len(self._window) > max(1, int(self.maxsize * self.WINDOW)):
+                return True
+        if self.max_bytes is not None:
+            window_bytes = sum(self._sizes.get(k, 0) for k in self._window)
+            return window_bytes > self.max_bytes * self.WINDOW
+        return False
 
     def _evict_if_needed_locked(self):
-        if self.maxsize is None:
+        if self._sketch is None:
+            while self._over_limit() and self._order:
+                self._evict_locked(next(iter(self._order)))
             return
-        while len(self._data) > self.maxsize:
-            oldest_key, _ = self._order.popitem(last=False)
-            self._data.pop(oldest_key, None)
+
+        # Старейшие записи окна переходят в основную область, если для них
+        # есть место или они популярнее вытесняемых записей
+        while self._window and (self._window_full() or self._over_limit()):
+            candidate = next(iter(self._window))
+            del self._window[candidate]
+            self._admit_locked(candidate)
+
+        while self._over_limit() and self._order:
+            self._evict_locked(next(iter(self._order)))
+
+    def _admit_locked(self, candidate: str):
+        frequency = self._sketch.estimate(candidate)
+
+        while self._over_limit():
+            victim = next(iter(self._order), None)
+            if victim is None or self._sketch.estimate(victim) >= frequency:
+                logger.debug(f"Cache REJECT: {candidate}")
+                self._delete_locked(candidate)
+                self.stats.rejections += 1
+                return
+
+            self._evict_locked(victim)
+
+        self._order[candidate] = True
+
+    def _evict_locked(self, key: str):
+        self._delete_locked(key)
+        self.stats.evictions += 1
@@ -1,3 +1,5 @@
+import logging
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -19,6 +21,8 @@ class MoexSettings(BaseSettings):
     - MOEX_TIMEOUT       (таймаут HTTP-запросов в секундах)
     - MOEX_USER_AGENT    (User-Agent клиента)
     - MOEX_LOG_LEVEL     (уровень логирования)
+    - MOEX_CACHE_DIR     (каталог локальных данных: справочник, индексы)
+    - MOEX_STORE_BACKEND (хранилище истории и свечей: sqlite или parquet)
     """
 
     # Базовый URL API Московской биржи
@@ -33,9 +37,69 @@ class MoexSettings(BaseSettings):
     # Уровень логирования
     log_level: str = "INFO"
 
+    # Объединять одинаковые одновременные GET-запросы в один HTTP-запрос
+    coalesce_requests: bool = True
+
+    # Не разбирать повторно ответ, совпадающий с предыдущим (по хэшу тела)
+    reuse_unchanged: bool = True
+
+    # Политика вытеснения кэшей клиента: 'lru' или 'tinylfu' (разовые
+    # проходы по множеству инструментов не вытесняют часто запрашиваемые)
+    cache_policy: str = "tinylfu"
+
+    # Лимиты кэшей котировок (акции, облигации, фьючерсы) и поиска:
+    # число записей и приблизительный объем значений в байтах (None — без лимита)
+    price_cache_size: int | None = 1000
+    price_cache_bytes: int | None = None
+    search_cache_size: int | None = 2000
+    search_cache_bytes: int | None = None
+
+    # TTL котировок акций и облигаций по расписанию торгов: вне торгов запись
+    # живет до открытия (не дольше closed_price_ttl), расписание — calendar_ttl
+    trading_calendar: bool = True
+    closed_price_ttl: int = 43200
+    calendar_ttl: int = 86400
+
+    # Одновременных загрузок фонового прогрева кэшей (MoexClient.keep_warm)
+    warm_concurrency: int = 4
+
+    # Разбор ответов ISS не меньше offload_threshold байт (JSON, таблицы,
+    # модели снимков) в пуле: 'thread', 'process' или 'auto' (потоки).
+    # Пул процессов требует if __name__ == "__main__" в скрипте.
+    # None — разбор в event loop
+    offload_threshold: int | None = None
+    offload_executor: str = "auto"
+    offload_workers: int | None = None
+
     preferred_share_boards: list[str] = ["TQBR", "TQTF", "FQBR", "TQTD"]
     preferred_bond_boards: list[str] = ["TQOB", "TQCB", "TQOD", "TQIR"]
 
+    # Время жизни кэша выбранного режима торгов инструмента (секунды)
+    board_ttl: int = 86400
+
+    # Расписания платежей облигаций: TTL кэша и ограничения массовой загрузки
+    schedule_ttl: int = 7 * 86400
+    schedule_rate: float = 10.0
+    schedule_concurrency: int = 8
+
+    # Время жизни кэша состава индексов (секунды)
+    index_ttl: int = 3600
+
+    # Каталог для локальных данных (справочник инструментов и т.п.)
+    cache_dir: Path = Path.home() / ".cache" / "pymoex"
+
+    # Период обновления локального справочника инструментов (секунды)
+    directory_ttl: int = 86400
+
+    # Локальное хранилище истории и свечей: 'sqlite' или 'parquet' (нужен pyarrow).
+    # Путь по умолчанию — cache_dir/series.sqlite или каталог cache_dir/series
+    store_backend: str = "sqlite"
+    store_path: Path | None = None
+
+    # Ограничения массовой синхронизации истории (запросов в секунду, параллельно)
+    history_rate: float = 10.0
+    history_concurrency: int = 8
+
     # Конфигурация pydantic-settings
     model_config = SettingsConfigDict(
         env_prefix="MOEX_",  # префикс переменных окружения
@@ -45,6 +109,24 @@ class MoexSettings(BaseSettings):
     )
 
 
-# Глобальный синглтон настроек.
-# Используется всеми сервисами и сессиями SDK.
-settings = MoexSettings()
+@lru_cache(maxsize=1)
+def get_settings() -> MoexSettings:
+    """
+    Общие настройки SDK: окружение и .env читаются один раз на процесс.
+
+    При первом вызове настраивает уровень логгера pymoex (MOEX_LOG_LEVEL).
+    Чтобы перечитать окружение, вызовите get_settings.cache_clear().
+    """
+    settings = MoexSettings()
+
+    level = getattr(logging, settings.log_level.upper(), logging.INFO)
+    logging.getLogger("pymoex").setLevel(level)
+
+    return settings
+
+
+def __getattr__(name: str):
+    # Совместимость: pymoex.core.config.settings — те же общие настройки
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,6 +3,11 @@
 
 Используется сервисами (SharesService, BondsService, SearchService и т.д.)
 для централизованного построения путей.
+
+Пути строятся для пары движок/рынок (engine/market):
+- stock/shares, stock/bonds, stock/index — фондовый рынок;
+- futures/forts, futures/options — срочный рынок;
+- currency/selt — валютный рынок.
 """
 
 # Базовый движок рынка (акции и облигации находятся в engine=stock)
@@ -12,6 +17,50 @@ ENGINE = "stock"
 BASE = f"/engines/{ENGINE}/markets"
 
 
+def market_path(engine: str, market: str) -> str:
+    """
+    Префикс рынка.
+
+    :param engine: движок ('stock', 'futures', 'currency')
+    :param market: рынок ('shares', 'forts', 'selt', ...)
+    :return: путь вида /engines/futures/markets/forts
+    """
+    return f"/engines/{engine}/markets/{market}"
+
+
+def securities(engine: str, market: str, board: str | None = None) -> str:
+    """
+    Эндпоинт всех инструментов рынка или режима торгов (снимок одним запросом).
+
+    :param engine: движок
+    :param market: рынок
+    :param board: режим торгов; None — все режимы рынка
+    :return: путь вида /engines/futures/markets/forts/boards/RFUD/securities.json
+    """
+    prefix = market_path(engine, market)
+    if board:
+        return f"{prefix}/boards/{board}/securities.json"
+    return f"{prefix}/securities.json"
+
+
+def security(
+    engine: str, market: str, ticker: str, board: str | None = None
+) -> str:
+    """
+    Эндпоинт инструмента рынка (во всех режимах или в одном режиме торгов).
+
+    :param engine: движок
+    :param market: рынок
+    :param ticker: торговый код инструмента
+    :param board: режим торгов; None — все режимы
+    :return: путь вида /engines/futures/markets/forts/securities/SiH4.json
+    """
+    prefix = market_path(engine, market)
+    if board:
+        return f"{prefix}/boards/{board}/securities/{ticker}.json"
+    return f"{prefix}/securities/{ticker}.json"
+
+
 def share(ticker: str) -> str:
     """
     Эндпоинт для получения информации по акции.
@@ -19,7 +68,7 @@ def share(ticker: str) -> str:
     :param ticker: торговый код акции (например, 'SBER')
     :return: путь вида /engines/stock/markets/shares/securities/SBER.json
     """
-    return f"{BASE}/shares/securities/{ticker}.json"
+    return security(ENGINE, "shares", ticker)
 
 
 def bond(ticker: str) -> str:
@@ -29,7 +78,112 @@ def bond(ticker: str) -> str:
     :param ticker: ISIN или торговый код облигации
     :return: путь вида /engines/stock/markets/bonds/securities/RU000A10DS74.json
     """
-    return f"{BASE}/bonds/securities/{ticker}.json"
+    return security(ENGINE, "bonds", ticker)
+
+
+def share_on_board(board: str, ticker: str) -> str:
+    """
+    Эндпоинт акции в конкретном режиме торгов (одна строка вместо всех режимов).
+
+    :param board: режим торгов (например, 'TQBR')
+    :param ticker: торговый код акции
+    :return: путь вида /engines/stock/markets/shares/boards/TQBR/securities/SBER.json
+    """
+    return security(ENGINE, "shares", ticker, board)
+
+
+def bond_on_board(board: str, ticker: str) -> str:
+    """
+    Эндпоинт облигации в конкретном режиме торгов.
+
+    :param board: режим торгов (например, 'TQOB')
+    :param ticker: торговый код облигации
+    :return: путь вида /engines/stock/markets/bonds/boards/TQOB/securities/SU26238RMFS4.json
+    """
+    return security(ENGINE, "bonds", ticker, board)
+
+
+def shares(board: str | None = None) -> str:
+    """
+    Эндпоинт всех акций режима торгов (или всего рынка акций).
+
+    :param board: режим торгов (например, 'TQBR'); None — все режимы
+    :return: путь вида /engines/stock/markets/shares/boards/TQBR/securities.json
+    """
+    return securities(ENGINE, "shares", board)
+
+
+def bonds(board: str | None = None) -> str:
+    """
+    Эндпоинт всех облигаций режима торгов (или всего рынка облигаций).
+
+    :param board: режим торгов (например, 'TQCB'); None — все режимы
+    :return: путь вида /engines/stock/markets/bonds/boards/TQCB/securities.json
+    """
+    return securities(ENGINE, "bonds", board)
+
+
+def candles(ticker: str, market: str = "shares", engine: str = ENGINE) -> str:
+    """
+    Эндпоинт свечей инструмента.
+
+    :param ticker: торговый код инструмента
+    :param market: рынок ('shares', 'bonds', ...)
+    :param engine: движок
+    :return: путь вида /engines/stock/markets/shares/securities/SBER/candles.json
+    """
+    return f"{market_path(engine, market)}/securities/{ticker}/candles.json"
+
+
+def candles_on_board(
+    board: str, ticker: str, market: str = "shares", engine: str = ENGINE
+) -> str:
+    """
+    Эндпоинт свечей инструмента в конкретном режиме торгов.
+
+    :param board: режим торгов (например, 'TQBR')
+    :param ticker: торговый код инструмента
+    :param market: рынок ('shares', 'bonds', ...)
+    :param engine: движок
+    :return: путь вида /engines/stock/markets/shares/boards/TQBR/securities/SBER/candles.json
+    """
+    prefix = market_path(engine, market)
+    return f"{prefix}/boards/{board}/securities/{ticker}/candles.json"
+
+
+def history(
+    board: str, ticker: str, market: str = "shares", engine: str = ENGINE
+) -> str:
+    """
+    Эндпоинт дневной истории торгов инструмента в режиме торгов.
+
+    :param board: режим торгов (например, 'TQBR')
+    :param ticker: торговый код инструмента
+    :param market: рынок ('shares', 'bonds', ...)
+    :param engine: движок
+    :return: путь вида /history/engines/stock/markets/shares/boards/TQBR/securities/SBER.json
+    """
+    return f"/history{security(engine, market, ticker, board)}"
+
+
+def index_analytics(index_id: str) -> str:
+    """
+    Эндпоинт состава и весов индекса.
+
+    :param index_id: код индекса (например, 'IMOEX')
+    :return: путь вида /statistics/engines/stock/markets/index/analytics/IMOEX.json
+    """
+    return f"/statistics{market_path(ENGINE, 'index')}/analytics/{index_id}.json"
+
+
+def bondization(isin: str) -> str:
+    """
+    Эндпоинт расписания платежей облигации (купоны, амортизации, оферты).
+
+    :param isin: ISIN или торговый код облигации
+    :return: путь вида /securities/RU000A10DS74/bondization.json
+    """
+    return f"/securities/{isin}/bondization.json"
 
 
 def search() -> str:
@@ -41,3 +195,13 @@ def search() -> str:
     :return: путь /securities.json
     """
     return "/securities.json"
+
+
+def engine(name: str = ENGINE) -> str:
+    """
+    Эндпоинт движка: описание и расписание торгов (timetable, dailytable).
+
+    :param name: движок ('stock', 'futures', 'currency')
+    :return: путь вида /engines/stock.json
+    """
+    return f"/engines/{name}.json"
@@ -0,0 +1,135 @@
+"""
+Разбор больших ответов ISS вне event loop.
+
+Снимок рынка облигаций — несколько мегабайт JSON и тысячи моделей Bond:
+его разбор в event loop задерживает все остальные корутины на сотни
+миллисекунд. Offloader выполняет такую работу в пуле потоков (по умолчанию)
+или, если это явно выбрано, в пуле процессов.
+
+Пул процессов быстрее в обычных сборках с GIL, но запускается через
+forkserver/spawn и заново импортирует __main__: скрипту нужна защита
+if __name__ == "__main__". Если пул процессов не запускается, разбор
+переходит в пул потоков. Функции, которые выполняются в пуле процессов,
+и их аргументы должны сериализоваться pickle (функции уровня модуля,
+functools.partial).
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+from concurrent.futures import (
+    BrokenExecutor,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from typing import Any, Callable, TypeVar
+
+from pymoex.exceptions import MoexAPIError
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+EXECUTORS = ("auto", "thread", "process")
+
+
+def loads(body: bytes) -> Any:
+    """JSON тела ответа ISS (MoexAPIError при некорректном JSON)."""
+    try:
+        return json.loads(body)
+    except ValueError as e:
+        raise MoexAPIError(f"Invalid JSON in ISS response: {e}") from e
+
+
+def parse_body(body: bytes, parse: Callable[[Any], R]) -> R:
+    """Разобрать JSON и применить parse (выполняется в пуле)."""
+    return parse(loads(body))
+
+
+class Offloader:
+    """
+    Пул для разбора ответов не меньше threshold байт.
+
+    Пул создается при первом использовании и закрывается в close().
+    """
+
+    def __init__(
+        self,
+        threshold: int | None = None,
+        executor: str = "auto",
+        workers: int | None = None,
+    ):
+        """
+        :param threshold: минимальный размер тела ответа (байт); None — выключено
+        :param executor: 'thread', 'process' или 'auto' (потоки; процессы
+            используются, только если выбраны явно)
+        :param workers: размер пула (по умолчанию — как у concurrent.futures)
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown offload executor: {executor!r}")
+
+        if executor == "auto":
+            executor = "thread"
+
+        self.threshold = threshold
+        self.kind = executor
+        self.workers = workers
+
+        self._executor: Executor | None = None
+
+    def wants(self, size: int) -> bool:
+        """Нужно ли разбирать ответ такого размера вне event loop."""
+        return self.threshold is not None and size >= self.threshold
+
+    async def run(self, fn: Callable[..., R], *args) -> R:
+        """
+        Выполнить fn(*args) в пуле и дождаться результата.
+
+        Если пул процессов сломан (например, __main__ не импортируется
+        повторно), задача выполняется в пуле потоков, и он используется
+        дальше. Сбой пула потоков — MoexAPIError.
+        """
+        loop = asyncio.get_running_loop()
+
+        try:
+            return await loop.run_in_executor(self._pool(), fn, *args)
+        except BrokenExecutor as e:
+            if self.kind != "process":
+                raise MoexAPIError(f"Offload pool failed: {e}") from e
+
+            logger.warning(f"Process pool failed ({e!r}), falling back to threads")
+            self.close()
+            self.kind = "thread"
+
+        try:
+            return await loop.run_in_executor(self._pool(), fn, *args)
+        except BrokenExecutor as e:
+            raise MoexAPIError(f"Offload pool failed: {e}") from e
+
+    def close(self) -> None:
+        """Остановить пул (выполняющиеся задачи не дожидаются)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._create()
+        return self._executor
+
+    def _create(self) -> Executor:
+        logger.debug(f"Starting {self.kind} pool for large ISS responses")
+
+        if self.kind == "process":
+            # fork многопоточного процесса небезопасен (httpx, пулы потоков)
+            methods = multiprocessing.get_all_start_methods()
+            method = "forkserver" if "forkserver" in methods else "spawn"
+            return ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(method),
+            )
+        return ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="pymoex-offload"
+        )
@@ -0,0 +1,58 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """
+    Ограничитель частоты и параллельности запросов.
+
+    - не больше rate запросов в секунду (равномерно, без всплесков);
+    - не больше concurrency запросов одновременно.
+
+    Использование:
+        async with limiter:
+            await session.get(...)
+    """
+
+    def __init__(self, rate: float = 10.0, concurrency: int = 8):
+        """
+        :param rate: запросов в секунду (0 — без ограничения частоты)
+        :param concurrency: максимум одновременных запросов
+        """
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._lock = asyncio.Lock()
+        self._next_at = 0.0
+
+    async def acquire(self) -> None:
+        """
+        Дождаться разрешения на запрос.
+
+        При отмене во время ожидания разрешение возвращается.
+        """
+        await self._semaphore.acquire()
+
+        if not self.interval:
+            return
+
+        try:
+            async with self._lock:
+                now = time.monotonic()
+                wait = self._next_at - now
+                self._next_at = max(now, self._next_at) + self.interval
+
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self) -> None:
+        self._semaphore.release()
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.release()
@@ -0,0 +1,81 @@
+from typing import Any, Iterable, NamedTuple, Optional
+
+
+class InstrumentRef(NamedTuple):
+    """
+    Ссылка на инструмент: куда идти за котировками.
+    """
+
+    secid: str
+    primary_boardid: Optional[str]
+    group: Optional[str]
+
+
+class InstrumentRegistry:
+    """
+    Индекс идентификаторов инструментов MOEX.
+
+    Строится по справочнику /securities.json и позволяет за O(1)
+    сопоставить ISIN, SECID или REGNUMBER инструменту (SECID, основной режим
+    торгов, группа), а ИНН эмитента — списку его инструментов.
+    """
+
+    def __init__(self, rows: Iterable[dict[str, Any]]):
+        self._ids: dict[str, InstrumentRef] = {}
+        self._by_inn: dict[str, list[InstrumentRef]] = {}
+
+        for row in rows:
+            secid = row.get("secid")
+            if not secid:
+                continue
+
+            ref = InstrumentRef(
+                secid=secid,
+                primary_boardid=row.get("primary_boardid"),
+                group=row.get("group"),
+            )
+
+            # ISIN и рег. номер могут совпадать у нескольких SECID,
+            # поэтому оставляем первый (справочник упорядочен ISS)
+            for key in (row.get("isin"), row.get("regnumber")):
+                if key:
+                    self._ids.setdefault(key.upper(), ref)
+
+            # SECID уникален и имеет приоритет
+            self._ids[secid.upper()] = ref
+
+            inn = row.get("emitent_inn")
+            if inn:
+                self._by_inn.setdefault(str(inn), []).append(ref)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, identifier: str) -> bool:
+        return identifier.strip().upper() in self._ids
+
+    def resolve(self, identifier: str) -> Optional[InstrumentRef]:
+        """
+        Найти инструмент по ISIN, SECID или регистрационному номеру.
+
+        :param identifier: идентификатор инструмента
+        :return: InstrumentRef или None
+        """
+        return self._ids.get(identifier.strip().upper())
+
+    def resolve_many(
+        self, identifiers: Iterable[str]
+    ) -> dict[str, Optional[InstrumentRef]]:
+        """
+        Массовое сопоставление идентификаторов.
+
+        :param identifiers: ISIN, SECID или регистрационные номера
+        :return: словарь идентификатор -> InstrumentRef (или None)
+        """
+        return {i: self.resolve(i) for i in identifiers}
+
+    def by_inn(self, inn: str) -> list[InstrumentRef]:
+        """
+        Все инструменты эмитента по ИНН.
+        """
+        return list(self._by_inn.get(str(inn).strip(), []))
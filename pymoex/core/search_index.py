@@ -0,0 +1,339 @@
+import bisect
+from collections import Counter
+from typing import Any, NamedTuple
+
+# Поля справочника, по которым строится индекс
+INDEXED_FIELDS = ("secid", "shortname", "name", "isin", "emitent_title")
+
+# Длина n-граммы инвертированного индекса
+NGRAM = 3
+
+# Сколько кандидатов проверять нечетким сравнением
+FUZZY_CANDIDATES = 200
+
+_TRANSLIT = str.maketrans(
+    {
+        "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e",
+        "ж": "zh", "з": "z", "и": "i", "й": "y", "к": "k", "л": "l", "м": "m",
+        "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u",
+        "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "sch",
+        "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya",
+    }
+)  # fmt: skip
+
+
+def normalize(value: Any) -> str:
+    """
+    Нормализация строки для поиска: нижний регистр без пробелов.
+    """
+    return value.lower().replace(" ", "") if isinstance(value, str) else ""
+
+
+def transliterate(text: str) -> str:
+    """
+    Транслитерация кириллицы в латиницу ("сбербанк" -> "sberbank").
+
+    Латинские символы и цифры остаются как есть, поэтому ключи
+    на обоих алфавитах сводятся к одному виду.
+    """
+    return text.translate(_TRANSLIT)
+
+
+class RowKeys(NamedTuple):
+    """
+    Предвычисленные ключи строки справочника для ранжирования.
+
+    Поля *_t — транслитерированные варианты.
+    """
+
+    secid: str
+    isin: str
+    short: str
+    name: str
+    emitent: str
+    regnumber: str
+    secid_t: str
+    short_t: str
+    name_t: str
+    emitent_t: str
+
+
+def row_keys(row: dict[str, Any]) -> RowKeys:
+    """
+    Построить ключи ранжирования для строки ответа /securities.json.
+    """
+    secid = normalize(row.get("secid"))
+    short = normalize(row.get("shortname"))
+    name = normalize(row.get("name"))
+    emitent = normalize(row.get("emitent_title"))
+
+    return RowKeys(
+        secid=secid,
+        isin=normalize(row.get("isin")),
+        short=short,
+        name=name,
+        emitent=emitent,
+        regnumber=normalize(row.get("regnumber")),
+        secid_t=transliterate(secid),
+        short_t=transliterate(short),
+        name_t=transliterate(name),
+        emitent_t=transliterate(emitent),
+    )
+
+
+def max_typos(query: str) -> int:
+    """
+    Допустимое число опечаток для запроса данной длины.
+    """
+    if len(query) < 4:
+        return 0
+    if len(query) < 8:
+        return 1
+    return 2
+
+
+class FuzzyPattern:
+    """
+    Запрос, подготовленный для нечеткого поиска подстроки.
+
+    Используется битово-параллельный алгоритм Майерса: расстояние Левенштейна
+    от запроса до ближайшей подстроки текста считается за один проход по тексту.
+    """
+
+    def __init__(self, query: str):
+        self.query = query
+        self.typos = max_typos(query)
+
+        self._peq: dict[str, int] = {}
+        for i, ch in enumerate(query):
+            self._peq[ch] = self._peq.get(ch, 0) | (1 << i)
+
+        self._full = (1 << len(query)) - 1
+        self._last = 1 << (len(query) - 1) if query else 0
+
+    def distance(self, text: str) -> int | None:
+        """
+        Расстояние до ближайшей подстроки текста или None, если оно больше
+        допустимого числа опечаток.
+        """
+        if not text or not self.query:
+            return None
+
+        peq, full, last = self._peq, self._full, self._last
+        pv, mv = full, 0
+        dist = best = len(self.query)
+
+        for ch in text:
+            eq = peq.get(ch, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | (~(xh | pv) & full)
+            mh = pv & xh
+
+            if ph & last:
+                dist += 1
+            elif mh & last:
+                dist -= 1
+
+            ph = (ph << 1) & full
+            mh = (mh << 1) & full
+            pv = mh | (~(xv | ph) & full)
+            mv = ph & xv
+
+            if dist < best:
+                best = dist
+                if best == 0:
+                    break
+
+        return best if best <= self.typos else None
+
+    def score(self, keys: RowKeys) -> int:
+        """
+        Оценка нечеткого совпадения (ниже любого точного совпадения).
+        """
+        best = None
+        for text in (keys.secid_t, keys.short_t, keys.name_t, keys.emitent_t):
+            dist = self.distance(text)
+            if dist is not None and (best is None or dist < best):
+                best = dist
+
+        return 0 if best is None else 60 - 10 * best
+
+
+def score(keys: RowKeys, q: str, q_t: str) -> int:
+    """
+    Оценка точного соответствия строки запросу.
+
+    :param keys: ключи строки (RowKeys)
+    :param q: нормализованный запрос
+    :param q_t: транслитерированный запрос
+    :return: 0, если строка не подходит
+    """
+    if keys.secid == q or keys.isin == q or keys.secid_t == q_t:
+        return 100
+    if keys.short == q or keys.short_t == q_t:
+        return 90
+    if q in keys.secid or q_t in keys.secid_t:
+        return 80
+    if q in keys.short or q_t in keys.short_t:
+        return 70
+    if q in keys.name or q_t in keys.name_t:
+        return 65
+    if q in keys.emitent or q_t in keys.emitent_t:
+        return 62
+    return 0
+
+
+def rank(
+    rows: list[dict[str, Any]], keys: list[RowKeys], query: str, limit: int = 20
+) -> list[dict[str, Any]]:
+    """
+    Отранжировать строки по запросу, используя предвычисленные ключи.
+
+    Нечеткое сравнение (опечатки) выполняется, только если точных
+    совпадений меньше limit.
+
+    :param rows: строки справочника
+    :param keys: ключи строк (в том же порядке)
+    :param query: строка поиска
+    :param limit: максимальное число результатов
+    """
+    q = normalize(query)
+    q_t = transliterate(q)
+
+    scored = []
+    rest = []
+    for row, k in zip(rows, keys):
+        s = score(k, q, q_t)
+        if s > 0:
+            scored.append((s, row))
+        else:
+            rest.append((row, k))
+
+    if len(scored) < limit and max_typos(q_t):
+        pattern = FuzzyPattern(q_t)
+        for row, k in rest:
+            s = pattern.score(k)
+            if s > 0:
+                scored.append((s, row))
+
+    scored.sort(key=lambda x: (x[0], -len(x[1].get("secid", "") or "")), reverse=True)
+
+    return [r for s, r in scored][:limit]
+
+
+def _ngrams(text: str) -> set[str]:
+    return {text[i : i + NGRAM] for i in range(len(text) - NGRAM + 1)}
+
+
+class SearchIndex:
+    """
+    Локальный полнотекстовый индекс по справочнику инструментов.
+
+    Устройство:
+    - таблица предвычисленных ключей строк (RowKeys);
+    - инвертированный индекс триграмм -> номера строк (для запросов от 3 символов);
+    - отсортированный список ключей для поиска по префиксу (короткие запросы).
+
+    Все ключи приводятся к латинице, поэтому запросы "сбер" и "sber"
+    находят одни и те же строки. Если точных совпадений мало, индекс
+    добавляет кандидатов с опечатками (по числу общих триграмм).
+    """
+
+    def __init__(self, rows: list[dict[str, Any]]):
+        self.rows = rows
+        self.keys = [row_keys(row) for row in rows]
+
+        self._grams: dict[str, list[int]] = {}
+        prefixes: list[tuple[str, int]] = []
+
+        for idx, row in enumerate(rows):
+            grams: set[str] = set()
+
+            for field in INDEXED_FIELDS:
+                key = transliterate(normalize(row.get(field)))
+                if not key:
+                    continue
+
+                grams |= _ngrams(key)
+                prefixes.append((key, idx))
+
+            for gram in grams:
+                self._grams.setdefault(gram, []).append(idx)
+
+        prefixes.sort()
+        self._prefix_keys = [key for key, _ in prefixes]
+        self._prefix_ids = [idx for _, idx in prefixes]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def lookup(self, query: str, limit: int = 20) -> list[int]:
+        """
+        Найти кандидатов для запроса.
+
+        :param query: строка поиска
+        :param limit: сколько результатов нужно; если точных кандидатов меньше,
+            добавляются кандидаты с опечатками
+        :return: номера строк справочника
+        """
+        q = transliterate(normalize(query))
+        if not q:
+            return []
+
+        if len(q) < NGRAM:
+            ids = self._lookup_prefix(q)
+        else:
+            ids = self._lookup_ngrams(q)
+
+            if len(ids) < limit and max_typos(q):
+                ids |= self._lookup_fuzzy(q)
+
+        return sorted(ids)
+
+    def _lookup_prefix(self, q: str) -> set[int]:
+        start = bisect.bisect_left(self._prefix_keys, q)
+        ids = set()
+
+        for pos in range(start, len(self._prefix_keys)):
+            if not self._prefix_keys[pos].startswith(q):
+                break
+            ids.add(self._prefix_ids[pos])
+
+        return ids
+
+    def _lookup_ngrams(self, q: str) -> set[int]:
+        postings = []
+
+        for gram in _ngrams(q):
+            ids = self._grams.get(gram)
+            if ids is None:
+                return set()
+            postings.append(ids)
+
+        # Пересекаем, начиная с самого короткого списка
+        postings.sort(key=len)
+        result = set(postings[0])
+
+        for ids in postings[1:]:
+            result.intersection_update(ids)
+            if not result:
+                break
+
+        return result
+
+    def _lookup_fuzzy(self, q: str) -> set[int]:
+        grams = _ngrams(q)
+
+        # Каждая опечатка портит не больше NGRAM триграмм запроса
+        need = max(1, len(grams) - max_typos(q) * NGRAM)
+
+        counts: Counter[int] = Counter()
+        for gram in grams:
+            counts.update(self._grams.get(gram, ()))
+
+        return {
+            idx
+            for idx, count in counts.most_common(FUZZY_CANDIDATES)
+            if count >= need
+        }
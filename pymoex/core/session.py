@@ -1,10 +1,16 @@
+import asyncio
+import hashlib
 import logging
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import httpx
 
-from pymoex.core.config import MoexSettings
+from pymoex.core.offload import Offloader, loads
 from pymoex.exceptions import MoexAPIError, MoexNetworkError
 
+if TYPE_CHECKING:
+    from pymoex.core.config import MoexSettings
+
 logger = logging.getLogger(__name__)
 
 
@@ -19,11 +25,36 @@ class MoexSession:
     - единый интерфейс для выполнения запросов
 
     Используется всеми сервисами (SharesService, BondsService, SearchService и т.д.).
+
+    Одинаковые GET-запросы (путь + параметры), выполняющиеся одновременно,
+    объединяются: уходит один HTTP-запрос, все вызывающие получают один
+    и тот же разобранный ответ (его нельзя изменять на месте).
+
+    MoexSession.shared() возвращает общую для процесса сессию (один пул
+    соединений на несколько MoexClient).
     """
 
-    def __init__(self):
-        # Загружаем настройки из окружения / .env
-        self.settings = MoexSettings()
+    # Общие сессии: id(settings) -> сессия
+    _shared: ClassVar[dict[int, "MoexSession"]] = {}
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport | None = None,
+        settings: "MoexSettings | None" = None,
+    ):
+        """
+        :param transport: транспорт httpx (например, запись/воспроизведение
+            ответов из pymoex.testing); None — обычные HTTP-запросы
+        :param settings: настройки; None — общие настройки из окружения / .env
+        """
+        if settings is None:
+            # pydantic-settings загружается при создании первой сессии,
+            # а не при импорте клиента
+            from pymoex.core.config import get_settings
+
+            settings = get_settings()
+
+        self.settings = settings
 
         # Создаём асинхронный HTTP-клиент с общими параметрами
         self.client = httpx.AsyncClient(
@@ -32,27 +63,116 @@ class MoexSession:
             headers={
                 "User-Agent": self.settings.user_agent,  # идентификация SDK
             },
+            transport=transport,
+        )
+
+        # Разбор больших ответов вне event loop (offload_threshold)
+        self.offload = Offloader(
+            settings.offload_threshold,
+            settings.offload_executor,
+            settings.offload_workers,
         )
 
+        # Выполняющиеся запросы: (путь, параметры) -> задача
+        self._inflight: dict[tuple, asyncio.Task] = {}
+
+        # Число владельцев общей сессии (см. shared)
+        self._refs = 0
+
+    @classmethod
+    def shared(cls, settings: "MoexSettings | None" = None) -> "MoexSession":
+        """
+        Общая сессия для всех клиентов процесса с этими настройками.
+
+        Каждый вызов должен завершаться close(): HTTP-клиент закрывается,
+        когда сессию закрыл последний владелец. Сессия привязана к event loop,
+        в котором выполняются запросы.
+
+        :param settings: настройки; None — общие настройки из окружения / .env
+        """
+        if settings is None:
+            from pymoex.core.config import get_settings
+
+            settings = get_settings()
+
+        session = cls._shared.get(id(settings))
+        if session is None or session.client.is_closed:
+            session = cls(settings=settings)
+            cls._shared[id(settings)] = session
+            logger.debug(f"Created shared session for {settings.base_url}")
+
+        session._refs += 1
+        return session
+
     async def get(self, path: str, params: dict | None = None) -> dict:
         """
         Выполнить GET-запрос к MOEX ISS API.
 
+        Если такой же запрос уже выполняется, ждет его ответа
+        (настройка coalesce_requests).
+
         :param path: относительный путь (например, '/securities.json')
         :param params: query-параметры запроса
         :return: JSON-ответ, преобразованный в dict
 
         Исключения:
-        - httpx.HTTPStatusError при неуспешном статусе ответа
+        - MoexNetworkError при неуспешном статусе ответа или ошибке сети
+        - MoexAPIError при некорректном JSON
+        """
+        payload = await self.fetch(path, params)
+        return await self.decode(payload)
+
+    async def decode(self, payload: "Payload") -> dict:
+        """
+        Разобранный JSON ответа; большие ответы разбираются в пуле
+        (настройка offload_threshold).
         """
+        if payload._data is None and self.offload.wants(len(payload)):
+            payload._data = await self.offload.run(loads, payload.body)
+        return payload.json()
 
+    async def fetch(self, path: str, params: dict | None = None) -> "Payload":
+        """
+        Выполнить GET-запрос и вернуть тело ответа без разбора JSON.
+
+        Позволяет сравнить ответ с предыдущим по хэшу (Payload.digest)
+        и не разбирать неизменившиеся данные.
+
+        :param path: относительный путь
+        :param params: query-параметры запроса
+        """
+        if not self.settings.coalesce_requests:
+            return await self._get(path, params)
+
+        key = (path, params_key(params))
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(self._get(path, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finished(key, t))
+        else:
+            logger.debug(f"GET {path} joined in-flight request")
+
+        # shield: отмена одного из ожидающих не отменяет общий запрос
+        return await asyncio.shield(task)
+
+    def _finished(self, key: tuple, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        # Ошибка уже передана ожидающим; если их не осталось — не шумим в лог
+        if not task.cancelled():
+            task.exception()
+
+    async def _get(self, path: str, params: dict | None) -> "Payload":
         logger.debug(f"GET {path} params={params}")
 
         try:
             response = await self.client.get(path, params=params)
             response.raise_for_status()
 
-            return response.json()
+            return Payload(response.content)
         except httpx.HTTPStatusError as e:
             # Ошибки 4xx, 5xx
             logger.error(f"HTTP {e.response.status_code} error requesting {path}")
@@ -73,5 +193,53 @@ class MoexSession:
         Корректно закрыть HTTP-сессию.
 
         Вызывается в MoexClient.__aexit__ при выходе из async with.
+        Общая сессия закрывается, когда ее закрыл последний владелец.
         """
+        if self._refs:
+            self._refs -= 1
+            if self._refs:
+                return
+
+            key = id(self.settings)
+            if MoexSession._shared.get(key) is self:
+                del MoexSession._shared[key]
+
         await self.client.aclose()
+        self.offload.close()
+
+
+class Payload:
+    """
+    Тело ответа ISS. JSON разбирается и хэш считается при первом обращении
+    (один раз на ответ, даже если его ждали несколько вызывающих).
+    """
+
+    __slots__ = ("body", "_data", "_digest")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self._data: dict | None = None
+        self._digest: str | None = None
+
+    @property
+    def digest(self) -> str:
+        """Хэш тела ответа (blake2b, 128 бит)."""
+        if self._digest is None:
+            self._digest = hashlib.blake2b(self.body, digest_size=16).hexdigest()
+        return self._digest
+
+    def json(self) -> dict:
+        """Разобранный JSON (общий для всех получателей ответа)."""
+        if self._data is None:
+            self._data = loads(self.body)
+        return self._data
+
+    def __len__(self) -> int:
+        return len(self.body)
+
+
+def params_key(params: dict[str, Any] | None) -> tuple:
+    """Query-параметры в виде ключа (порядок и типы значений не важны)."""
+    if not params:
+        return ()
+    return tuple(sorted((k, str(v)) for k, v in params.items()))
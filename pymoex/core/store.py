@@ -0,0 +1,259 @@
+"""
+Локальное хранилище временных рядов (история торгов, свечи).
+
+Ряд определяется ключом SeriesKey (источник, инструмент, режим торгов,
+интервал). Хранилище помнит первую и последнюю загруженные свечи, поэтому
+при повторной синхронизации из ISS запрашиваются только недостающие
+начало и хвост.
+
+Бэкенды:
+- sqlite  — один файл, только стандартная библиотека (по умолчанию);
+- parquet — файл на ряд, нужен pyarrow (extra parquet).
+
+Методы хранилищ синхронные; сервисы вызывают их через asyncio.to_thread.
+"""
+
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import NamedTuple
+
+from pymoex.models.candles import CANDLE_COLUMNS as COLUMNS
+from pymoex.models.candles import Candles
+from pymoex.models.enums import CandleInterval
+
+logger = logging.getLogger(__name__)
+
+
+class SeriesKey(NamedTuple):
+    """
+    Ключ временного ряда.
+
+    source   — источник данных ('history', 'candles')
+    secid    — торговый код инструмента
+    board    — режим торгов
+    interval — интервал свечей
+    """
+
+    source: str
+    secid: str
+    board: str
+    interval: CandleInterval
+
+
+class SeriesStore(ABC):
+    """
+    Базовый интерфейс хранилища рядов.
+    """
+
+    @abstractmethod
+    def span(self, key: SeriesKey) -> tuple[int, int] | None:
+        """
+        Начала первой и последней сохраненных свечей ряда (секунды)
+        или None, если ряд пуст.
+        """
+
+    def last(self, key: SeriesKey) -> int | None:
+        """
+        Начало последней сохраненной свечи ряда (секунды) или None.
+        """
+        span = self.span(key)
+        return span[1] if span else None
+
+    @abstractmethod
+    def read(
+        self, key: SeriesKey, since: int | None = None, till: int | None = None
+    ) -> Candles:
+        """
+        Свечи ряда, начавшиеся в интервале [since, till].
+        """
+
+    @abstractmethod
+    def write(self, key: SeriesKey, candles: Candles) -> None:
+        """
+        Записать свечи в ряд (в начало, в конец или поверх сохраненных).
+        Свечи с тем же началом перезаписываются (последняя свеча могла
+        быть загружена незавершенной).
+        """
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteStore(SeriesStore):
+    """
+    Хранилище рядов в одном файле SQLite.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Соединение используется из потоков asyncio.to_thread
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS series (
+                    source TEXT NOT NULL,
+                    secid TEXT NOT NULL,
+                    board TEXT NOT NULL,
+                    interval INTEGER NOT NULL,
+                    "begin" INTEGER NOT NULL,
+                    "end" INTEGER NOT NULL,
+                    open REAL, high REAL, low REAL, close REAL,
+                    value REAL, volume REAL,
+                    PRIMARY KEY (source, secid, board, interval, "begin")
+                ) WITHOUT ROWID
+                """
+            )
+
+    def span(self, key: SeriesKey) -> tuple[int, int] | None:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT MIN("begin"), MAX("begin") FROM series '
+                "WHERE source = ? AND secid = ? AND board = ? AND interval = ?",
+                self._params(key),
+            ).fetchone()
+        return (row[0], row[1]) if row[0] is not None else None
+
+    def read(
+        self, key: SeriesKey, since: int | None = None, till: int | None = None
+    ) -> Candles:
+        query = (
+            'SELECT "begin", "end", open, high, low, close, value, volume '
+            "FROM series "
+            "WHERE source = ? AND secid = ? AND board = ? AND interval = ?"
+        )
+        params: list = list(self._params(key))
+        if since is not None:
+            query += ' AND "begin" >= ?'
+            params.append(since)
+        if till is not None:
+            query += ' AND "begin" <= ?'
+            params.append(till)
+        query += ' ORDER BY "begin"'
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return Candles.from_rows(key.interval, rows)
+
+    def write(self, key: SeriesKey, candles: Candles) -> None:
+        if not len(candles):
+            return
+
+        prefix = self._params(key)
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO series VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (prefix + row for row in candles.rows()),
+            )
+
+        logger.debug(f"Stored {len(candles)} rows for {key}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _params(key: SeriesKey) -> tuple:
+        return key.source, key.secid, key.board, int(key.interval)
+
+
+class ParquetStore(SeriesStore):
+    """
+    Хранилище рядов в файлах Parquet, по файлу на ряд:
+    {root}/{source}/{board}/{secid}_{interval}.parquet.
+
+    Новые свечи объединяются с сохраненными перезаписью файла ряда
+    (через временный файл).
+    """
+
+    def __init__(self, root: Path):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as e:  # pragma: no cover
+            raise ImportError(
+                "Parquet store requires pyarrow: uv add 'pymoex[parquet]'"
+            ) from e
+
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    def span(self, key: SeriesKey) -> tuple[int, int] | None:
+        candles = self.read(key)
+        return (candles.begin[0], candles.begin[-1]) if len(candles) else None
+
+    def read(
+        self, key: SeriesKey, since: int | None = None, till: int | None = None
+    ) -> Candles:
+        with self._lock:
+            candles = self._load(key)
+        return candles.between(since, till)
+
+    def write(self, key: SeriesKey, candles: Candles) -> None:
+        if not len(candles):
+            return
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        with self._lock:
+            # Сохраненные свечи вне нового куска + новый кусок, по времени
+            new = set(candles.begin)
+            rows = [r for r in self._load(key).rows() if r[0] not in new]
+            rows.extend(candles.rows())
+            rows.sort(key=lambda r: r[0])
+            merged = Candles.from_rows(key.interval, rows)
+
+            types = [pa.int64()] * 2 + [pa.float64()] * 6
+            table = pa.table(
+                {
+                    name: pa.array(column, type_)
+                    for name, column, type_ in zip(COLUMNS, merged.arrays(), types)
+                }
+            )
+
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            pq.write_table(table, tmp)
+            tmp.replace(path)
+
+        logger.debug(f"Stored {len(candles)} rows for {key}")
+
+    def _load(self, key: SeriesKey) -> Candles:
+        import pyarrow.parquet as pq
+
+        path = self._path(key)
+        if not path.exists():
+            return Candles(key.interval)
+
+        table = pq.read_table(path, columns=list(COLUMNS))
+        columns = [table.column(name).to_pylist() for name in COLUMNS]
+        return Candles.from_rows(key.interval, zip(*columns))
+
+    def _path(self, key: SeriesKey) -> Path:
+        interval = CandleInterval(key.interval)
+        name = f"{key.secid}_{interval.value}.parquet"
+        return self.root / key.source / key.board / name
+
+
+def open_store(backend: str, path: Path) -> SeriesStore:
+    """
+    Открыть хранилище рядов.
+
+    :param backend: 'sqlite' или 'parquet'
+    :param path: файл базы SQLite или каталог файлов Parquet
+    """
+    backend = backend.lower()
+    if backend == "sqlite":
+        return SqliteStore(path)
+    if backend == "parquet":
+        return ParquetStore(path)
+    raise ValueError(f"Unknown series store backend: {backend!r}")
@@ -8,11 +8,14 @@ class BaseInstrument(BaseModel):
     Общие настройки:
     - принимает алиасы MOEX
     - игнорирует лишние поля
+    - схема и валидатор строятся при первом использовании модели
+      (defer_build), а не при импорте
     """
 
     model_config = ConfigDict(
         populate_by_name=True,
         extra="ignore",
+        defer_build=True,
     )
 
     def __str__(self) -> str:
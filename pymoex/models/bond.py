@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Optional
+from typing import ClassVar, Optional
 
 from pydantic import Field, computed_field, model_validator
 
@@ -22,6 +22,13 @@ class Bond(BaseInstrument):
     - опционные события (оферты, выкуп)
     """
 
+    # Пустые колонки ISS и колонки, из которых берется замена
+    # (используется валидатором и экспортом в Arrow)
+    column_fallbacks: ClassVar[dict[str, tuple[str, ...]]] = {
+        "LAST": ("PREVLEGALCLOSEPRICE", "PREVWAPRICE"),
+        "EFFECTIVEYIELD": ("YIELD",),
+    }
+
     # --- Идентификация инструмента ---
     sec_id: str = Field(
         alias="SECID",
@@ -131,6 +138,11 @@ class Bond(BaseInstrument):
     list_level: MoexInt = Field(
         None, alias="LISTLEVEL", description="Уровень листинга на бирже"
     )
+    trading_status: Optional[str] = Field(
+        None,
+        alias="TRADINGSTATUS",
+        description="Статус торгов в режиме (T — идут торги)",
+    )
     status: Optional[str] = Field(
         None,
         alias="STATUS",
@@ -205,11 +217,16 @@ class Bond(BaseInstrument):
         Если нет цены сделки (LAST), ищем цену закрытия или предыдущего дня.
         """
 
-        if not data.get("LAST"):
-            data["LAST"] = data.get("PREVLEGALCLOSEPRICE") or data.get("PREVWAPRICE")
+        for column, sources in cls.column_fallbacks.items():
+            if data.get(column):
+                continue
 
-        if not data.get("EFFECTIVEYIELD"):
-            data["EFFECTIVEYIELD"] = data.get("YIELD")
+            value = None
+            for source in sources:
+                value = data.get(source)
+                if value:
+                    break
+            data[column] = value
 
         return data
 
@@ -0,0 +1,125 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Optional
+
+from pymoex.utils.types import parse_int, safe_date
+
+# Время в расписании ISS — московское (UTC+3, без перехода на летнее время)
+MSK = timezone(timedelta(hours=3), "MSK")
+
+# На сколько дней вперед искать ближайшее открытие торгов
+LOOKAHEAD_DAYS = 14
+
+
+def _time(value: str | None) -> Optional[time]:
+    try:
+        return time.fromisoformat(value) if value else None
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True, frozen=True)
+class TradingHours:
+    """
+    Торговый день движка: рабочий ли день и время начала/окончания торгов.
+    """
+
+    is_work_day: bool
+    start: Optional[time] = None
+    stop: Optional[time] = None
+
+    @classmethod
+    def from_row(cls, row: dict[str, Any]) -> "TradingHours":
+        return cls(
+            is_work_day=bool(parse_int(row.get("is_work_day"))),
+            start=_time(row.get("start_time")),
+            stop=_time(row.get("stop_time")),
+        )
+
+
+@dataclass(slots=True)
+class TradingCalendar:
+    """
+    Расписание торгов движка ISS (stock, currency, futures).
+
+    Строится по блокам timetable (типовая неделя) и dailytable (праздники
+    и перенесенные рабочие дни) ответа /engines/{engine}.json.
+    Пустое расписание (не удалось загрузить) считает торги открытыми.
+
+    Пример:
+        calendar.is_open(datetime.now(MSK))
+        calendar.next_open(datetime.now(MSK))
+    """
+
+    engine: str
+    # ISO-день недели (1 — понедельник) -> часы торгов
+    weekly: dict[int, TradingHours] = field(default_factory=dict)
+    # Исключения из типовой недели
+    daily: dict[date, TradingHours] = field(default_factory=dict)
+
+    @classmethod
+    def from_rows(
+        cls,
+        engine: str,
+        timetable: list[dict[str, Any]],
+        dailytable: list[dict[str, Any]],
+    ) -> "TradingCalendar":
+        weekly = {}
+        for row in timetable:
+            week_day = parse_int(row.get("week_day"))
+            if week_day is not None:
+                weekly[week_day] = TradingHours.from_row(row)
+
+        daily = {}
+        for row in dailytable:
+            day = safe_date(row.get("date"))
+            if day is not None:
+                daily[day] = TradingHours.from_row(row)
+
+        return cls(engine, weekly, daily)
+
+    def __bool__(self) -> bool:
+        return bool(self.weekly)
+
+    def hours(self, day: date) -> Optional[TradingHours]:
+        """Часы торгов в день day (с учетом исключений)."""
+        return self.daily.get(day) or self.weekly.get(day.isoweekday())
+
+    def is_open(self, at: datetime) -> bool:
+        """
+        Идут ли торги в момент at.
+
+        :param at: момент времени (с часовым поясом)
+        """
+        if not self:
+            return True
+
+        at = at.astimezone(MSK)
+        hours = self.hours(at.date())
+        if hours is None or not hours.is_work_day or not hours.start:
+            return False
+
+        return hours.start <= at.time() < (hours.stop or time.max)
+
+    def next_open(self, at: datetime) -> Optional[datetime]:
+        """
+        Ближайшее начало торгов после at или None, если оно неизвестно.
+
+        :param at: момент времени (с часовым поясом)
+        """
+        at = at.astimezone(MSK)
+
+        for offset in range(LOOKAHEAD_DAYS):
+            day = at.date() + timedelta(days=offset)
+            hours = self.hours(day)
+            if hours is None or not hours.is_work_day or not hours.start:
+                continue
+
+            start = datetime.combine(day, hours.start, MSK)
+            if start > at:
+                return start
+
+        return None
+
+
+__all__ = ["MSK", "TradingCalendar", "TradingHours"]
@@ -0,0 +1,371 @@
+import bisect
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Iterable, Iterator, NamedTuple
+
+from .enums import CandleInterval
+
+# Начало отсчета меток времени (время биржи, без часового пояса)
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_DAY = 86400
+
+# Из каких интервалов можно локально собрать интервал (от крупного к мелкому)
+RESAMPLE_SOURCES: dict[CandleInterval, tuple[CandleInterval, ...]] = {
+    CandleInterval.MINUTE_10: (CandleInterval.MINUTE_1,),
+    CandleInterval.HOUR_1: (CandleInterval.MINUTE_10, CandleInterval.MINUTE_1),
+    CandleInterval.DAY_1: (
+        CandleInterval.HOUR_1,
+        CandleInterval.MINUTE_10,
+        CandleInterval.MINUTE_1,
+    ),
+    CandleInterval.WEEK_1: (CandleInterval.DAY_1, CandleInterval.HOUR_1),
+    CandleInterval.MONTH_1: (CandleInterval.DAY_1, CandleInterval.HOUR_1),
+    CandleInterval.QUARTER_1: (
+        CandleInterval.MONTH_1,
+        CandleInterval.DAY_1,
+        CandleInterval.HOUR_1,
+    ),
+}
+
+
+def to_timestamp(value: str | datetime) -> int:
+    """Строка времени ISS ('2024-01-10 10:00:00') -> секунды от 1970-01-01."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return int((value - _EPOCH).total_seconds())
+
+
+def from_timestamp(ts: int) -> datetime:
+    """Секунды от 1970-01-01 -> datetime (время биржи)."""
+    return _EPOCH + timedelta(seconds=ts)
+
+
+def _month_start(ts: int) -> int:
+    d = date.fromordinal(ts // _DAY + _EPOCH_ORDINAL)
+    return (date(d.year, d.month, 1).toordinal() - _EPOCH_ORDINAL) * _DAY
+
+
+def _quarter_start(ts: int) -> int:
+    d = date.fromordinal(ts // _DAY + _EPOCH_ORDINAL)
+    month = (d.month - 1) // 3 * 3 + 1
+    return (date(d.year, month, 1).toordinal() - _EPOCH_ORDINAL) * _DAY
+
+
+def _week_start(ts: int) -> int:
+    days = ts // _DAY
+    # 1970-01-01 — четверг, понедельник получается сдвигом на (days + 3) % 7
+    return (days - (days + 3) % 7) * _DAY
+
+
+def _bucket_function(interval: CandleInterval) -> Callable[[int], int]:
+    if interval == CandleInterval.MINUTE_10:
+        return lambda ts: ts - ts % 600
+    if interval == CandleInterval.HOUR_1:
+        return lambda ts: ts - ts % 3600
+    if interval == CandleInterval.DAY_1:
+        return lambda ts: ts - ts % _DAY
+    if interval == CandleInterval.WEEK_1:
+        return _week_start
+    if interval == CandleInterval.MONTH_1:
+        return _month_start
+    if interval == CandleInterval.QUARTER_1:
+        return _quarter_start
+    raise ValueError(f"Cannot resample to interval {interval!r}")
+
+
+def _numpy():
+    """numpy, если установлен extra analytics (иначе None)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _np_buckets(np, begin, interval: CandleInterval):
+    """Начала периодов для массива меток времени (векторно)."""
+    if interval == CandleInterval.MINUTE_10:
+        return begin - begin % 600
+    if interval == CandleInterval.HOUR_1:
+        return begin - begin % 3600
+    if interval == CandleInterval.DAY_1:
+        return begin - begin % _DAY
+    if interval == CandleInterval.WEEK_1:
+        days = begin // _DAY
+        return (days - (days + 3) % 7) * _DAY
+    if interval in (CandleInterval.MONTH_1, CandleInterval.QUARTER_1):
+        months = begin.astype("datetime64[s]").astype("datetime64[M]").astype(np.int64)
+        if interval == CandleInterval.QUARTER_1:
+            months -= months % 3
+        return months.astype("datetime64[M]").astype("datetime64[s]").astype(np.int64)
+    raise ValueError(f"Cannot resample to interval {interval!r}")
+
+
+def _known(values: array) -> list[float]:
+    return [v for v in values if not math.isnan(v)]
+
+
+# Колонки в порядке Candles.rows() / Candles.arrays()
+CANDLE_COLUMNS = ("begin", "end", "open", "high", "low", "close", "value", "volume")
+
+
+class Candle(NamedTuple):
+    """Одна свеча."""
+
+    begin: datetime
+    end: datetime
+    open: float
+    high: float
+    low: float
+    close: float
+    value: float
+    volume: float
+
+
+@dataclass(slots=True)
+class Candles:
+    """
+    Свечи инструмента в колоночном виде.
+
+    Каждая колонка — отдельный массив (array): метки времени в секундах
+    от 1970-01-01 по времени биржи, цены и объемы — float.
+    Отсутствующие в ответе ISS значения хранятся как NaN.
+    """
+
+    interval: CandleInterval
+    begin: array = field(default_factory=lambda: array("q"))
+    end: array = field(default_factory=lambda: array("q"))
+    open: array = field(default_factory=lambda: array("d"))
+    high: array = field(default_factory=lambda: array("d"))
+    low: array = field(default_factory=lambda: array("d"))
+    close: array = field(default_factory=lambda: array("d"))
+    value: array = field(default_factory=lambda: array("d"))
+    volume: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.begin)
+
+    def __iter__(self) -> Iterator[Candle]:
+        for i in range(len(self.begin)):
+            yield Candle(
+                from_timestamp(self.begin[i]),
+                from_timestamp(self.end[i]),
+                self.open[i],
+                self.high[i],
+                self.low[i],
+                self.close[i],
+                self.value[i],
+                self.volume[i],
+            )
+
+    @classmethod
+    def from_rows(cls, interval: CandleInterval, rows: Iterable[tuple]) -> "Candles":
+        """
+        Собрать свечи из строк (begin, end, open, high, low, close, value, volume),
+        где begin и end — метки времени в секундах (см. rows()).
+        None в ценах и объемах (NULL в SQLite) становится NaN.
+        """
+        candles = cls(CandleInterval(interval))
+        columns = candles.arrays()
+        for row in rows:
+            for target, value in zip(columns, row):
+                target.append(math.nan if value is None else value)
+        return candles
+
+    def rows(self) -> Iterator[tuple]:
+        """
+        Строки (begin, end, open, high, low, close, value, volume)
+        с метками времени в секундах.
+        """
+        return zip(*self.arrays())
+
+    def between(self, since: int | None = None, till: int | None = None) -> "Candles":
+        """
+        Свечи, начавшиеся в интервале [since, till] (метки времени в секундах).
+        """
+        start = bisect.bisect_left(self.begin, since) if since is not None else 0
+        end = (
+            bisect.bisect_right(self.begin, till) if till is not None else len(self)
+        )
+        out = Candles(self.interval)
+        for target, source in zip(out.arrays(), self.arrays()):
+            target.extend(source[start:end])
+        return out
+
+    def arrays(self) -> tuple[array, ...]:
+        """Колонки-массивы в порядке rows()."""
+        return (
+            self.begin,
+            self.end,
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.value,
+            self.volume,
+        )
+
+    def extend(self, block: dict[str, Any]) -> int:
+        """
+        Дописать строки блока candles ответа ISS в колонки.
+
+        :param block: блок {"columns": [...], "data": [...]}
+        :return: количество добавленных строк
+        """
+        columns = block.get("columns", [])
+        rows = block.get("data", [])
+        if not rows:
+            return 0
+
+        pos = {name: i for i, name in enumerate(columns)}
+        for name, target in (
+            ("open", self.open),
+            ("high", self.high),
+            ("low", self.low),
+            ("close", self.close),
+            ("value", self.value),
+            ("volume", self.volume),
+        ):
+            i = pos[name]
+            target.extend(float(r[i]) if r[i] is not None else math.nan for r in rows)
+
+        b, e = pos["begin"], pos["end"]
+        self.begin.extend(to_timestamp(r[b]) for r in rows)
+        self.end.extend(to_timestamp(r[e]) for r in rows)
+
+        return len(rows)
+
+    def resample(self, interval: CandleInterval) -> "Candles":
+        """
+        Собрать свечи более крупного интервала.
+
+        open — первая свеча периода, close — последняя, high/low — экстремумы,
+        value и volume суммируются. begin — начало периода (для 10 минут,
+        часа, дня, недели, месяца, квартала), end — конец последней свечи.
+        Значения NaN пропускаются; если в периоде нет ни одного значения
+        колонки, результат — NaN.
+
+        С numpy (extra analytics) периоды считаются векторно,
+        без него — циклом по строкам.
+
+        :param interval: целевой интервал
+        """
+        interval = CandleInterval(interval)
+        if self.interval not in RESAMPLE_SOURCES.get(interval, ()):
+            raise ValueError(f"Cannot resample {self.interval.name} to {interval.name}")
+
+        np = _numpy()
+        if np is None:
+            return self._resample_rows(interval)
+        return self._resample_numpy(np, interval)
+
+    def _resample_numpy(self, np, interval: CandleInterval) -> "Candles":
+        out = Candles(interval)
+        n = len(self.begin)
+        if not n:
+            return out
+
+        begin = np.frombuffer(self.begin, dtype=np.int64)
+        keys = _np_buckets(np, begin, interval)
+
+        # Границы групп: строки, с которых начинается новый период
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        ends = np.r_[starts[1:], n] - 1
+        rows = np.arange(n)
+
+        def column(values: array):
+            return np.frombuffer(values, dtype=np.float64)
+
+        def first(values):
+            idx = np.minimum.reduceat(np.where(np.isnan(values), n, rows), starts)
+            return np.where(idx < n, values[np.minimum(idx, n - 1)], np.nan)
+
+        def last(values):
+            idx = np.maximum.reduceat(np.where(np.isnan(values), -1, rows), starts)
+            return np.where(idx >= 0, values[idx], np.nan)
+
+        def total(values):
+            known = ~np.isnan(values)
+            sums = np.add.reduceat(np.where(known, values, 0.0), starts)
+            return np.where(np.add.reduceat(known, starts) > 0, sums, np.nan)
+
+        end = np.frombuffer(self.end, dtype=np.int64)
+        for target, result in (
+            (out.begin, keys[starts]),
+            (out.end, end[ends]),
+            (out.open, first(column(self.open))),
+            # fmax/fmin пропускают NaN (NaN — только если вся группа NaN)
+            (out.high, np.fmax.reduceat(column(self.high), starts)),
+            (out.low, np.fmin.reduceat(column(self.low), starts)),
+            (out.close, last(column(self.close))),
+            (out.value, total(column(self.value))),
+            (out.volume, total(column(self.volume))),
+        ):
+            target.frombytes(result.astype(target.typecode).tobytes())
+
+        return out
+
+    def _resample_rows(self, interval: CandleInterval) -> "Candles":
+        bucket = _bucket_function(interval)
+        out = Candles(interval)
+
+        n = len(self.begin)
+        i = 0
+        while i < n:
+            key = bucket(self.begin[i])
+            j = i + 1
+            while j < n and bucket(self.begin[j]) == key:
+                j += 1
+
+            opens = _known(self.open[i:j])
+            closes = _known(self.close[i:j])
+            highs = _known(self.high[i:j])
+            lows = _known(self.low[i:j])
+            values = _known(self.value[i:j])
+            volumes = _known(self.volume[i:j])
+
+            out.begin.append(key)
+            out.end.append(self.end[j - 1])
+            out.open.append(opens[0] if opens else math.nan)
+            out.close.append(closes[-1] if closes else math.nan)
+            out.high.append(max(highs, default=math.nan))
+            out.low.append(min(lows, default=math.nan))
+            out.value.append(sum(values) if values else math.nan)
+            out.volume.append(sum(volumes) if volumes else math.nan)
+
+            i = j
+
+        return out
+
+    def to_arrow(self):
+        """
+        Свечи в виде pyarrow.Table (нужен extra parquet).
+
+        Колонки передаются в Arrow без копирования: begin и end —
+        timestamp[s] (время биржи), остальные — float64.
+        """
+        from pymoex.utils.arrow import columns_to_arrow
+
+        return columns_to_arrow(
+            dict(zip(CANDLE_COLUMNS, self.arrays())), timestamps=("begin", "end")
+        )
+
+    def to_parquet(self, path, **kwargs) -> None:
+        """
+        Сохранить свечи в Parquet.
+
+        :param path: путь к файлу
+        :param kwargs: параметры pyarrow.parquet.write_table
+        """
+        from pymoex.utils.arrow import write_parquet
+
+        write_parquet(self.to_arrow(), path, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<Candles {self.interval.name} | rows={len(self)}>"
+
+
+__all__ = ["Candle", "Candles"]
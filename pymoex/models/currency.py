@@ -0,0 +1,185 @@
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from pydantic import Field, computed_field
+
+from pymoex.utils.types import MoexDate, MoexDecimal, MoexInt
+
+from .base import BaseInstrument
+
+# Коды валют ISS, которые означают рубль
+RUB_ALIASES = {"RUB", "SUR", "RUR"}
+
+# Сроки расчетов, котировки которых — курсы (по убыванию приоритета).
+# Свопы (_TODTOM, _TOMSPT) и форварды котируются в пунктах, а не ценой
+RATE_SETTLEMENTS = ("TOM", "TOD")
+
+
+def normalize_currency(code: str) -> str:
+    """Код валюты в верхнем регистре, SUR/RUR -> RUB."""
+    code = code.strip().upper()
+    return "RUB" if code in RUB_ALIASES else code
+
+
+class CurrencyPair(BaseInstrument):
+    """
+    Валютная пара или драгоценный металл валютного рынка (SELT).
+
+    Пример:
+        CurrencyPair(SECID="USD000UTSTOM", SHORTNAME="USDRUB_TOM",
+                     FACEUNIT="USD", CURRENCYID="RUB", LAST=91.5)
+    """
+
+    # --- Идентификация ---
+    sec_id: str = Field(alias="SECID", description="Торговый код (SECID)")
+    short_name: str = Field(alias="SHORTNAME", description="Краткое название")
+    name: Optional[str] = Field(None, alias="SECNAME", description="Полное название")
+    board_id: Optional[str] = Field(None, alias="BOARDID", description="Код площадки")
+    base_currency: Optional[str] = Field(
+        None, alias="FACEUNIT", description="Базовая валюта (или металл)"
+    )
+    quote_currency: Optional[str] = Field(
+        None, alias="CURRENCYID", description="Валюта котировки"
+    )
+
+    # --- Цены ---
+    last_price: MoexDecimal = Field(None, alias="LAST", description="Последняя цена")
+    weighted_price: MoexDecimal = Field(
+        None, alias="WAPRICE", description="Средневзвешенная цена"
+    )
+    bid: MoexDecimal = Field(None, alias="BID", description="Лучшая цена покупки")
+    offer: MoexDecimal = Field(None, alias="OFFER", description="Лучшая цена продажи")
+    prev_price: MoexDecimal = Field(
+        None, alias="PREVPRICE", description="Последняя цена предыдущего дня"
+    )
+    prev_weighted_price: MoexDecimal = Field(
+        None, alias="PREVWAPRICE", description="Средневзвешенная цена предыдущего дня"
+    )
+
+    # --- Параметры ---
+    face_value: MoexDecimal = Field(
+        None, alias="FACEVALUE", description="Количество базовой валюты в котировке"
+    )
+    lot_size: MoexInt = Field(None, alias="LOTSIZE", description="Размер лота")
+    min_step: MoexDecimal = Field(None, alias="MINSTEP", description="Шаг цены")
+    settle_date: MoexDate = Field(None, alias="SETTLEDATE", description="Дата расчетов")
+    volume_today: MoexInt = Field(None, alias="VOLTODAY", description="Объем торгов")
+    value_today: MoexDecimal = Field(
+        None, alias="VALTODAY", description="Объем торгов в рублях"
+    )
+
+    # --- Computed ---
+    @computed_field
+    @property
+    def rate(self) -> Optional[Decimal]:
+        """
+        Курс за единицу базовой валюты: последняя сделка, средневзвешенная
+        цена или цены предыдущего дня.
+        """
+        price = (
+            self.last_price
+            or self.weighted_price
+            or self.prev_weighted_price
+            or self.prev_price
+        )
+        if price is None:
+            return None
+
+        return price / (self.face_value or Decimal(1))
+
+    def __repr__(self) -> str:
+        return f"<CurrencyPair {self.short_name} | rate={self.rate}>"
+
+
+class CrossRates:
+    """
+    Таблица курсов валют к рублю для локального пересчета.
+
+    Строится один раз по снимку валютного рынка: прямые пары X/RUB, затем
+    кросс-пары X/Y, где курс Y уже известен. Учитываются только инструменты
+    с расчетами _TOM и _TOD (T+1 предпочтительнее); свопы и форварды
+    пропускаются.
+
+    Пример:
+        rates = await client.fx_rates()
+        rates.convert(1000, "USD")          # в рублях
+        rates.convert(1000, "EUR", "CNY")   # кросс-курс
+    """
+
+    def __init__(self, pairs: Iterable[CurrencyPair]):
+        """
+        :param pairs: валютные пары (список или Snapshot)
+        """
+        direct: dict[str, tuple[int, Decimal]] = {}
+        cross: list[tuple[int, str, str, Decimal]] = []
+
+        for pair in pairs:
+            rate = pair.rate
+            if not rate or not pair.base_currency or not pair.quote_currency:
+                continue
+
+            settlement = pair.short_name.upper().rpartition("_")[2]
+            if settlement not in RATE_SETTLEMENTS:
+                continue
+
+            base = normalize_currency(pair.base_currency)
+            quote = normalize_currency(pair.quote_currency)
+            priority = RATE_SETTLEMENTS.index(settlement)
+
+            if quote == "RUB":
+                if base not in direct or priority < direct[base][0]:
+                    direct[base] = (priority, rate)
+            else:
+                cross.append((priority, base, quote, rate))
+
+        self._to_rub: dict[str, Decimal] = {"RUB": Decimal(1)}
+        self._to_rub.update({c: r for c, (_, r) in direct.items()})
+
+        # Кросс-курсы: только для валют без прямой пары к рублю
+        for _, base, quote, rate in sorted(cross):
+            if base not in self._to_rub and quote in self._to_rub:
+                self._to_rub[base] = rate * self._to_rub[quote]
+
+    def __contains__(self, currency: str) -> bool:
+        return normalize_currency(currency) in self._to_rub
+
+    def __len__(self) -> int:
+        return len(self._to_rub)
+
+    def to_rub(self, currency: str) -> Decimal:
+        """
+        Курс валюты к рублю.
+
+        :raises KeyError: курс неизвестен
+        """
+        code = normalize_currency(currency)
+        try:
+            return self._to_rub[code]
+        except KeyError:
+            raise KeyError(f"No RUB rate for currency {currency!r}") from None
+
+    def rate(self, base: str, quote: str = "RUB") -> Decimal:
+        """Курс base/quote (сколько quote за единицу base)."""
+        return self.to_rub(base) / self.to_rub(quote)
+
+    def convert(
+        self, amount: Decimal | float | int, currency: str, to: str = "RUB"
+    ) -> Decimal:
+        """
+        Пересчитать сумму из currency в to.
+
+        :param amount: сумма
+        :param currency: исходная валюта (SUR/RUR считаются рублем)
+        :param to: целевая валюта
+        """
+        return Decimal(str(amount)) * self.rate(currency, to)
+
+    def as_dict(self) -> dict[str, Decimal]:
+        """Курсы всех известных валют к рублю."""
+        return dict(self._to_rub)
+
+    def __repr__(self) -> str:
+        return f"<CrossRates currencies={len(self)}>"
+
+
+__all__ = ["CurrencyPair", "CrossRates", "normalize_currency"]
@@ -12,3 +12,20 @@ class InstrumentType(str, Enum):
 
     SHARE = "share"
     BOND = "bond"
+
+
+class CandleInterval(int, Enum):
+    """
+    Интервал свечей ISS (значение параметра interval).
+
+    - MINUTE_1, MINUTE_10, HOUR_1 — внутридневные
+    - DAY_1, WEEK_1, MONTH_1, QUARTER_1 — дневные и старше
+    """
+
+    MINUTE_1 = 1
+    MINUTE_10 = 10
+    HOUR_1 = 60
+    DAY_1 = 24
+    WEEK_1 = 7
+    MONTH_1 = 31
+    QUARTER_1 = 4
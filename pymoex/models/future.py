@@ -0,0 +1,140 @@
+from decimal import Decimal
+from typing import Optional
+
+from pydantic import Field, computed_field
+
+from pymoex.utils.types import MoexDate, MoexDecimal, MoexInt
+
+from .base import BaseInstrument
+
+
+class Future(BaseInstrument):
+    """
+    Фьючерсный контракт срочного рынка (FORTS).
+
+    Содержит:
+    - идентификацию контракта и базовый актив
+    - даты исполнения
+    - расчетные цены и открытый интерес
+    - параметры контракта (лот, шаг цены, ГО)
+
+    Пример:
+        Future(SECID="SiH4", SHORTNAME="Si-3.24", ASSETCODE="Si", LAST=91000)
+    """
+
+    # --- Идентификация ---
+    sec_id: str = Field(alias="SECID", description="Код контракта (SECID)")
+    short_name: str = Field(alias="SHORTNAME", description="Краткое название")
+    name: Optional[str] = Field(None, alias="SECNAME", description="Полное название")
+    asset_code: Optional[str] = Field(
+        None, alias="ASSETCODE", description="Код базового актива"
+    )
+    sec_type: Optional[str] = Field(None, alias="SECTYPE", description="Тип контракта")
+    board_id: Optional[str] = Field(None, alias="BOARDID", description="Код площадки")
+
+    # --- Исполнение ---
+    last_trade_date: MoexDate = Field(
+        None, alias="LASTTRADEDATE", description="Последний день торгов"
+    )
+    last_del_date: MoexDate = Field(
+        None, alias="LASTDELDATE", description="Дата исполнения контракта"
+    )
+
+    # --- Цены ---
+    last_price: MoexDecimal = Field(
+        None, alias="LAST", description="Последняя цена сделки"
+    )
+    bid: MoexDecimal = Field(None, alias="BID", description="Лучшая цена покупки")
+    offer: MoexDecimal = Field(None, alias="OFFER", description="Лучшая цена продажи")
+    open_price: MoexDecimal = Field(None, alias="OPEN", description="Цена открытия")
+    high_price: MoexDecimal = Field(None, alias="HIGH", description="Максимальная цена")
+    low_price: MoexDecimal = Field(None, alias="LOW", description="Минимальная цена")
+    settle_price: MoexDecimal = Field(
+        None, alias="SETTLEPRICE", description="Текущая расчетная цена"
+    )
+    prev_settle_price: MoexDecimal = Field(
+        None, alias="PREVSETTLEPRICE", description="Расчетная цена предыдущего дня"
+    )
+
+    # --- Открытый интерес и объемы ---
+    open_position: MoexInt = Field(
+        None, alias="OPENPOSITION", description="Открытый интерес, контрактов"
+    )
+    prev_open_position: MoexInt = Field(
+        None, alias="PREVOPENPOSITION", description="Открытый интерес предыдущего дня"
+    )
+    volume_today: MoexInt = Field(
+        None, alias="VOLTODAY", description="Объем торгов в контрактах"
+    )
+    value_today: MoexDecimal = Field(
+        None, alias="VALTODAY", description="Объем торгов в рублях"
+    )
+    num_trades: MoexInt = Field(
+        None, alias="NUMTRADES", description="Количество сделок"
+    )
+
+    # --- Параметры контракта ---
+    lot_volume: MoexInt = Field(
+        None, alias="LOTVOLUME", description="Количество базового актива в лоте"
+    )
+    min_step: MoexDecimal = Field(None, alias="MINSTEP", description="Шаг цены")
+    step_price: MoexDecimal = Field(
+        None, alias="STEPPRICE", description="Стоимость шага цены, руб"
+    )
+    initial_margin: MoexDecimal = Field(
+        None, alias="INITIALMARGIN", description="Гарантийное обеспечение, руб"
+    )
+    decimals: MoexInt = Field(
+        None, alias="DECIMALS", description="Знаков после запятой"
+    )
+
+    # --- Computed ---
+    @computed_field
+    @property
+    def reference_price(self) -> Optional[Decimal]:
+        """Цена для оценки контракта: сделка, затем расчетная цена."""
+        return self.last_price or self.settle_price or self.prev_settle_price
+
+    # --- Repr ---
+    def __repr__(self) -> str:
+        parts = [self.sec_id]
+
+        if self.last_trade_date:
+            parts.append(f"exp={self.last_trade_date}")
+
+        if self.reference_price is not None:
+            parts.append(f"price={self.reference_price}")
+
+        if self.open_position is not None:
+            parts.append(f"oi={self.open_position}")
+
+        return f"<Future {' | '.join(parts)}>"
+
+
+class Option(Future):
+    """
+    Опцион срочного рынка (FORTS).
+
+    Пример:
+        Option(SECID="Si91000BC4", SHORTNAME="Si-3.24M140324CA91000",
+               OPTIONTYPE="C", STRIKE=91000)
+    """
+
+    option_type: Optional[str] = Field(
+        None, alias="OPTIONTYPE", description="Тип опциона: C — колл, P — пут"
+    )
+    strike: MoexDecimal = Field(None, alias="STRIKE", description="Цена исполнения")
+    underlying_asset: Optional[str] = Field(
+        None, alias="UNDERLYINGASSET", description="Базовый фьючерс"
+    )
+    underlying_settle_price: MoexDecimal = Field(
+        None,
+        alias="UNDERLYINGSETTLEPRICE",
+        description="Расчетная цена базового актива",
+    )
+
+    def __repr__(self) -> str:
+        return f"<Option {self.sec_id} | {self.option_type} {self.strike}>"
+
+
+__all__ = ["Future", "Option"]
@@ -0,0 +1,78 @@
+from decimal import Decimal
+from typing import Generic, Iterator, Optional, TypeVar
+
+from pydantic import Field
+
+from pymoex.utils.types import MoexDate, MoexDecimal
+
+from .base import BaseInstrument
+from .snapshot import Snapshot
+
+T = TypeVar("T", bound=BaseInstrument)
+
+
+class IndexConstituent(BaseInstrument):
+    """
+    Бумага в базе расчета индекса Московской биржи.
+
+    Пример:
+        IndexConstituent(indexid="IMOEX", secids="SBER", weight=14.7)
+    """
+
+    index_id: str = Field(alias="indexid", description="Код индекса")
+    trade_date: MoexDate = Field(
+        None, alias="tradedate", description="Дата, на которую рассчитаны веса"
+    )
+    ticker: Optional[str] = Field(None, alias="ticker", description="Тикер")
+    sec_id: str = Field(alias="secids", description="Торговый код бумаги (SECID)")
+    short_name: Optional[str] = Field(
+        None, alias="shortnames", description="Краткое название бумаги"
+    )
+    weight: MoexDecimal = Field(
+        None, alias="weight", description="Вес бумаги в индексе, %"
+    )
+
+    def __repr__(self) -> str:
+        weight = self.weight
+        return f"<IndexConstituent {self.index_id} {self.sec_id} | weight={weight}>"
+
+
+class IndexBasket(Generic[T]):
+    """
+    Состав индекса вместе с котировками бумаг.
+
+    Котировки всех бумаг загружаются одним запросом снимка режима торгов.
+
+    Пример:
+        basket = await client.index_basket("IMOEX")
+        for item, share in basket:
+            print(item.sec_id, item.weight, share.last_price if share else None)
+    """
+
+    def __init__(self, constituents: list[IndexConstituent], quotes: Snapshot[T]):
+        """
+        :param constituents: состав индекса
+        :param quotes: снимок котировок бумаг индекса
+        """
+        self.constituents = constituents
+        self.quotes = quotes
+
+    def __len__(self) -> int:
+        return len(self.constituents)
+
+    def __iter__(self) -> Iterator[tuple[IndexConstituent, Optional[T]]]:
+        for item in self.constituents:
+            yield item, self.quotes.get(item.sec_id)
+
+    def weights(self) -> dict[str, Decimal]:
+        """Веса бумаг в индексе (SECID -> %)."""
+        return {
+            c.sec_id: c.weight for c in self.constituents if c.weight is not None
+        }
+
+    def __repr__(self) -> str:
+        index_id = self.constituents[0].index_id if self.constituents else "?"
+        return f"<IndexBasket {index_id} | items={len(self)} quotes={len(self.quotes)}>"
+
+
+__all__ = ["IndexConstituent", "IndexBasket"]
@@ -0,0 +1,149 @@
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Iterator, Optional
+
+from pymoex.utils.types import parse_decimal, safe_date
+
+
+def _dates(rows: list[dict[str, Any]], column: str) -> array:
+    return array("i", (safe_date(r.get(column)).toordinal() for r in rows))
+
+
+def _values(rows: list[dict[str, Any]], column: str) -> array:
+    values = array("d")
+    for r in rows:
+        value = parse_decimal(r.get(column))
+        values.append(float(value) if value is not None else math.nan)
+    return values
+
+
+def _dated(rows: list[dict[str, Any]], column: str) -> list[dict[str, Any]]:
+    rows = [r for r in rows if safe_date(r.get(column)) is not None]
+    rows.sort(key=lambda r: r[column])
+    return rows
+
+
+@dataclass(slots=True)
+class BondSchedule:
+    """
+    Расписание платежей облигации (купоны, амортизации, оферты).
+
+    Хранится компактно: даты — массивы порядковых номеров дней
+    (date.toordinal), суммы — массивы float. Неизвестные суммы
+    (например, будущие купоны флоатеров) хранятся как NaN.
+    """
+
+    isin: str
+    face_unit: Optional[str] = None
+
+    coupon_dates: array = field(default_factory=lambda: array("i"))
+    coupon_values: array = field(default_factory=lambda: array("d"))
+    coupon_percents: array = field(default_factory=lambda: array("d"))
+
+    amort_dates: array = field(default_factory=lambda: array("i"))
+    amort_values: array = field(default_factory=lambda: array("d"))
+
+    offer_dates: array = field(default_factory=lambda: array("i"))
+    offer_prices: array = field(default_factory=lambda: array("d"))
+
+    @classmethod
+    def from_tables(
+        cls,
+        isin: str,
+        coupons: list[dict[str, Any]],
+        amortizations: list[dict[str, Any]],
+        offers: list[dict[str, Any]],
+    ) -> "BondSchedule":
+        """
+        Построить расписание из таблиц ответа /bondization.json.
+        """
+        coupons = _dated(coupons, "coupondate")
+        amortizations = _dated(amortizations, "amortdate")
+        offers = _dated(offers, "offerdate")
+
+        face_unit = next(
+            (r.get("faceunit") for r in coupons + amortizations if r.get("faceunit")),
+            None,
+        )
+
+        return cls(
+            isin=isin,
+            face_unit=face_unit,
+            coupon_dates=_dates(coupons, "coupondate"),
+            coupon_values=_values(coupons, "value"),
+            coupon_percents=_values(coupons, "valueprc"),
+            amort_dates=_dates(amortizations, "amortdate"),
+            amort_values=_values(amortizations, "value"),
+            offer_dates=_dates(offers, "offerdate"),
+            offer_prices=_values(offers, "price"),
+        )
+
+    def coupons(self) -> Iterator[tuple[date, float]]:
+        """Купоны: (дата, сумма)."""
+        for d, v in zip(self.coupon_dates, self.coupon_values):
+            yield date.fromordinal(d), v
+
+    def amortizations(self) -> Iterator[tuple[date, float]]:
+        """Погашения номинала: (дата, сумма)."""
+        for d, v in zip(self.amort_dates, self.amort_values):
+            yield date.fromordinal(d), v
+
+    def offers(self) -> Iterator[tuple[date, float]]:
+        """Оферты: (дата, цена в % от номинала)."""
+        for d, v in zip(self.offer_dates, self.offer_prices):
+            yield date.fromordinal(d), v
+
+    def cashflows(
+        self, after: Optional[date] = None, project: bool = False
+    ) -> tuple[array, array]:
+        """
+        Денежные потоки облигации: купоны и погашения номинала по датам.
+
+        Платежи в одну дату суммируются.
+
+        :param after: учитывать только платежи строго после этой даты
+        :param project: заменить неизвестные купоны последним известным
+            (текущим) купоном; без него суммы таких дат — NaN
+        :return: (даты как toordinal, суммы)
+        """
+        start = after.toordinal() if after else -1
+        flows: dict[int, float] = {}
+
+        current = math.nan
+        for d, v in zip(self.coupon_dates, self.coupon_values):
+            if math.isnan(v):
+                v = current if project else v
+            else:
+                current = v
+            if d > start:
+                flows[d] = flows.get(d, 0.0) + v
+        for d, v in zip(self.amort_dates, self.amort_values):
+            if d > start:
+                flows[d] = flows.get(d, 0.0) + v
+
+        ordered = sorted(flows)
+        return array("i", ordered), array("d", (flows[d] for d in ordered))
+
+    def unknown_coupons(self, after: Optional[date] = None) -> int:
+        """
+        Число неизвестных (еще не объявленных) купонов.
+
+        :param after: учитывать только купоны строго после этой даты
+        """
+        start = after.toordinal() if after else -1
+        return sum(
+            1
+            for d, v in zip(self.coupon_dates, self.coupon_values)
+            if d > start and math.isnan(v)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"<BondSchedule {self.isin} | coupons={len(self.coupon_dates)} "
+            f"| amortizations={len(self.amort_dates)} | offers={len(self.offer_dates)}>"
+        )
+
+
+__all__ = ["BondSchedule"]
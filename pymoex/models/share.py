@@ -92,6 +92,11 @@ class Share(BaseInstrument):
     issue_size: MoexInt = Field(None, alias="ISSUESIZE", description="Объём эмиссии")
 
     # --- Статус ---
+    trading_status: Optional[str] = Field(
+        None,
+        alias="TRADINGSTATUS",
+        description="Статус торгов в режиме (T — идут торги)",
+    )
     status: Optional[str] = Field(
         None, alias="STATUS", description="Статус инструмента"
     )
@@ -0,0 +1,88 @@
+from typing import Any, Generic, Iterator, Optional, Type, TypeVar
+
+from .base import BaseInstrument
+
+T = TypeVar("T", bound=BaseInstrument)
+
+
+class Snapshot(Generic[T]):
+    """
+    Снимок режима торгов (или рынка): все инструменты одним запросом.
+
+    Хранит объединенную таблицу ISS (колонки + строки: securities,
+    marketdata и т.п.), а модели создает лениво при первом обращении.
+
+    Пример:
+        snapshot = await client.bonds.snapshot("TQCB")
+        for bond in snapshot:
+            print(bond.sec_id, bond.effective_yield)
+    """
+
+    def __init__(self, model: Type[T], columns: list[str], rows: list[list[Any]]):
+        """
+        :param model: класс модели строки (Share, Bond, ...)
+        :param columns: колонки объединенной таблицы
+        :param rows: строки объединенной таблицы
+        """
+        self.model = model
+        self.columns = columns
+        self.rows = rows
+
+        self._models: Optional[list[T]] = None
+        self._by_secid: Optional[dict[str, T]] = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.models())
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """Строки в виде словарей (без валидации моделей)."""
+        columns = self.columns
+        for row in self.rows:
+            yield dict(zip(columns, row))
+
+    def models(self) -> list[T]:
+        """Модели всех строк (создаются один раз)."""
+        if self._models is None:
+            self._models = [self.model.model_validate(r) for r in self.records()]
+        return self._models
+
+    def get(self, secid: str) -> Optional[T]:
+        """Модель инструмента по SECID (без учета регистра) или None."""
+        if self._by_secid is None:
+            self._by_secid = {m.sec_id.upper(): m for m in self.models()}
+        return self._by_secid.get(secid.upper())
+
+    def to_arrow(self, raw: bool = False, decimals: bool = True):
+        """
+        Снимок в виде pyarrow.Table (нужен extra parquet).
+
+        Колонки строятся из таблицы ISS без создания моделей.
+
+        :param raw: все колонки ISS под исходными именами (типы выводятся);
+            по умолчанию — поля модели с типами из utils.types
+        :param decimals: MoexDecimal как decimal128 (иначе float64)
+        """
+        from pymoex.utils.arrow import table_to_arrow
+
+        model = None if raw else self.model
+        return table_to_arrow(self.columns, self.rows, model, decimals)
+
+    def to_parquet(self, path, raw: bool = False, decimals: bool = True, **kwargs):
+        """
+        Сохранить снимок в Parquet.
+
+        :param path: путь к файлу
+        :param kwargs: параметры pyarrow.parquet.write_table
+        """
+        from pymoex.utils.arrow import write_parquet
+
+        write_parquet(self.to_arrow(raw, decimals), path, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"<Snapshot {self.model.__name__} | rows={len(self.rows)}>"
+
+
+__all__ = ["Snapshot"]
@@ -0,0 +1,419 @@
+import logging
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from pymoex.core.offload import parse_body
+from pymoex.core.registry import InstrumentRef
+from pymoex.core.session import params_key
+from pymoex.models.base import BaseInstrument
+from pymoex.models.snapshot import Snapshot
+from pymoex.utils.table import merge_tables
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# Сколько последних ответов (хэш и результат разбора) помнит сервис
+UNCHANGED_MAXSIZE = 10000
+
+# Бумаг в одном запросе снимка при предзагрузке (параметр securities)
+PRELOAD_CHUNK = 100
+
+
+def select_board(
+    sec_rows: list[dict[str, Any]],
+    md_rows: list[dict[str, Any]],
+    priority_boards: list[str],
+) -> str:
+    """
+    Выбрать режим торгов инструмента.
+
+    Порядок выбора:
+    - приоритетный режим, в котором идут торги;
+    - любой режим, в котором идут торги;
+    - приоритетный режим из справочника securities;
+    - первый режим из справочника.
+
+    :param sec_rows: строки таблицы securities
+    :param md_rows: строки таблицы marketdata
+    :param priority_boards: приоритетные режимы торгов
+    :return: BOARDID
+    """
+    # Определяем, в каких режимах сейчас есть торги
+    active_boards = {
+        row["BOARDID"]
+        for row in md_rows
+        if (
+            row.get("LAST") is not None
+            or row.get("LCLOSEPRICE") is not None
+            or row.get("LCURRENTPRICE") is not None
+        )
+    }
+
+    # Ищем приоритетный борд, который активен
+    for board in priority_boards:
+        if board in active_boards:
+            return board
+
+    # Если приоритетных нет, берем любой активный
+    if active_boards:
+        return list(active_boards)[0]
+
+    # Если торгов нет вообще, ищем по справочнику securities
+    priority_in_sec = [
+        r["BOARDID"] for r in sec_rows if r["BOARDID"] in priority_boards
+    ]
+    return priority_in_sec[0] if priority_in_sec else sec_rows[0]["BOARDID"]
+
+
+class InstrumentService(ABC):
+    """
+    Общая логика загрузки котировок инструмента (акции, облигации).
+
+    Режим торгов выбирается так:
+    1. из кэша выбранных режимов (boards), если инструмент уже загружался;
+    2. из справочника инструментов (основной режим), если он подключен;
+    3. иначе загружаются все режимы и выбирается подходящий.
+
+    Выбранный режим запоминается, поэтому последующие обновления запрашивают
+    только один режим и получают одну строку вместо всех режимов.
+
+    Если тело ответа совпадает с предыдущим ответом на тот же запрос
+    (вне торговой сессии, неликвидные бумаги), JSON не разбирается и модель
+    не валидируется заново — возвращается прежний экземпляр.
+    """
+
+    # Тип инструмента (для ключей кэша и логов)
+    kind: str = ""
+
+    # Группы справочника, которые обслуживает сервис
+    groups: set[str] = set()
+
+    # Коды инструментов различают регистр (FORTS: 'SiH4'); иначе SECID
+    # приводится к верхнему регистру
+    case_sensitive: bool = False
+
+    def __init__(self, session, cache, directory=None, boards=None, calendar=None):
+        """
+        :param session: MoexSession
+        :param cache: кэш котировок
+        :param directory: SecuritiesDirectory для прямого выбора режима торгов
+        :param boards: кэш выбранных режимов торгов (долгий TTL)
+        :param calendar: CalendarService — TTL котировок по расписанию торгов
+        """
+        self.session = session
+        self.cache = cache
+        self.directory = directory
+        self.boards = boards
+        self.calendar = calendar
+
+        # (путь, параметры) -> (хэш ответа, результат разбора, размер).
+        # Ограничено UNCHANGED_MAXSIZE записями и бюджетом cache.max_bytes:
+        # вытесненные из кэша снимки не остаются в памяти из-за этого словаря
+        self._parsed: dict[tuple, tuple[str, Any, int]] = {}
+        self._parsed_bytes = 0
+
+    # --- Переопределяется в наследниках ---
+
+    @abstractmethod
+    def _endpoint(self, ticker: str) -> str:
+        """Эндпоинт инструмента во всех режимах торгов."""
+
+    @abstractmethod
+    def _board_endpoint(self, board: str, ticker: str) -> str:
+        """Эндпоинт инструмента в одном режиме торгов."""
+
+    @abstractmethod
+    def _parse(self, ticker: str, data: dict) -> BaseInstrument:
+        """Модель инструмента из ответа ISS."""
+
+    @abstractmethod
+    async def _load_bulk(
+        self, board: str | None, secids: list[str] | None = None
+    ) -> Snapshot:
+        """Снимок режима торгов (None — основной режим или весь рынок)."""
+
+    # --- Прогрев кэша ---
+
+    async def preload(self, tickers: list[str]) -> dict[str, BaseInstrument]:
+        """
+        Загрузить котировки инструментов снимком рынка (до PRELOAD_CHUNK бумаг
+        на запрос) и положить их в кэш, как если бы каждую запросили отдельно.
+
+        :param tickers: SECID (облигации — также ISIN)
+        :return: тикер -> модель; не найденные в снимке тикеры отсутствуют
+        """
+        tickers = list(dict.fromkeys(self._ticker(t) for t in tickers))
+        loaded: dict[str, BaseInstrument] = {}
+
+        for start in range(0, len(tickers), PRELOAD_CHUNK):
+            chunk = tickers[start : start + PRELOAD_CHUNK]
+            snapshot = await self._load_bulk(None, chunk)
+
+            by_id: dict[str, BaseInstrument] = {}
+            for model in snapshot:
+                by_id[self._ticker(model.sec_id)] = model
+                isin = getattr(model, "isin", None)
+                if isin:
+                    by_id.setdefault(self._ticker(isin), model)
+
+            for ticker in chunk:
+                if ticker in by_id:
+                    loaded[ticker] = by_id[ticker]
+
+        for ticker, model in loaded.items():
+            await self._store(ticker, model)
+
+        logger.debug(f"Preloaded {len(loaded)}/{len(tickers)} {self.kind} quotes")
+
+        return loaded
+
+    async def refresh(self, ticker: str) -> BaseInstrument:
+        """
+        Загрузить котировку инструмента и заменить запись в кэше
+        (старая запись доступна до замены).
+
+        :param ticker: тикер
+        """
+        ticker = self._ticker(ticker)
+        instrument = await self._load(ticker)
+        await self._store(ticker, instrument)
+        return instrument
+
+    def _ticker(self, ticker: str) -> str:
+        """Тикер для запроса и ключа кэша."""
+        return ticker if self.case_sensitive else ticker.upper()
+
+    async def _store(self, ticker: str, instrument: BaseInstrument) -> None:
+        await self.cache.set(f"{self.kind}:{ticker}", instrument, self._ttl(instrument))
+        await self._remember_board(f"board:{self.kind}:{ticker}", instrument)
+
+    # --- Загрузка ---
+
+    def _ttl(self, value: Any) -> int | None:
+        """
+        Время жизни котировки (или снимка) в кэше: по расписанию торгов,
+        если подключен календарь, иначе TTL кэша.
+        """
+        if self.calendar is None:
+            return None
+
+        status = getattr(value, "trading_status", None)
+        return self.calendar.ttl(self.cache.ttl, status)
+
+    async def _load(self, ticker: str) -> BaseInstrument:
+        if self.calendar is not None:
+            await self.calendar.calendar()
+
+        board_key = f"board:{self.kind}:{ticker}"
+        route = await self.boards.get(board_key) if self.boards is not None else None
+
+        if route is None:
+            ref = await self._resolve(ticker)
+            if ref is not None:
+                route = (ref.secid, ref.primary_boardid)
+
+        if route is not None:
+            secid, board = route
+
+            def _parse_board(data: dict) -> BaseInstrument | None:
+                if not data.get("securities", {}).get("data"):
+                    return None
+                return self._parse(ticker, data)
+
+            instrument = await self._fetch_parsed(
+                self._board_endpoint(board, secid), _parse_board
+            )
+
+            if instrument is not None:
+                logger.debug(f"Loaded {self.kind} {ticker} from board {board}")
+                await self._remember_board(board_key, instrument)
+                return instrument
+
+            logger.debug(f"Board {board} returned no data for {self.kind} {ticker}")
+
+        instrument = await self._fetch_parsed(
+            self._endpoint(ticker), lambda data: self._parse(ticker, data)
+        )
+        await self._remember_board(board_key, instrument)
+
+        return instrument
+
+    async def _fetch_parsed(
+        self,
+        path: str,
+        parse: Callable[[dict], R],
+        params: dict | None = None,
+        offload: Callable[[dict], R] | None = None,
+    ) -> R:
+        """
+        Загрузить ответ и разобрать его; неизменившийся ответ не разбирается.
+
+        :param path: эндпоинт
+        :param parse: разбор JSON-ответа
+        :param params: query-параметры
+        :param offload: разбор большого ответа в пуле session.offload
+            (сериализуется pickle); None — всегда parse в event loop
+        :return: результат parse (прежний, если тело ответа не изменилось)
+        """
+        payload = await self.session.fetch(path, params)
+
+        if not self.session.settings.reuse_unchanged:
+            return await self._parse_payload(payload, parse, offload)
+
+        key = (path, params_key(params))
+        previous = self._parsed.pop(key, None)
+        if previous is not None:
+            self._parsed_bytes -= previous[2]
+
+        if previous is not None and previous[0] == payload.digest:
+            logger.debug(f"Response unchanged for {path}, reusing parsed result")
+            result, size = previous[1], previous[2]
+        else:
+            result = await self._parse_payload(payload, parse, offload)
+            size = self.cache.sizeof(result) if self.cache.max_bytes else 0
+
+        # Повторная вставка держит недавно использованные ключи в конце
+        self._parsed[key] = (payload.digest, result, size)
+        self._parsed_bytes += size
+        self._trim_parsed()
+
+        return result
+
+    def _trim_parsed(self) -> None:
+        max_bytes = self.cache.max_bytes
+        while self._parsed and (
+            len(self._parsed) > UNCHANGED_MAXSIZE
+            or (max_bytes is not None and self._parsed_bytes > max_bytes)
+        ):
+            oldest = next(iter(self._parsed))
+            self._parsed_bytes -= self._parsed.pop(oldest)[2]
+
+    async def _parse_payload(
+        self,
+        payload,
+        parse: Callable[[dict], R],
+        offload: Callable[[dict], R] | None,
+    ) -> R:
+        pool = self.session.offload
+
+        if offload is not None and pool.wants(len(payload)):
+            logger.debug(f"Parsing {len(payload)} bytes in {pool.kind} pool")
+            return await pool.run(parse_body, payload.body, offload)
+
+        return parse(payload.json())
+
+    async def _load_snapshot(
+        self,
+        model: type[BaseInstrument],
+        path: str,
+        blocks: tuple[str, ...],
+        priority_boards: list[str],
+        per_secid: bool,
+        params: dict | None = None,
+    ) -> Snapshot:
+        """
+        Загрузить все инструменты режима (или рынка) одним запросом.
+
+        :param model: модель строки
+        :param path: эндпоинт списка инструментов
+        :param blocks: блоки ответа в порядке приоритета (от низшего)
+        :param priority_boards: приоритетные режимы торгов
+        :param per_secid: оставить для каждого SECID один режим (select_board)
+        :param params: query-параметры (например, securities — список бумаг)
+        """
+        if self.calendar is not None:
+            await self.calendar.calendar()
+
+        build = partial(
+            build_snapshot,
+            model=model,
+            blocks=blocks,
+            priority_boards=list(priority_boards),
+            per_secid=per_secid,
+        )
+
+        # В пуле модели создаются сразу, а не в event loop при первом обращении
+        return await self._fetch_parsed(
+            path, build, params, offload=partial(build, prebuild=True)
+        )
+
+    @staticmethod
+    def _pick_boards(
+        columns: list[str], rows: list[list[Any]], priority_boards: list[str]
+    ) -> list[list[Any]]:
+        secid_pos = columns.index("SECID")
+        board_pos = columns.index("BOARDID")
+
+        groups: dict[str, list[list[Any]]] = {}
+        for row in rows:
+            groups.setdefault(row[secid_pos], []).append(row)
+
+        picked = []
+        for group in groups.values():
+            if len(group) == 1:
+                picked.append(group[0])
+                continue
+
+            records = [dict(zip(columns, r)) for r in group]
+            board = select_board(records, records, priority_boards)
+            picked.append(next(r for r in group if r[board_pos] == board))
+
+        return picked
+
+    async def _remember_board(self, board_key: str, instrument) -> None:
+        if self.boards is None or not instrument.board_id:
+            return
+
+        await self.boards.set(board_key, (instrument.sec_id, instrument.board_id))
+
+    async def _resolve(self, ticker: str) -> InstrumentRef | None:
+        """
+        Найти SECID и основной режим торгов в справочнике (если он подключен).
+        """
+        if self.directory is None:
+            return None
+
+        registry = await self.directory.registry()
+        ref = registry.resolve(ticker)
+
+        if ref is None or not ref.primary_boardid:
+            return None
+
+        if ref.group not in self.groups:
+            return None
+
+        return ref
+
+
+def build_snapshot(
+    data: dict,
+    model: type[BaseInstrument],
+    blocks: tuple[str, ...],
+    priority_boards: list[str],
+    per_secid: bool,
+    prebuild: bool = False,
+) -> Snapshot:
+    """
+    Снимок из ответа ISS (функция уровня модуля: выполняется и в пуле процессов).
+
+    :param data: JSON-ответ
+    :param model: модель строки
+    :param blocks: блоки ответа в порядке приоритета (от низшего)
+    :param priority_boards: приоритетные режимы торгов
+    :param per_secid: оставить для каждого SECID один режим
+    :param prebuild: создать модели сразу (при разборе вне event loop)
+    """
+    columns, rows = merge_tables([data.get(b, {}) for b in blocks])
+
+    if per_secid and rows:
+        rows = InstrumentService._pick_boards(columns, rows, priority_boards)
+
+    logger.debug(f"Snapshot {model.__name__}: {len(rows)} rows")
+
+    snapshot = Snapshot(model, columns, rows)
+    if prebuild:
+        snapshot.models()
+
+    return snapshot
@@ -1,34 +1,182 @@
+import asyncio
 import logging
 
 from pymoex.core import endpoints
+from pymoex.core.constants import MOEX_BOND_GROUPS
+from pymoex.core.ratelimit import RateLimiter
 from pymoex.exceptions import InstrumentNotFoundError
 from pymoex.models.bond import Bond
-from pymoex.utils.table import parse_table
+from pymoex.models.schedule import BondSchedule
+from pymoex.models.snapshot import Snapshot
+from pymoex.services.base import InstrumentService, select_board
+from pymoex.utils.table import first_row, parse_table
+
+# Блоки ответа /bondization.json
+SCHEDULE_BLOCKS = ("coupons", "amortizations", "offers")
 
 logger = logging.getLogger(__name__)
 
 
-class BondsService:
+class BondsService(InstrumentService):
     """
     Сервис для получения данных по облигациям.
     """
 
-    def __init__(self, session, cache):
-        self.session = session
-        self.cache = cache
+    kind = "bond"
+    groups = MOEX_BOND_GROUPS
+
+    def __init__(
+        self,
+        session,
+        cache,
+        directory=None,
+        boards=None,
+        schedules=None,
+        calendar=None,
+    ):
+        """
+        :param schedules: кэш расписаний платежей (долгий TTL)
+        """
+        super().__init__(session, cache, directory, boards, calendar)
+        self.schedules_cache = schedules
 
     async def get_bond(self, ticker: str) -> Bond:
         ticker = ticker.upper()
         cache_key = f"bond:{ticker}"
 
         async def _fetch():
-            return await self._load_bond(ticker)
+            return await self._load(ticker)
+
+        return await self.cache.get_or_set(cache_key, _fetch, ttl=self._ttl)
+
+    async def snapshot(
+        self, board: str | None = None, securities: list[str] | None = None
+    ) -> Snapshot[Bond]:
+        """
+        Все облигации режима торгов (или выбранные бумаги) одним запросом.
+
+        :param board: режим торгов (например, 'TQCB'); None — весь рынок
+            облигаций, для каждой бумаги выбирается один режим
+        :param securities: ограничить снимок этими SECID
+        :return: Snapshot с моделями Bond
+        """
+        board = board.upper() if board else None
+        secids = sorted({s.upper() for s in securities}) if securities else []
+        cache_key = f"bonds:{board or 'all'}:{','.join(secids)}"
+
+        async def _fetch():
+            return await self._load_bulk(board, secids)
+
+        return await self.cache.get_or_set(cache_key, _fetch, ttl=self._ttl)
+
+    async def _load_bulk(
+        self, board: str | None, secids: list[str] | None = None
+    ) -> Snapshot[Bond]:
+        return await self._load_snapshot(
+            Bond,
+            endpoints.bonds(board),
+            ("securities", "marketdata_yields", "marketdata"),
+            self.session.settings.preferred_bond_boards,
+            per_secid=board is None,
+            params={"securities": ",".join(secids)} if secids else None,
+        )
+
+    async def schedule(
+        self, isin: str, limiter: RateLimiter | None = None
+    ) -> BondSchedule:
+        """
+        Расписание платежей облигации (купоны, амортизации, оферты).
+
+        :param isin: ISIN или торговый код облигации
+        :param limiter: ограничитель запросов (для массовой загрузки)
+        """
+        isin = isin.upper()
+
+        async def _fetch():
+            return await self._load_schedule(isin, limiter)
+
+        if self.schedules_cache is None:
+            return await _fetch()
+
+        return await self.schedules_cache.get_or_set(f"schedule:{isin}", _fetch)
 
-        return await self.cache.get_or_set(cache_key, _fetch, ttl=60)
+    async def schedules(self, isins: list[str]) -> dict[str, BondSchedule]:
+        """
+        Расписания платежей для списка облигаций.
 
-    async def _load_bond(self, ticker: str) -> Bond:
-        data = await self.session.get(endpoints.bond(ticker))
+        Загружаются параллельно с ограничением частоты запросов
+        (MOEX_SCHEDULE_RATE, MOEX_SCHEDULE_CONCURRENCY). Бумаги, которых
+        нет на бирже, пропускаются.
 
+        :param isins: ISIN или торговые коды облигаций
+        :return: словарь ISIN -> BondSchedule
+        """
+        settings = self.session.settings
+        limiter = RateLimiter(settings.schedule_rate, settings.schedule_concurrency)
+
+        isins = list(dict.fromkeys(i.upper() for i in isins))
+        results = await asyncio.gather(
+            *(self.schedule(isin, limiter) for isin in isins),
+            return_exceptions=True,
+        )
+
+        schedules = {}
+        for isin, result in zip(isins, results):
+            if isinstance(result, InstrumentNotFoundError):
+                logger.warning(f"Schedule for {isin} not found, skipped")
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            schedules[isin] = result
+
+        return schedules
+
+    async def _load_schedule(
+        self, isin: str, limiter: RateLimiter | None
+    ) -> BondSchedule:
+        tables: dict[str, list[dict]] = {name: [] for name in SCHEDULE_BLOCKS}
+        start = 0
+
+        while True:
+            params = {"start": start, "limit": 100}
+
+            if limiter is not None:
+                async with limiter:
+                    data = await self.session.get(endpoints.bondization(isin), params)
+            else:
+                data = await self.session.get(endpoints.bondization(isin), params)
+
+            # Каждый блок листается своим курсором, start у них общий
+            next_start = None
+            for name in SCHEDULE_BLOCKS:
+                if data.get(name):
+                    tables[name].extend(parse_table(data[name]))
+
+                cursor = first_row(data.get(f"{name}.cursor", {}))
+                if cursor:
+                    end = cursor["INDEX"] + cursor["PAGESIZE"]
+                    if end < cursor["TOTAL"]:
+                        next_start = max(next_start or 0, end)
+
+            if next_start is None:
+                break
+            start = next_start
+
+        if not any(tables.values()):
+            logger.warning(f"Bondization for {isin} is empty")
+            raise InstrumentNotFoundError(f"Bond schedule {isin} not found")
+
+        return BondSchedule.from_tables(
+            isin, tables["coupons"], tables["amortizations"], tables["offers"]
+        )
+
+    def _endpoint(self, ticker: str) -> str:
+        return endpoints.bond(ticker)
+
+    def _board_endpoint(self, board: str, ticker: str) -> str:
+        return endpoints.bond_on_board(board, ticker)
+
+    def _parse(self, ticker: str, data: dict) -> Bond:
         if not data.get("securities", {}).get("data"):
             logger.warning(f"Bond {ticker} not found in MOEX response")
             raise InstrumentNotFoundError(f"Bond {ticker} not found")
@@ -39,39 +187,7 @@ class BondsService:
         yield_rows = parse_table(data.get("marketdata_yields", {}))
 
         priority_boards = self.session.settings.preferred_bond_boards
-
-        # Смотрим, где есть торговля
-        active_boards = {
-            row["BOARDID"]
-            for row in md_rows
-            if (
-                row.get("LAST") is not None
-                or row.get("LCLOSEPRICE") is not None
-                or row.get("LCURRENTPRICE") is not None
-            )
-        }
-
-        target_board = None
-
-        # Ищем приоритетный борд, который активен
-        for board in priority_boards:
-            if board in active_boards:
-                target_board = board
-                break
-
-        # Если приоритетных нет, берем первый активный
-        if not target_board and active_boards:
-            target_board = list(active_boards)[0]
-
-        # Если торгов нет, ищем по справочнику securities
-        if not target_board:
-            # Ищем первый борд из списка priority_boards, который есть в sec_rows
-            priority_in_sec = [
-                r["BOARDID"] for r in sec_rows if r["BOARDID"] in priority_boards
-            ]
-            target_board = (
-                priority_in_sec[0] if priority_in_sec else sec_rows[0]["BOARDID"]
-            )
+        target_board = select_board(sec_rows, md_rows, priority_boards)
 
         logger.debug(f"Selected board '{target_board}' for bond {ticker}")
 
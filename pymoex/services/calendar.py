@@ -0,0 +1,104 @@
+import logging
+from datetime import datetime
+from typing import Any
+
+from pymoex.core import endpoints
+from pymoex.exceptions import MoexError
+from pymoex.models.calendar import MSK, TradingCalendar
+from pymoex.utils.table import parse_table
+
+logger = logging.getLogger(__name__)
+
+# Повторная попытка загрузить расписание после ошибки (секунды)
+RETRY_TTL = 300
+
+
+class CalendarService:
+    """
+    Расписание торгов движков ISS и время жизни котировок по нему.
+
+    Пока идут торги, котировки живут обычный TTL кэша (price_ttl).
+    Когда торги закрыты, запись живет до ближайшего открытия
+    (но не дольше closed_ttl): ночью и в выходные котировки почти
+    не запрашиваются, а к открытию все записи устаревают разом.
+
+    Торговый статус режима (TRADINGSTATUS = 'T') важнее расписания движка:
+    такая запись всегда живет обычный TTL.
+    """
+
+    def __init__(self, session, cache, closed_ttl: int = 43200):
+        """
+        :param session: MoexSession
+        :param cache: кэш расписаний (TTL — сутки)
+        :param closed_ttl: максимальное время жизни котировок вне торгов
+        """
+        self.session = session
+        self.cache = cache
+        self.closed_ttl = int(closed_ttl)
+
+        # Последнее загруженное расписание движка (для синхронного ttl)
+        self._calendars: dict[str, TradingCalendar] = {}
+
+    async def calendar(self, engine: str = endpoints.ENGINE) -> TradingCalendar:
+        """
+        Расписание торгов движка.
+
+        Ошибка загрузки не пробрасывается: возвращается пустое расписание
+        (торги считаются открытыми), загрузка повторяется через RETRY_TTL.
+
+        :param engine: движок ('stock', 'futures', 'currency')
+        """
+
+        async def _fetch():
+            try:
+                data = await self.session.get(endpoints.engine(engine))
+            except MoexError as e:
+                logger.warning(f"Failed to load {engine} trading calendar: {e}")
+                return TradingCalendar(engine)
+
+            return TradingCalendar.from_rows(
+                engine,
+                self._rows(data, "timetable"),
+                self._rows(data, "dailytable"),
+            )
+
+        calendar = await self.cache.get_or_set(
+            f"calendar:{engine}", _fetch, ttl=lambda c: None if c else RETRY_TTL
+        )
+        self._calendars[engine] = calendar
+
+        return calendar
+
+    def ttl(
+        self,
+        default: int,
+        status: str | None = None,
+        engine: str = endpoints.ENGINE,
+        now: datetime | None = None,
+    ) -> int:
+        """
+        Время жизни котировки в кэше.
+
+        :param default: TTL во время торгов
+        :param status: TRADINGSTATUS режима торгов инструмента (если известен)
+        :param engine: движок
+        :param now: текущий момент (для тестов)
+        """
+        calendar = self._calendars.get(engine)
+        if not calendar or status == "T":
+            return default
+
+        now = now or datetime.now(MSK)
+        if calendar.is_open(now):
+            return default
+
+        next_open = calendar.next_open(now)
+        if next_open is None:
+            return self.closed_ttl
+
+        until_open = int((next_open - now).total_seconds())
+        return max(1, min(self.closed_ttl, until_open))
+
+    @staticmethod
+    def _rows(data: dict, block: str) -> list[dict[str, Any]]:
+        return parse_table(data[block]) if data.get(block) else []
@@ -0,0 +1,79 @@
+import logging
+from datetime import date
+
+from pymoex.core import endpoints
+from pymoex.models.candles import RESAMPLE_SOURCES, Candles
+from pymoex.models.enums import CandleInterval
+
+logger = logging.getLogger(__name__)
+
+# Размер страницы свечей в ISS
+CANDLES_PAGE = 500
+
+
+class CandlesService:
+    """
+    Сервис свечей (OHLCV).
+
+    Страницы ISS дописываются сразу в колоночные массивы. Если для того же
+    диапазона уже загружены свечи меньшего интервала, крупный интервал
+    собирается из них локально, без повторной загрузки.
+    """
+
+    def __init__(self, session, cache):
+        self.session = session
+        self.cache = cache
+
+    async def get_candles(
+        self,
+        ticker: str,
+        interval: CandleInterval | int = CandleInterval.DAY_1,
+        date_from: date | None = None,
+        date_till: date | None = None,
+        market: str = "shares",
+    ) -> Candles:
+        ticker = ticker.upper()
+        interval = CandleInterval(interval)
+        scope = f"{market}:{ticker}:{date_from or ''}:{date_till or ''}"
+
+        async def _fetch():
+            for source in RESAMPLE_SOURCES.get(interval, ()):
+                base = await self.cache.get(f"candles:{scope}:{source.value}")
+                if base is not None:
+                    logger.debug(f"Resampling {ticker} {source.name} -> {interval.name}")
+                    return base.resample(interval)
+
+            return await self._load(ticker, interval, date_from, date_till, market)
+
+        return await self.cache.get_or_set(f"candles:{scope}:{interval.value}", _fetch)
+
+    async def _load(
+        self,
+        ticker: str,
+        interval: CandleInterval,
+        date_from: date | None,
+        date_till: date | None,
+        market: str,
+    ) -> Candles:
+        candles = Candles(interval)
+        params: dict = {"interval": interval.value}
+        if date_from:
+            params["from"] = date_from.isoformat()
+        if date_till:
+            params["till"] = date_till.isoformat()
+
+        start = 0
+        while True:
+            data = await self.session.get(
+                endpoints.candles(ticker, market), params={**params, "start": start}
+            )
+
+            added = candles.extend(data.get("candles", {}))
+            if added < CANDLES_PAGE:
+                break
+
+            start += added
+
+        logger.debug(f"Loaded {len(candles)} {interval.name} candles for {ticker}")
+
+        return candles
@@ -0,0 +1,104 @@
+import logging
+
+from pymoex.core import endpoints
+from pymoex.core.constants import MOEX_CURRENCY_GROUPS
+from pymoex.exceptions import InstrumentNotFoundError
+from pymoex.models.currency import CrossRates, CurrencyPair
+from pymoex.models.snapshot import Snapshot
+from pymoex.services.base import InstrumentService, select_board
+from pymoex.utils.table import parse_table
+
+logger = logging.getLogger(__name__)
+
+# Валютный рынок: движок и рынок биржевой валюты и металлов
+ENGINE = "currency"
+MARKET = "selt"
+
+# Основной режим торгов (системные сделки)
+CURRENCY_BOARD = "CETS"
+
+
+class CurrencyService(InstrumentService):
+    """
+    Сервис валютного рынка и драгоценных металлов (SELT).
+
+    Курсы всех пар режима торгов загружаются одним запросом, таблица
+    кросс-курсов (CrossRates) строится по снимку и кэшируется вместе с ним.
+    """
+
+    kind = "currency"
+    groups = MOEX_CURRENCY_GROUPS
+
+    async def get_pair(self, ticker: str) -> CurrencyPair:
+        ticker = ticker.upper()
+        cache_key = f"currency:{ticker}"
+
+        async def _fetch():
+            return await self._load(ticker)
+
+        return await self.cache.get_or_set(cache_key, _fetch)
+
+    async def snapshot(self, board: str = CURRENCY_BOARD) -> Snapshot[CurrencyPair]:
+        """
+        Все валютные пары и металлы режима торгов одним запросом.
+
+        :param board: режим торгов (по умолчанию CETS)
+        :return: Snapshot с моделями CurrencyPair
+        """
+        board = board.upper()
+
+        async def _fetch():
+            return await self._load_bulk(board)
+
+        return await self.cache.get_or_set(f"currencies:{board}", _fetch)
+
+    async def rates(self, board: str = CURRENCY_BOARD) -> CrossRates:
+        """
+        Таблица курсов к рублю и кросс-курсов по снимку режима торгов.
+
+        :param board: режим торгов (по умолчанию CETS)
+        """
+        board = board.upper()
+
+        async def _fetch():
+            rates = CrossRates(await self.snapshot(board))
+            logger.debug(f"Cross rates for {board}: {len(rates)} currencies")
+            return rates
+
+        return await self.cache.get_or_set(f"rates:{board}", _fetch)
+
+    async def _load_bulk(
+        self, board: str | None, secids: list[str] | None = None
+    ) -> Snapshot[CurrencyPair]:
+        board = board or CURRENCY_BOARD
+        return await self._load_snapshot(
+            CurrencyPair,
+            endpoints.securities(ENGINE, MARKET, board),
+            ("securities", "marketdata"),
+            [board],
+            per_secid=False,
+            params={"securities": ",".join(secids)} if secids else None,
+        )
+
+    def _endpoint(self, ticker: str) -> str:
+        return endpoints.security(ENGINE, MARKET, ticker)
+
+    def _board_endpoint(self, board: str, ticker: str) -> str:
+        return endpoints.security(ENGINE, MARKET, ticker, board)
+
+    def _parse(self, ticker: str, data: dict) -> CurrencyPair:
+        if not data.get("securities", {}).get("data"):
+            logger.warning(f"Currency pair {ticker} not found in MOEX response")
+            raise InstrumentNotFoundError(f"Currency pair {ticker} not found")
+
+        sec_rows = parse_table(data["securities"])
+        md_rows = parse_table(data.get("marketdata", {}))
+
+        target_board = select_board(sec_rows, md_rows, [CURRENCY_BOARD])
+
+        security = next(
+            (r for r in sec_rows if r["BOARDID"] == target_board), sec_rows[0]
+        )
+        market_data = next((r for r in md_rows if r["BOARDID"] == target_board), {})
+
+        return CurrencyPair.model_validate({**security, **market_data})
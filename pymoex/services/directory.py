@@ -0,0 +1,150 @@
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from pymoex.core import endpoints
+from pymoex.core.registry import InstrumentRegistry
+from pymoex.core.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+
+class SecuritiesDirectory:
+    """
+    Локальная копия справочника инструментов MOEX (/securities.json).
+
+    Справочник скачивается постранично один раз, сохраняется на диск
+    и обновляется, когда копия старше ttl (по умолчанию — раз в сутки).
+    """
+
+    def __init__(self, session, path: Path, ttl: int = 86400, page_size: int = 100):
+        """
+        :param session: MoexSession
+        :param path: путь к файлу локальной копии
+        :param ttl: период обновления справочника в секундах
+        :param page_size: размер страницы при скачивании
+        """
+        self.session = session
+        self.path = Path(path)
+        self.ttl = int(ttl)
+        self.page_size = int(page_size)
+
+        self._fetched_at: float | None = None
+        self._rows: list[dict[str, Any]] | None = None
+        self._index: SearchIndex | None = None
+        self._registry: InstrumentRegistry | None = None
+
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        if self._fetched_at is None:
+            return True
+        return time.time() - self._fetched_at > self.ttl
+
+    async def rows(self) -> list[dict[str, Any]]:
+        """
+        Строки справочника (с загрузкой с диска или из ISS при необходимости).
+        """
+        await self._ensure_fresh()
+        return self._rows or []
+
+    async def index(self) -> SearchIndex:
+        """
+        Поисковый индекс по справочнику.
+        """
+        await self._ensure_fresh()
+
+        if self._index is None:
+            self._index = SearchIndex(self._rows or [])
+
+        return self._index
+
+    async def registry(self) -> InstrumentRegistry:
+        """
+        Индекс идентификаторов (ISIN, SECID, REGNUMBER, ИНН) по справочнику.
+        """
+        await self._ensure_fresh()
+
+        if self._registry is None:
+            self._registry = InstrumentRegistry(self._rows or [])
+
+        return self._registry
+
+    async def refresh(self) -> None:
+        """
+        Принудительно скачать справочник из ISS и сохранить на диск.
+        """
+        async with self._lock:
+            await self._download()
+
+    async def _ensure_fresh(self) -> None:
+        if not self.is_stale:
+            return
+
+        async with self._lock:
+            # Пока ждали лок, справочник мог обновить другой запрос
+            if not self.is_stale:
+                return
+
+            if self._fetched_at is None and await asyncio.to_thread(self._load):
+                if not self.is_stale:
+                    return
+
+            await self._download()
+
+    async def _download(self) -> None:
+        columns: list[str] = []
+        data: list[list] = []
+        start = 0
+
+        while True:
+            page = await self.session.get(
+                endpoints.search(),
+                params={"is_trading": 1, "start": start, "limit": self.page_size},
+            )
+
+            block = page.get("securities", {})
+            rows = block.get("data", [])
+            columns = block.get("columns", columns)
+            data.extend(rows)
+
+            if len(rows) < self.page_size:
+                break
+
+            start += len(rows)
+
+        logger.debug(f"Securities directory downloaded: {len(data)} rows")
+
+        self._set(columns, data, time.time())
+        await asyncio.to_thread(self._dump, columns, data)
+
+    def _set(self, columns: list[str], data: list[list], fetched_at: float) -> None:
+        self._rows = [dict(zip(columns, row)) for row in data]
+        self._fetched_at = fetched_at
+        self._index = None
+        self._registry = None
+
+    def _load(self) -> bool:
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+            self._set(payload["columns"], payload["data"], payload["fetched_at"])
+        except FileNotFoundError:
+            return False
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"Broken securities directory file: {self.path}")
+            return False
+
+        logger.debug(f"Securities directory loaded from {self.path}")
+        return True
+
+    def _dump(self, columns: list[str], data: list[list]) -> None:
+        payload = {"fetched_at": self._fetched_at, "columns": columns, "data": data}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(self.path)
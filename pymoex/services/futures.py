@@ -0,0 +1,132 @@
+import logging
+
+from pymoex.core import endpoints
+from pymoex.core.constants import MOEX_FUTURES_GROUPS
+from pymoex.exceptions import InstrumentNotFoundError
+from pymoex.models.future import Future, Option
+from pymoex.models.snapshot import Snapshot
+from pymoex.services.base import InstrumentService, select_board
+from pymoex.utils.table import parse_table
+
+logger = logging.getLogger(__name__)
+
+# Срочный рынок: движок и рынки фьючерсов и опционов
+ENGINE = "futures"
+FUTURES_MARKET = "forts"
+OPTIONS_MARKET = "options"
+
+# Основные режимы торгов фьючерсами и опционами
+FUTURES_BOARD = "RFUD"
+OPTIONS_BOARD = "ROPD"
+
+
+class FuturesService(InstrumentService):
+    """
+    Сервис срочного рынка (FORTS): фьючерсы и опционы.
+
+    Все контракты режима торгов загружаются одним запросом (snapshot),
+    поэтому расчеты по всей кривой (календарные спреды и т.п.) не требуют
+    запроса на каждый контракт.
+    """
+
+    kind = "future"
+    groups = MOEX_FUTURES_GROUPS
+    case_sensitive = True
+
+    async def get_future(self, ticker: str) -> Future:
+        ticker = self._ticker(ticker)
+        cache_key = f"future:{ticker}"
+
+        async def _fetch():
+            return await self._load(ticker)
+
+        return await self.cache.get_or_set(cache_key, _fetch)
+
+    async def snapshot(self, board: str = FUTURES_BOARD) -> Snapshot[Future]:
+        """
+        Все фьючерсы режима торгов одним запросом.
+
+        :param board: режим торгов (по умолчанию RFUD)
+        :return: Snapshot с моделями Future
+        """
+        board = board.upper()
+
+        async def _fetch():
+            return await self._load_bulk(board)
+
+        return await self.cache.get_or_set(f"futures:{board}", _fetch)
+
+    async def options(self, board: str = OPTIONS_BOARD) -> Snapshot[Option]:
+        """
+        Все опционы режима торгов одним запросом.
+
+        :param board: режим торгов (по умолчанию ROPD)
+        :return: Snapshot с моделями Option
+        """
+        board = board.upper()
+
+        async def _fetch():
+            return await self._load_snapshot(
+                Option,
+                endpoints.securities(ENGINE, OPTIONS_MARKET, board),
+                ("securities", "marketdata"),
+                [board],
+                per_secid=False,
+            )
+
+        return await self.cache.get_or_set(f"options:{board}", _fetch)
+
+    async def chain(self, asset_code: str, board: str = FUTURES_BOARD) -> list[Future]:
+        """
+        Фьючерсы на базовый актив, упорядоченные по дате исполнения.
+
+        Строится по снимку режима торгов (без отдельных запросов).
+
+        :param asset_code: код базового актива (например, 'Si', 'BR')
+        :param board: режим торгов
+        """
+        snapshot = await self.snapshot(board)
+        asset_code = asset_code.upper()
+
+        contracts = [
+            f for f in snapshot if (f.asset_code or "").upper() == asset_code
+        ]
+        contracts.sort(key=lambda f: (f.last_trade_date is None, f.last_trade_date))
+
+        return contracts
+
+    async def _load_bulk(
+        self, board: str | None, secids: list[str] | None = None
+    ) -> Snapshot[Future]:
+        board = board or FUTURES_BOARD
+        return await self._load_snapshot(
+            Future,
+            endpoints.securities(ENGINE, FUTURES_MARKET, board),
+            ("securities", "marketdata"),
+            [board],
+            per_secid=False,
+            params={"securities": ",".join(secids)} if secids else None,
+        )
+
+    def _endpoint(self, ticker: str) -> str:
+        return endpoints.security(ENGINE, FUTURES_MARKET, ticker)
+
+    def _board_endpoint(self, board: str, ticker: str) -> str:
+        return endpoints.security(ENGINE, FUTURES_MARKET, ticker, board)
+
+    def _parse(self, ticker: str, data: dict) -> Future:
+        if not data.get("securities", {}).get("data"):
+            logger.warning(f"Future {ticker} not found in MOEX response")
+            raise InstrumentNotFoundError(f"Future {ticker} not found")
+
+        sec_rows = parse_table(data["securities"])
+        md_rows = parse_table(data.get("marketdata", {}))
+
+        target_board = select_board(sec_rows, md_rows, [FUTURES_BOARD])
+
+        security = next(
+            (r for r in sec_rows if r["BOARDID"] == target_board), sec_rows[0]
+        )
+        market_data = next((r for r in md_rows if r["BOARDID"] == target_board), {})
+
+        return Future.model_validate({**security, **market_data})
@@ -0,0 +1,307 @@
+import asyncio
+import logging
+import math
+from datetime import date, datetime, time, timedelta
+
+from pymoex.core import endpoints
+from pymoex.core.ratelimit import RateLimiter
+from pymoex.core.store import SeriesKey, SeriesStore, open_store
+from pymoex.exceptions import MoexError
+from pymoex.models.candles import Candles, from_timestamp, to_timestamp
+from pymoex.models.enums import CandleInterval
+from pymoex.services.candles import CANDLES_PAGE
+from pymoex.utils.table import first_row
+
+logger = logging.getLogger(__name__)
+
+# Длительность торгового дня в истории (begin — 00:00:00, end — 23:59:59)
+_DAY_END = 86399
+
+
+def _day_start(day: date) -> int:
+    return to_timestamp(datetime.combine(day, time()))
+
+
+def _number(value) -> float:
+    # Отсутствующее значение — NaN, как в Candles
+    return float(value) if value is not None else math.nan
+
+
+class HistoryService:
+    """
+    Инкрементальная загрузка дневной истории и свечей в локальное хранилище.
+
+    Ряд (инструмент, режим торгов, интервал) загружается из ISS один раз.
+    При следующих вызовах запрашивается только хвост начиная с даты последней
+    сохраненной свечи (она перезаписывается — могла быть незавершенной)
+    и, если запрошен более ранний период, начало ряда до первой сохраненной
+    свечи.
+    """
+
+    def __init__(self, session, store: SeriesStore | None = None):
+        """
+        :param session: MoexSession
+        :param store: хранилище рядов; None — открыть по настройкам
+            (MOEX_STORE_BACKEND, MOEX_STORE_PATH) при первом обращении
+        """
+        self.session = session
+        self._store = store
+        self._locks: dict[SeriesKey, asyncio.Lock] = {}
+
+    @property
+    def store(self) -> SeriesStore:
+        if self._store is None:
+            settings = self.session.settings
+            backend = settings.store_backend.lower()
+            path = settings.store_path or settings.cache_dir / (
+                "series.sqlite" if backend == "sqlite" else "series"
+            )
+            self._store = open_store(backend, path)
+        return self._store
+
+    async def history(
+        self,
+        ticker: str,
+        board: str,
+        date_from: date | None = None,
+        date_till: date | None = None,
+        market: str = "shares",
+    ) -> Candles:
+        """
+        Дневная история торгов инструмента в режиме торгов.
+
+        :param ticker: торговый код
+        :param board: режим торгов (например, 'TQBR')
+        :param date_from: начало периода (и начало первичной загрузки)
+        :param date_till: конец периода
+        :param market: рынок ('shares', 'bonds', ...)
+        :return: дневные свечи (DAY_1) из локального хранилища
+        """
+        key = SeriesKey("history", ticker.upper(), board.upper(), CandleInterval.DAY_1)
+        return await self._read_synced(key, market, date_from, date_till)
+
+    async def candles(
+        self,
+        ticker: str,
+        board: str,
+        interval: CandleInterval | int = CandleInterval.DAY_1,
+        date_from: date | None = None,
+        date_till: date | None = None,
+        market: str = "shares",
+    ) -> Candles:
+        """
+        Свечи инструмента в режиме торгов с локальным хранением.
+
+        :param ticker: торговый код
+        :param board: режим торгов
+        :param interval: интервал свечей
+        :param date_from: начало периода (и начало первичной загрузки)
+        :param date_till: конец периода
+        :param market: рынок ('shares', 'bonds', ...)
+        """
+        key = SeriesKey(
+            "candles", ticker.upper(), board.upper(), CandleInterval(interval)
+        )
+        return await self._read_synced(key, market, date_from, date_till)
+
+    async def sync_history(
+        self,
+        tickers: list[str],
+        board: str,
+        date_from: date | None = None,
+        market: str = "shares",
+    ) -> dict[str, int | Exception]:
+        """
+        Догрузить дневную историю списка инструментов одного режима торгов.
+
+        Запросы идут параллельно с ограничением частоты
+        (MOEX_HISTORY_RATE, MOEX_HISTORY_CONCURRENCY). Ошибка загрузки
+        одного инструмента не прерывает остальные.
+
+        :param tickers: торговые коды
+        :param board: режим торгов
+        :param date_from: начало загрузки (ряды догружаются до этой даты)
+        :param market: рынок
+        :return: словарь тикер -> количество загруженных строк
+            или исключение, с которым загрузка инструмента завершилась
+        """
+        settings = self.session.settings
+        limiter = RateLimiter(settings.history_rate, settings.history_concurrency)
+
+        keys = [
+            SeriesKey("history", t, board.upper(), CandleInterval.DAY_1)
+            for t in dict.fromkeys(t.upper() for t in tickers)
+        ]
+        results = await asyncio.gather(
+            *(self._sync(key, market, date_from, None, limiter) for key in keys),
+            return_exceptions=True,
+        )
+
+        counts: dict[str, int | Exception] = {}
+        for key, result in zip(keys, results):
+            if isinstance(result, MoexError):
+                logger.warning(f"Failed to sync history for {key.secid}: {result}")
+            elif isinstance(result, Exception):
+                logger.error(
+                    f"Unexpected error syncing history for {key.secid}",
+                    exc_info=result,
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            counts[key.secid] = result
+
+        return counts
+
+    async def _read_synced(
+        self,
+        key: SeriesKey,
+        market: str,
+        date_from: date | None,
+        date_till: date | None,
+    ) -> Candles:
+        await self._sync(key, market, date_from, date_till)
+
+        since = _day_start(date_from) if date_from else None
+        till = _day_start(date_till) + _DAY_END if date_till else None
+        return await asyncio.to_thread(self.store.read, key, since, till)
+
+    async def _sync(
+        self,
+        key: SeriesKey,
+        market: str,
+        date_from: date | None,
+        date_till: date | None,
+        limiter: RateLimiter | None = None,
+    ) -> int:
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            span = await asyncio.to_thread(self.store.span, key)
+
+            # Отрезки (from, till), которых нет в хранилище
+            ranges: list[tuple[date | None, date | None]] = []
+            if span is None:
+                ranges.append((date_from, date_till))
+            else:
+                first_date = from_timestamp(span[0]).date()
+                last_date = from_timestamp(span[1]).date()
+
+                # Начало ряда раньше первой сохраненной свечи
+                if date_from is not None and date_from < first_date:
+                    head_till = first_date - timedelta(days=1)
+                    if date_till is not None:
+                        head_till = min(head_till, date_till)
+                    ranges.append((date_from, head_till))
+
+                # Хвост с последней сохраненной свечи (могла быть незавершенной)
+                if date_till is None or date_till >= last_date:
+                    ranges.append((last_date, date_till))
+
+            count = 0
+            for since, till in ranges:
+                part = await self._load(key, market, since, till, limiter)
+                await asyncio.to_thread(self.store.write, key, part)
+                count += len(part)
+
+        logger.debug(f"Synced {key.source} {key.secid}@{key.board}: {count} rows")
+
+        return count
+
+    async def _load(
+        self,
+        key: SeriesKey,
+        market: str,
+        date_from: date | None,
+        date_till: date | None,
+        limiter: RateLimiter | None,
+    ) -> Candles:
+        params: dict = {}
+        if date_from:
+            params["from"] = date_from.isoformat()
+        if date_till:
+            params["till"] = date_till.isoformat()
+
+        if key.source == "history":
+            return await self._load_history(key, market, params, limiter)
+        return await self._load_candles(key, market, params, limiter)
+
+    async def _load_history(
+        self,
+        key: SeriesKey,
+        market: str,
+        params: dict,
+        limiter: RateLimiter | None,
+    ) -> Candles:
+        path = endpoints.history(key.board, key.secid, market)
+        rows = []
+        start = 0
+
+        while True:
+            data = await self._get(path, {**params, "start": start}, limiter)
+
+            block = data.get("history", {})
+            pos = {name: i for i, name in enumerate(block.get("columns", []))}
+            page = block.get("data", [])
+
+            for r in page:
+                # Дни без сделок (CLOSE отсутствует) пропускаем
+                if r[pos["CLOSE"]] is None:
+                    continue
+                begin = _day_start(date.fromisoformat(r[pos["TRADEDATE"]]))
+                rows.append(
+                    (
+                        begin,
+                        begin + _DAY_END,
+                        _number(r[pos["OPEN"]]),
+                        _number(r[pos["HIGH"]]),
+                        _number(r[pos["LOW"]]),
+                        float(r[pos["CLOSE"]]),
+                        _number(r[pos["VALUE"]]),
+                        _number(r[pos["VOLUME"]]),
+                    )
+                )
+
+            cursor = first_row(data.get("history.cursor", {}))
+            if not cursor or not page:
+                break
+            end = cursor["INDEX"] + cursor["PAGESIZE"]
+            if end >= cursor["TOTAL"]:
+                break
+            start = end
+
+        return Candles.from_rows(key.interval, rows)
+
+    async def _load_candles(
+        self,
+        key: SeriesKey,
+        market: str,
+        params: dict,
+        limiter: RateLimiter | None,
+    ) -> Candles:
+        path = endpoints.candles_on_board(key.board, key.secid, market)
+        params = {**params, "interval": key.interval.value}
+        candles = Candles(key.interval)
+        start = 0
+
+        while True:
+            data = await self._get(path, {**params, "start": start}, limiter)
+
+            added = candles.extend(data.get("candles", {}))
+            if added < CANDLES_PAGE:
+                break
+
+            start += added
+
+        return candles
+
+    async def _get(self, path: str, params: dict, limiter: RateLimiter | None) -> dict:
+        if limiter is None:
+            return await self.session.get(path, params)
+
+        async with limiter:
+            return await self.session.get(path, params)
+
+    def close(self) -> None:
+        if self._store is not None:
+            self._store.close()
+            self._store = None
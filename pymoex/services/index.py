@@ -0,0 +1,104 @@
+import logging
+from datetime import date
+
+from pymoex.core import endpoints
+from pymoex.exceptions import InstrumentNotFoundError
+from pymoex.models.index import IndexBasket, IndexConstituent
+from pymoex.models.share import Share
+from pymoex.utils.table import first_row, parse_table
+
+logger = logging.getLogger(__name__)
+
+
+class IndexService:
+    """
+    Сервис индексов Московской биржи: состав, веса и котировки корзины.
+    """
+
+    def __init__(self, session, cache, shares):
+        """
+        :param session: MoexSession
+        :param cache: кэш составов индексов
+        :param shares: SharesService (снимок котировок корзины)
+        """
+        self.session = session
+        self.cache = cache
+        self.shares = shares
+
+    async def constituents(
+        self, index_id: str, on_date: date | None = None
+    ) -> list[IndexConstituent]:
+        """
+        Состав индекса и веса бумаг.
+
+        :param index_id: код индекса (например, 'IMOEX')
+        :param on_date: дата состава; None — последний доступный
+        :return: бумаги индекса в порядке ISS
+        """
+        index_id = index_id.upper()
+        cache_key = f"index:{index_id}:{on_date or 'last'}"
+
+        async def _fetch():
+            return await self._load(index_id, on_date)
+
+        return await self.cache.get_or_set(cache_key, _fetch)
+
+    async def basket(
+        self, index_id: str, board: str | None = None
+    ) -> IndexBasket[Share]:
+        """
+        Состав индекса вместе с котировками всех бумаг.
+
+        Котировки загружаются одним запросом снимка режима торгов
+        (параметр securities), а не отдельным запросом на каждую бумагу.
+
+        :param index_id: код индекса (например, 'IMOEX')
+        :param board: режим торгов котировок; по умолчанию — первый
+            из MOEX_PREFERRED_SHARE_BOARDS
+        """
+        constituents = await self.constituents(index_id)
+        board = board or self.session.settings.preferred_share_boards[0]
+
+        quotes = await self.shares.snapshot(
+            board, securities=[c.sec_id for c in constituents]
+        )
+
+        missing = len(constituents) - len(quotes)
+        if missing > 0:
+            logger.warning(f"{missing} {index_id} constituents not found on {board}")
+
+        return IndexBasket(constituents, quotes)
+
+    async def _load(
+        self, index_id: str, on_date: date | None
+    ) -> list[IndexConstituent]:
+        params: dict = {}
+        if on_date:
+            params["date"] = on_date.isoformat()
+
+        rows: list[dict] = []
+        start = 0
+
+        while True:
+            data = await self.session.get(
+                endpoints.index_analytics(index_id), {**params, "start": start}
+            )
+
+            page = parse_table(data["analytics"]) if data.get("analytics") else []
+            rows.extend(page)
+
+            cursor = first_row(data.get("analytics.cursor", {}))
+            if not cursor or not page:
+                break
+            end = cursor["INDEX"] + cursor["PAGESIZE"]
+            if end >= cursor["TOTAL"]:
+                break
+            start = end
+
+        if not rows:
+            logger.warning(f"Index {index_id} analytics is empty")
+            raise InstrumentNotFoundError(f"Index {index_id} not found")
+
+        logger.debug(f"Index {index_id}: {len(rows)} constituents")
+
+        return [IndexConstituent.model_validate(r) for r in rows]
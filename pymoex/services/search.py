@@ -1,71 +1,349 @@
+import asyncio
 import logging
+from typing import NamedTuple
 
 from pymoex.core import endpoints
 from pymoex.core.constants import MOEX_BOND_GROUPS, MOEX_FUND_GROUPS, MOEX_SHARE_GROUPS
+from pymoex.core.search_index import RowKeys, normalize, rank, row_keys
 from pymoex.models.enums import InstrumentType
 from pymoex.models.search import Search
 
 logger = logging.getLogger(__name__)
 
+# Поля, по которым ISS ищет подстроку запроса
+_MATCH_FIELDS = ("secid", "shortname", "name", "isin", "regnumber", "emitent_title")
+
+# Колонки ответа, которые нужны модели Search и ранжированию
+_COLUMNS = (
+    "secid,shortname,regnumber,name,isin,is_traded,emitent_id,emitent_title,"
+    "emitent_inn,emitent_okpo,type,group,primary_boardid,marketprice_boardid"
+)
+
+# Рынки ISS, на которых ищутся инструменты типа (фильтр на стороне ISS)
+_MARKETS = {
+    InstrumentType.SHARE: ("stock", "shares"),
+    InstrumentType.BOND: ("stock", "bonds"),
+}
+
+# Максимальный размер страницы /securities.json в ISS
+ISS_PAGE = 100
+
+# Сколько результатов возвращает поиск
+RESULTS_LIMIT = 20
+
+
+class _RawPage(NamedTuple):
+    """
+    Сырой ответ поиска вместе с ключами ранжирования.
+
+    complete=True означает, что ISS вернул все совпадения (меньше limit строк),
+    и более длинные запросы можно уточнять по этому набору локально.
+    """
+
+    rows: list[dict]
+    keys: list[RowKeys]
+    complete: bool
+
+    def extend(self, rows: list[dict], complete: bool) -> "_RawPage":
+        return _RawPage(
+            self.rows + rows, self.keys + [row_keys(r) for r in rows], complete
+        )
+
+    def refine(self, query_norm: str) -> "_RawPage":
+        # Те же поля, что и у ISS (_MATCH_FIELDS), по готовым ключам строк
+        q = normalize(query_norm)
+        picked = [
+            (r, k)
+            for r, k in zip(self.rows, self.keys)
+            if q in k.secid
+            or q in k.short
+            or q in k.name
+            or q in k.isin
+            or q in k.regnumber
+            or q in k.emitent
+        ]
+
+        return _RawPage([r for r, _ in picked], [k for _, k in picked], True)
+
 
 class SearchService:
-    def __init__(self, session, cache):
+    def __init__(self, session, cache, directory=None):
+        """
+        :param session: MoexSession
+        :param cache: кэш результатов поиска
+        :param directory: SecuritiesDirectory для локального поиска (опционально)
+        """
         self.session = session
         self.cache = cache
+        self.directory = directory
+
+        # Размер первой страницы ответа ISS и максимум строк на запрос:
+        # страницы догружаются, только если после ранжирования не хватает
+        # результатов (RESULTS_LIMIT)
+        self.page_size = 50
+        self.limit = 1000
 
     async def find(
         self,
         query: str,
         instrument_type: InstrumentType | str | None = None,
+        traded_only: bool = False,
     ) -> list[Search]:
+        """
+        Поиск инструментов.
+
+        Тип инструмента и признак торгов передаются в ISS (engine/market,
+        is_trading), ответ урезается до нужных колонок. Сначала запрашивается
+        небольшая страница, следующие — только если после ранжирования
+        результатов меньше RESULTS_LIMIT.
+
+        :param query: строка поиска
+        :param instrument_type: 'share', 'bond' или None (всё)
+        :param traded_only: только инструменты, которые торгуются
+        """
         query_norm = query.strip().lower()
         itype = self._normalize_instrument_type(instrument_type)
 
         logger.debug(f"Search query='{query_norm}' type={itype}")
 
+        if self.directory is not None:
+            index = await self.directory.index()
+            ids = index.lookup(query_norm)
+
+            return self._build_results(
+                [index.rows[i] for i in ids],
+                itype,
+                query_norm,
+                keys=[index.keys[i] for i in ids],
+                traded_only=traded_only,
+            )
+
+        async def _fetch():
+            return await self._search(query_norm, itype, traded_only)
+
+        return await self.cache.get_or_set(
+            self._cache_key(query_norm, itype, traded_only), _fetch
+        )
+
+    async def refresh(
+        self,
+        query: str,
+        instrument_type: InstrumentType | str | None = None,
+        traded_only: bool = False,
+    ) -> list[Search]:
+        """
+        Повторить поиск в ISS и заменить результат в кэше
+        (прежний результат доступен до замены).
+
+        Параметры как у find.
+        """
+        query_norm = query.strip().lower()
+        itype = self._normalize_instrument_type(instrument_type)
+
+        if self.directory is not None:
+            return await self.find(query, itype, traded_only)
+
+        # Сырой ответ запроса загрузится заново (или уточнится из полного
+        # ответа на более короткий запрос, если он еще в кэше)
+        scope = self._scope(itype, traded_only)
+        await self.cache.delete(f"search_raw:{scope}:{query_norm}")
+
+        results = await self._search(query_norm, itype, traded_only)
+        await self.cache.set(self._cache_key(query_norm, itype, traded_only), results)
+
+        return results
+
+    @staticmethod
+    def _cache_key(
+        query_norm: str, itype: InstrumentType | None, traded_only: bool
+    ) -> str:
         cache_key = f"search:{query_norm}:{itype.value if itype else 'all'}"
+        if traded_only:
+            cache_key += ":traded"
+        return cache_key
+
+    async def _search(
+        self, query_norm: str, itype: InstrumentType | None, traded_only: bool
+    ) -> list[Search]:
+        scope = self._scope(itype, traded_only)
+
+        page = await self._raw_results(query_norm, scope)
+        results = self._build_results(
+            page.rows, itype, query_norm, page.keys, traded_only
+        )
+
+        # Адаптивный лимит: догружаем, только если результатов не хватает
+        while len(results) < RESULTS_LIMIT and not page.complete:
+            page = await self._grow(query_norm, scope, page)
+            results = self._build_results(
+                page.rows, itype, query_norm, page.keys, traded_only
+            )
+
+        return results
+
+    async def _raw_results(self, query_norm: str, scope: str = "all") -> "_RawPage":
+        """
+        Сырой (не отфильтрованный по типу) ответ ISS для запроса.
+
+        Один раз кэшируется на запрос и область поиска, представления
+        строятся из него локально. Если в кэше есть полный ответ для более
+        короткого префикса (или для более широкой области), запрос уточняется
+        локально без обращения к ISS.
+        """
 
         async def _fetch():
-            data = await self.session.get(
-                endpoints.search(),
-                params={"q": query_norm, "limit": 1000},
+            for n in range(len(query_norm), 0, -1):
+                for candidate in self._wider_scopes(scope):
+                    # Сам запрос в той же области — это и есть текущий ключ
+                    if n == len(query_norm) and candidate == scope:
+                        continue
+
+                    key = f"search_raw:{candidate}:{query_norm[:n]}"
+                    prefix_page = await self.cache.get(key)
+
+                    if prefix_page is not None and prefix_page.complete:
+                        logger.debug(
+                            f"Search '{query_norm}' ({scope}) refined from cached "
+                            f"'{query_norm[:n]}' ({candidate})"
+                        )
+                        return prefix_page.refine(query_norm)
+
+            rows, complete = await self._download(query_norm, scope, 0, self.page_size)
+
+            logger.debug(f"MOEX returned {len(rows)} raw items for '{query_norm}'")
+
+            return _RawPage(rows, [row_keys(r) for r in rows], complete)
+
+        return await self.cache.get_or_set(f"search_raw:{scope}:{query_norm}", _fetch)
+
+    async def _grow(self, query_norm: str, scope: str, page: "_RawPage") -> "_RawPage":
+        """
+        Догрузить следующую порцию ответа (вдвое больше загруженного,
+        не больше self.limit строк всего) и обновить кэш сырого ответа.
+        """
+        loaded = len(page.rows)
+        count = min(loaded, self.limit - loaded)
+
+        if count <= 0:
+            return page._replace(complete=True)
+
+        rows, complete = await self._download(query_norm, scope, loaded, count)
+        page = page.extend(rows, complete)
+
+        logger.debug(f"Search '{query_norm}' grown to {len(page.rows)} rows")
+
+        await self.cache.set(f"search_raw:{scope}:{query_norm}", page)
+        return page
+
+    async def _download(
+        self, query_norm: str, scope: str, start: int, count: int
+    ) -> tuple[list[dict], bool]:
+        """
+        Загрузить count строк ответа ISS начиная со start (страницами ISS_PAGE).
+
+        :return: (строки, ответ исчерпан)
+        """
+        params = {
+            "q": query_norm,
+            "iss.meta": "off",
+            "iss.only": "securities",
+            "securities.columns": _COLUMNS,
+        }
+
+        market, _, traded = scope.partition(":")
+        if market != "all":
+            params["engine"], params["market"] = market.split("/")
+        if traded:
+            params["is_trading"] = 1
+
+        limits = [
+            (offset, min(ISS_PAGE, start + count - offset))
+            for offset in range(start, start + count, ISS_PAGE)
+        ]
+        pages = await asyncio.gather(
+            *(
+                self.session.get(
+                    endpoints.search(), params={**params, "start": s, "limit": n}
+                )
+                for s, n in limits
             )
+        )
 
+        rows: list[dict] = []
+        complete = False
+        for data, (_, n) in zip(pages, limits):
             sec_data = data.get("securities", {})
             columns = sec_data.get("columns", [])
-            rows = sec_data.get("data", [])
+            page_rows = sec_data.get("data", [])
 
             # Превращаем списки в словари
-            raw = [dict(zip(columns, row)) for row in rows]
+            rows.extend(dict(zip(columns, row)) for row in page_rows)
 
-            logger.debug(f"MOEX returned {len(raw)} raw items for '{query_norm}'")
+            if len(page_rows) < n:
+                complete = True
+                break
 
-            # Фильтрация по типу
-            filtered = self._filter_by_type(raw, itype)
+        return rows, complete
 
-            if len(filtered) != len(raw):
-                logger.debug(f"Filtered by type {itype}: {len(raw)} -> {len(filtered)}")
+    @staticmethod
+    def _scope(itype: InstrumentType | None, traded_only: bool) -> str:
+        """
+        Область поиска ISS: 'all' или 'engine/market', ':traded' — только
+        торгуемые инструменты.
+        """
+        scope = "/".join(_MARKETS[itype]) if itype in _MARKETS else "all"
+        return f"{scope}:traded" if traded_only else scope
 
-            ranked = self._rank_results(filtered, query_norm)
+    @staticmethod
+    def _wider_scopes(scope: str) -> list[str]:
+        """
+        Области, полный ответ которых содержит все строки scope
+        (лишнее отсекается локальной фильтрацией).
+        """
+        market, _, traded = scope.partition(":")
+        markets = [market, "all"] if market != "all" else ["all"]
+        suffixes = [":traded", ""] if traded else [""]
+        return [m + suffix for m in markets for suffix in suffixes]
+
+    def _build_results(
+        self,
+        raw: list[dict],
+        itype: InstrumentType | None,
+        query_norm: str,
+        keys: list[RowKeys] | None = None,
+        traded_only: bool = False,
+    ) -> list[Search]:
+        if keys is None:
+            keys = [row_keys(r) for r in raw]
 
-            if not ranked and filtered:
-                logger.debug(
-                    f"Ranking removed all results for '{query_norm}' (no strict matches)"
-                )
+        # Фильтрация по типу
+        filtered = self._filter_by_type(raw, itype)
+        if traded_only:
+            filtered = [r for r in filtered if r.get("is_traded")]
+
+        if len(filtered) != len(raw):
+            logger.debug(f"Filtered by type {itype}: {len(raw)} -> {len(filtered)}")
+            kept = {id(r) for r in filtered}
+            keys = [k for r, k in zip(raw, keys) if id(r) in kept]
+
+        ranked = self._rank_results(filtered, query_norm, keys)
 
-            uniq = {}
-            for r in ranked:
-                sid = r.get("secid")
-                if sid and sid.upper() not in uniq:
-                    uniq[sid.upper()] = r
+        if not ranked and filtered:
+            logger.debug(
+                f"Ranking removed all results for '{query_norm}' (no strict matches)"
+            )
 
-            results = [Search(**r) for r in uniq.values()]
+        uniq = {}
+        for r in ranked:
+            sid = r.get("secid")
+            if sid and sid.upper() not in uniq:
+                uniq[sid.upper()] = r
 
-            logger.debug(f"Found {len(results)} unique results for '{query_norm}'")
+        results = [Search(**r) for r in uniq.values()]
 
-            return results
+        logger.debug(f"Found {len(results)} unique results for '{query_norm}'")
 
-        return await self.cache.get_or_set(cache_key, _fetch)
+        return results
 
     def _filter_by_type(
         self, raw: list[dict], itype: InstrumentType | None
@@ -97,38 +375,11 @@ class SearchService:
         except ValueError:
             raise ValueError(f"Unknown instrument type: {value!r}")
 
-    def _rank_results(self, raw: list[dict], query: str) -> list[dict]:
-        def norm(s: str | None) -> str:
-            return s.lower().replace(" ", "") if isinstance(s, str) else ""
-
-        q = norm(query)
-
-        def score(r: dict) -> int:
-            secid = norm(r.get("secid"))
-            short = norm(r.get("shortname"))
-            isin = norm(r.get("isin"))
-            full_name = norm(r.get("name"))
-
-            if secid == q or isin == q:
-                return 100
-            if short == q:
-                return 90
-            if q in secid:
-                return 80
-            if q in short:
-                return 70
-            if q in full_name:
-                return 65
-            return 0
-
-        # Считаем очки
-        scored = [(score(r), r) for r in raw]
-
-        # Оставляем только те, где score > 0
-        scored = [x for x in scored if x[0] > 0]
-
-        scored.sort(
-            key=lambda x: (x[0], -len(x[1].get("secid", "") or "")), reverse=True
-        )
+    def _rank_results(
+        self, raw: list[dict], query: str, keys: list[RowKeys] | None = None
+    ) -> list[dict]:
+        # Ключи строк берутся из индекса или считаются один раз на ответ ISS
+        if keys is None:
+            keys = [row_keys(r) for r in raw]
 
-        return [r for s, r in scored][:20]
+        return rank(raw, keys, query, limit=RESULTS_LIMIT)
@@ -1,34 +1,72 @@
 import logging
 
 from pymoex.core import endpoints
+from pymoex.core.constants import ALL_EQUITY_SEARCH
 from pymoex.exceptions import InstrumentNotFoundError
 from pymoex.models.share import Share
+from pymoex.models.snapshot import Snapshot
+from pymoex.services.base import InstrumentService, select_board
 from pymoex.utils.table import parse_table
 
 logger = logging.getLogger(__name__)
 
 
-class SharesService:
+class SharesService(InstrumentService):
     """
     Сервис для получения данных по акциям.
     """
 
-    def __init__(self, session, cache):
-        self.session = session
-        self.cache = cache
+    kind = "share"
+    groups = ALL_EQUITY_SEARCH
 
     async def get_share(self, ticker: str) -> Share:
         ticker = ticker.upper()
         cache_key = f"share:{ticker}"
 
         async def _fetch():
-            return await self._load_share(ticker)
+            return await self._load(ticker)
 
-        return await self.cache.get_or_set(cache_key, _fetch, ttl=60)
+        return await self.cache.get_or_set(cache_key, _fetch, ttl=self._ttl)
 
-    async def _load_share(self, ticker: str) -> Share:
-        data = await self.session.get(endpoints.share(ticker))
+    async def snapshot(
+        self, board: str | None = None, securities: list[str] | None = None
+    ) -> Snapshot[Share]:
+        """
+        Все акции режима торгов (или выбранные бумаги) одним запросом.
 
+        :param board: режим торгов (например, 'TQBR'); None — весь рынок акций,
+            для каждой бумаги выбирается один режим
+        :param securities: ограничить снимок этими SECID
+        :return: Snapshot с моделями Share
+        """
+        board = board.upper() if board else None
+        secids = sorted({s.upper() for s in securities}) if securities else []
+        cache_key = f"shares:{board or 'all'}:{','.join(secids)}"
+
+        async def _fetch():
+            return await self._load_bulk(board, secids)
+
+        return await self.cache.get_or_set(cache_key, _fetch, ttl=self._ttl)
+
+    async def _load_bulk(
+        self, board: str | None, secids: list[str] | None = None
+    ) -> Snapshot[Share]:
+        return await self._load_snapshot(
+            Share,
+            endpoints.shares(board),
+            ("securities", "marketdata"),
+            self.session.settings.preferred_share_boards,
+            per_secid=board is None,
+            params={"securities": ",".join(secids)} if secids else None,
+        )
+
+    def _endpoint(self, ticker: str) -> str:
+        return endpoints.share(ticker)
+
+    def _board_endpoint(self, board: str, ticker: str) -> str:
+        return endpoints.share_on_board(board, ticker)
+
+    def _parse(self, ticker: str, data: dict) -> Share:
         if not data.get("securities", {}).get("data"):
             logger.warning(f"Share {ticker} not found in MOEX response")
             raise InstrumentNotFoundError(f"Share {ticker} not found")
@@ -38,38 +76,7 @@ class SharesService:
 
         # Список приоритетных режимов для акций и фондов
         priority_boards = self.session.settings.preferred_share_boards
-
-        # Определяем, в каких режимах сейчас есть торги
-        active_boards = {
-            row["BOARDID"]
-            for row in md_rows
-            if (
-                row.get("LAST") is not None
-                or row.get("LCLOSEPRICE") is not None
-                or row.get("LCURRENTPRICE") is not None
-            )
-        }
-
-        target_board = None
-
-        # Ищем приоритетный борд, который активен
-        for board in priority_boards:
-            if board in active_boards:
-                target_board = board
-                break
-
-        # Если приоритетных нет, берем любой активный
-        if not target_board and active_boards:
-            target_board = list(active_boards)[0]
-
-        # Если торгов нет вообще
-        if not target_board:
-            priority_in_sec = [
-                r["BOARDID"] for r in sec_rows if r["BOARDID"] in priority_boards
-            ]
-            target_board = (
-                priority_in_sec[0] if priority_in_sec else sec_rows[0]["BOARDID"]
-            )
+        target_board = select_board(sec_rows, md_rows, priority_boards)
 
         logger.debug(f"Selected board '{target_board}' for share {ticker}")
 
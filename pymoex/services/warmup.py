@@ -0,0 +1,195 @@
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable
+
+from pymoex.exceptions import MoexError
+from pymoex.services.base import PRELOAD_CHUNK, InstrumentService
+
+logger = logging.getLogger(__name__)
+
+# Запись обновляется за эту долю TTL до истечения
+REFRESH_AHEAD = 0.2
+
+# Случайный сдвиг момента обновления (доля TTL), чтобы задачи не совпадали
+JITTER = 0.1
+
+# Минимальный интервал между обновлениями одной задачи (секунды)
+MIN_INTERVAL = 1.0
+
+# Повтор после ошибки загрузки (секунды)
+RETRY_INTERVAL = 5.0
+
+# Задача прогрева: загружает данные в кэш и возвращает их TTL
+Job = Callable[[], Awaitable[float]]
+
+
+class Warmer:
+    """
+    Прогрев кэшей клиента для заранее известного набора инструментов
+    и поисковых запросов.
+
+    При запуске котировки загружаются снимками рынка (до PRELOAD_CHUNK бумаг
+    на запрос, бумаги вне снимка — по одной), затем каждая задача обновляет
+    свои записи в фоне до истечения TTL (со случайным сдвигом). Одновременно
+    выполняется не больше concurrency задач. Обработчики запросов видят
+    только попадания в кэш.
+
+    Пример:
+        warmer = await client.keep_warm(shares=["SBER", "GAZP"], searches=["сбер"])
+        ...
+        await client.close()  # останавливает прогрев
+    """
+
+    def __init__(
+        self,
+        shares: InstrumentService,
+        bonds: InstrumentService,
+        search,
+        share_tickers: list[str] | None = None,
+        bond_tickers: list[str] | None = None,
+        queries: list[str] | None = None,
+        concurrency: int = 4,
+        seed: int | None = None,
+    ):
+        """
+        :param shares: SharesService
+        :param bonds: BondsService
+        :param search: SearchService
+        :param share_tickers: акции
+        :param bond_tickers: облигации (SECID или ISIN)
+        :param queries: поисковые запросы (как в MoexClient.find)
+        :param concurrency: одновременных загрузок
+        :param seed: seed случайного сдвига (для воспроизводимости)
+        """
+        self.shares = shares
+        self.bonds = bonds
+        self.search = search
+        self.share_tickers = [t.upper() for t in share_tickers or []]
+        self.bond_tickers = [t.upper() for t in bond_tickers or []]
+        self.queries = list(queries or [])
+
+        self.refreshes = 0
+        self.errors = 0
+
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._rng = random.Random(seed)
+        self._tasks: list[asyncio.Task] = []
+
+        # Задачи для бумаг, не найденных в снимке (еще не запущены)
+        self._new_jobs: list[Job] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not t.done() for t in self._tasks)
+
+    async def start(self) -> None:
+        """
+        Загрузить все данные и запустить фоновое обновление.
+
+        Ошибки загрузки не пробрасываются: задача повторяется через
+        RETRY_INTERVAL.
+        """
+        jobs: list[Job] = []
+        for service, tickers in (
+            (self.shares, self.share_tickers),
+            (self.bonds, self.bond_tickers),
+        ):
+            for start in range(0, len(tickers), PRELOAD_CHUNK):
+                chunk = tickers[start : start + PRELOAD_CHUNK]
+                jobs.append(self._bulk_job(service, chunk))
+
+        jobs.extend(self._search_job(q) for q in self.queries)
+
+        ttls = await asyncio.gather(*(self._run(job) for job in jobs))
+
+        # Бумаги вне снимка загружаются по одной, тоже до возврата из start
+        extra, self._new_jobs = self._new_jobs, []
+        ttls += await asyncio.gather(*(self._run(job) for job in extra))
+
+        self._schedule(jobs + extra, ttls)
+
+        logger.debug(
+            f"Warmed {len(self.share_tickers)} shares, {len(self.bond_tickers)} "
+            f"bonds, {len(self.queries)} searches"
+        )
+
+    async def stop(self) -> None:
+        """Остановить фоновое обновление."""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _schedule(self, jobs: list[Job], ttls: list[float | None]) -> None:
+        for job, ttl in zip(jobs, ttls):
+            self._tasks.append(asyncio.create_task(self._keep(job, ttl)))
+
+    def _bulk_job(self, service: InstrumentService, tickers: list[str]) -> Job:
+        missing: set[str] = set()
+
+        async def job() -> float:
+            loaded = await service.preload(tickers)
+
+            # Бумаги вне снимка рынка обновляются отдельными задачами
+            new = [t for t in tickers if t not in loaded and t not in missing]
+            if new:
+                missing.update(new)
+                logger.debug(f"{len(new)} {service.kind} tickers not in snapshot")
+                self._new_jobs.extend(self._ticker_job(service, t) for t in new)
+
+            ttls = [service._ttl(m) for m in loaded.values()]
+            return min((t for t in ttls if t is not None), default=service.cache.ttl)
+
+        return job
+
+    @staticmethod
+    def _ticker_job(service: InstrumentService, ticker: str) -> Job:
+        async def job() -> float:
+            instrument = await service.refresh(ticker)
+            ttl = service._ttl(instrument)
+            return ttl if ttl is not None else service.cache.ttl
+
+        return job
+
+    def _search_job(self, query: str) -> Job:
+        async def job() -> float:
+            await self.search.refresh(query)
+            return self.search.cache.ttl
+
+        return job
+
+    async def _run(self, job: Job) -> float | None:
+        """Выполнить задачу; None — ошибка (повтор через RETRY_INTERVAL)."""
+        async with self._semaphore:
+            try:
+                ttl = await job()
+            except MoexError as e:
+                logger.warning(f"Cache warm-up failed: {e}")
+                self.errors += 1
+                return None
+            except Exception:
+                logger.exception("Unexpected error in cache warm-up")
+                self.errors += 1
+                return None
+
+        self.refreshes += 1
+        return ttl
+
+    async def _keep(self, job: Job, ttl: float | None) -> None:
+        while True:
+            await asyncio.sleep(self._interval(ttl))
+            ttl = await self._run(job)
+
+            if self._new_jobs:
+                extra, self._new_jobs = self._new_jobs, []
+                self._schedule(extra, [0.0] * len(extra))
+
+    def _interval(self, ttl: float | None) -> float:
+        if ttl is None:
+            return RETRY_INTERVAL
+        if ttl <= 0:
+            return 0.0
+
+        jitter = self._rng.uniform(0, ttl * JITTER)
+        return max(MIN_INTERVAL, ttl * (1 - REFRESH_AHEAD) - jitter)
@@ -0,0 +1,21 @@
+"""
+Инструменты для тестов и нагрузочного тестирования без обращения к бирже.
+
+- RecordingTransport — записывает реальные ответы ISS в кассету;
+- ReplayTransport — отвечает записанными ответами без сети;
+- StandIn — локальный заменитель ISS (ASGI) с задержками, ошибками
+  и ограничением частоты; как отдельный сервер нужен extra testing:
+    uv add "pymoex[testing]"
+"""
+
+from .cassette import Cassette, RecordingTransport, ReplayTransport, request_key
+from .standin import StandIn, StandInStats
+
+__all__ = [
+    "Cassette",
+    "RecordingTransport",
+    "ReplayTransport",
+    "StandIn",
+    "StandInStats",
+    "request_key",
+]
@@ -0,0 +1,211 @@
+"""
+Запись и воспроизведение ответов ISS.
+
+Ответы хранятся в каталоге (кассете): один JSON-файл на запрос, имя файла —
+хэш метода, пути и отсортированных query-параметров. Хост в ключ не входит,
+поэтому записанное с iss.moex.com воспроизводится и локальным сервером
+(pymoex.testing.standin), если базовый URL заканчивается тем же /iss.
+
+Пример записи:
+    transport = RecordingTransport("fixtures/iss")
+    async with MoexClient(transport=transport) as client:
+        await client.share("SBER")
+
+Пример воспроизведения без сети:
+    async with MoexClient(transport=ReplayTransport("fixtures/iss")) as client:
+        await client.share("SBER")
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import NamedTuple
+from urllib.parse import parse_qsl, urlencode
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(method: str, path: str, query: str | bytes = "") -> str:
+    """
+    Ключ запроса: метод, путь и query-параметры в отсортированном порядке.
+
+    :param method: HTTP-метод
+    :param path: путь URL (например, /iss/securities.json)
+    :param query: строка query-параметров
+    """
+    if isinstance(query, bytes):
+        query = query.decode("ascii")
+    params = sorted(parse_qsl(query, keep_blank_values=True))
+    return f"{method.upper()} {path}?{urlencode(params)}"
+
+
+class Entry(NamedTuple):
+    """Записанный ответ."""
+
+    key: str
+    status: int
+    content_type: str
+    body: bytes
+
+    def response(self, request: httpx.Request | None = None) -> httpx.Response:
+        return httpx.Response(
+            self.status,
+            headers={"content-type": self.content_type},
+            content=self.body,
+            request=request,
+        )
+
+
+class Cassette:
+    """
+    Каталог записанных ответов ISS.
+
+    Файлы читаются один раз при первом обращении и держатся в памяти.
+    """
+
+    def __init__(self, directory: str | Path | None = None):
+        """
+        :param directory: каталог кассеты (создается при первой записи);
+            None — кассета только в памяти
+        """
+        self.directory = Path(directory).expanduser() if directory else None
+        self._entries: dict[str, Entry] | None = None
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def get(self, method: str, path: str, query: str | bytes = "") -> Entry | None:
+        """Записанный ответ на запрос или None."""
+        return self._load().get(request_key(method, path, query))
+
+    def put(
+        self,
+        method: str,
+        path: str,
+        query: str | bytes,
+        status: int,
+        content_type: str,
+        body: bytes,
+    ) -> Entry:
+        """Сохранить ответ (в память и на диск)."""
+        key = request_key(method, path, query)
+        entry = Entry(key, status, content_type, body)
+        self._load()[key] = entry
+
+        if self.directory is None:
+            return entry
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        data = {
+            "key": key,
+            "status": status,
+            "content_type": content_type,
+            "body": body.decode("utf-8"),
+        }
+        self._path(key).write_text(
+            json.dumps(data, ensure_ascii=False), encoding="utf-8"
+        )
+
+        logger.debug(f"Recorded {key} ({len(body)} bytes)")
+
+        return entry
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:20]
+        return self.directory / f"{digest}.json"
+
+    def _load(self) -> dict[str, Entry]:
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if self.directory is not None and self.directory.exists():
+            for path in sorted(self.directory.glob("*.json")):
+                data = json.loads(path.read_text(encoding="utf-8"))
+                self._entries[data["key"]] = Entry(
+                    data["key"],
+                    data["status"],
+                    data["content_type"],
+                    data["body"].encode("utf-8"),
+                )
+
+        logger.debug(f"Loaded {len(self._entries)} responses from {self.directory}")
+
+        return self._entries
+
+
+def _cassette(cassette: Cassette | str | Path) -> Cassette:
+    return cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Транспорт, который выполняет запросы и записывает успешные ответы.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette | str | Path,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        """
+        :param cassette: кассета или ее каталог
+        :param transport: транспорт реальных запросов (по умолчанию HTTP)
+        """
+        self.cassette = _cassette(cassette)
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        try:
+            # aread() снимает content-encoding: сохраняем и отдаем тело как есть
+            body = await response.aread()
+        finally:
+            await response.aclose()
+
+        content_type = response.headers.get("content-type", "application/json")
+
+        if response.status_code == 200:
+            self.cassette.put(
+                request.method,
+                request.url.path,
+                request.url.query,
+                response.status_code,
+                content_type,
+                body,
+            )
+
+        return httpx.Response(
+            response.status_code,
+            headers={"content-type": content_type},
+            content=body,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Транспорт, который отвечает записанными ответами без сети.
+
+    Незаписанные запросы получают 404 (MoexNetworkError в сессии).
+    """
+
+    def __init__(self, cassette: Cassette | str | Path):
+        """
+        :param cassette: кассета или ее каталог
+        """
+        self.cassette = _cassette(cassette)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry = self.cassette.get(request.method, request.url.path, request.url.query)
+        if entry is None:
+            logger.warning(f"No recorded response for {request.method} {request.url}")
+            return httpx.Response(404, request=request)
+
+        return entry.response(request)
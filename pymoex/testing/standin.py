@@ -0,0 +1,256 @@
+"""
+Локальный заменитель ISS: ASGI-приложение, которое отдает записанные ответы
+с настраиваемыми задержкой, разбросом, долей ошибок и ограничением частоты.
+
+Внутри процесса (без сети и без сервера):
+    standin = StandIn("fixtures/iss", latency=0.02, jitter=0.01)
+    async with MoexClient(transport=standin.transport()) as client:
+        await client.share("SBER")
+    print(standin.stats)
+
+Отдельным сервером (нужен extra testing):
+    python -m pymoex.testing.standin fixtures/iss --port 8000 --latency 0.02
+    MOEX_BASE_URL=http://127.0.0.1:8000/iss python app.py
+
+С --record незаписанные ответы запрашиваются у ISS (--upstream-url)
+и дописываются в кассету.
+"""
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+from pymoex.testing.cassette import Cassette, Entry
+
+logger = logging.getLogger(__name__)
+
+# Откуда запрашиваются незаписанные ответы
+UPSTREAM_URL = "https://iss.moex.com/iss"
+
+
+@dataclass
+class StandInStats:
+    """Счетчики запросов к заменителю ISS."""
+
+    requests: int = 0  # всего запросов
+    served: int = 0  # отдано записанных ответов
+    recorded: int = 0  # ответов получено от upstream и записано
+    missing: int = 0  # 404: ответ не записан
+    errors: int = 0  # 503: внесенные ошибки
+    throttled: int = 0  # 429: превышен лимит частоты
+
+
+class StandIn:
+    """
+    ASGI-приложение, воспроизводящее записанные ответы ISS.
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette | str | Path,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate: float = 0.0,
+        burst: int | None = None,
+        seed: int | None = None,
+        upstream: httpx.AsyncBaseTransport | None = None,
+        upstream_url: str = UPSTREAM_URL,
+    ):
+        """
+        :param cassette: кассета или ее каталог (см. RecordingTransport)
+        :param latency: задержка ответа в секундах
+        :param jitter: случайный разброс задержки (±jitter секунд)
+        :param error_rate: доля ответов 503 (от 0 до 1)
+        :param rate: запросов в секунду, сверх которых отвечаем 429
+            (0 — без ограничения)
+        :param burst: допустимый всплеск запросов (по умолчанию равен rate)
+        :param seed: зерно генератора задержек и ошибок
+        :param upstream: транспорт, у которого запрашиваются незаписанные
+            ответы (они дописываются в кассету); None — отвечать 404
+        :param upstream_url: адрес ISS для upstream; путь запроса, который
+            не начинается с пути этого адреса (/iss), дополняется им
+        """
+        self.cassette = cassette if isinstance(cassette, Cassette) else Cassette(
+            cassette
+        )
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self.upstream = upstream
+        self.upstream_url = httpx.URL(upstream_url)
+
+        self.stats = StandInStats()
+
+        self._random = random.Random(seed)
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+
+    def transport(self) -> httpx.ASGITransport:
+        """Транспорт httpx для работы с заменителем внутри процесса."""
+        return httpx.ASGITransport(app=self)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+
+        if scope["type"] != "http":
+            return
+
+        self.stats.requests += 1
+
+        if not self._allow():
+            self.stats.throttled += 1
+            await self._send(send, 429, b"Too Many Requests")
+            return
+
+        delay = self.latency
+        if self.jitter:
+            delay += self._random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            self.stats.errors += 1
+            await self._send(send, 503, b"Service Unavailable")
+            return
+
+        method, path = scope["method"], scope["path"]
+        query = scope.get("query_string", b"")
+
+        entry = self.cassette.get(method, path, query)
+        if entry is None and self.upstream is not None:
+            entry = await self._record(method, path, query)
+
+        if entry is None:
+            self.stats.missing += 1
+            logger.debug(f"No recorded response for {scope['path']}")
+            await self._send(send, 404, b"Not Found")
+            return
+
+        self.stats.served += 1
+        await self._send(send, entry.status, entry.body, entry.content_type)
+
+    async def _record(self, method: str, path: str, query: bytes) -> Entry | None:
+        # Путь заменителя совпадает с путем ISS (/iss/...) или задан без него
+        target = path
+        prefix = self.upstream_url.path.rstrip("/")
+        if target != prefix and not target.startswith(prefix + "/"):
+            target = prefix + target
+
+        url = self.upstream_url.copy_with(path=target, query=query or None)
+        response = await self.upstream.handle_async_request(
+            httpx.Request(method, url)
+        )
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+
+        if response.status_code != 200:
+            return None
+
+        self.stats.recorded += 1
+        content_type = response.headers.get("content-type", "application/json")
+        return self.cassette.put(method, path, query, 200, content_type, body)
+
+    def _allow(self) -> bool:
+        # Token bucket: rate токенов в секунду, не больше burst в запасе
+        if not self.rate:
+            return True
+
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._refilled_at) * self.rate
+        )
+        self._refilled_at = now
+
+        if self._tokens < 1:
+            return False
+
+        self._tokens -= 1
+        return True
+
+    @staticmethod
+    async def _send(
+        send, status: int, body: bytes, content_type: str = "text/plain"
+    ) -> None:
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", content_type.encode("latin-1")),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _lifespan(receive, send) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+
+def _uvicorn():
+    try:
+        import uvicorn
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "Stand-in server requires uvicorn: uv add 'pymoex[testing]'"
+        ) from e
+    return uvicorn
+
+
+def main():  # pragma: no cover
+    parser = argparse.ArgumentParser(description="Локальный заменитель MOEX ISS")
+    parser.add_argument("cassette", help="каталог записанных ответов")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate", type=float, default=0.0)
+    parser.add_argument("--burst", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="запрашивать незаписанные ответы у ISS и дописывать в кассету",
+    )
+    parser.add_argument("--upstream-url", default=UPSTREAM_URL)
+    args = parser.parse_args()
+
+    app = StandIn(
+        args.cassette,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate=args.rate,
+        burst=args.burst,
+        seed=args.seed,
+        upstream=httpx.AsyncHTTPTransport(retries=1) if args.record else None,
+        upstream_url=args.upstream_url,
+    )
+    print(f"{len(app.cassette)} recorded responses from {args.cassette}")
+
+    _uvicorn().run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
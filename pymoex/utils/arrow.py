@@ -0,0 +1,263 @@
+"""
+Экспорт таблиц ISS в Apache Arrow / Parquet (нужен extra parquet).
+
+Колонки строятся напрямую из блоков ISS (columns + data), без создания
+Pydantic-моделей на каждую строку. Типы колонок берутся из полей модели:
+- MoexDecimal -> decimal128 (decimal256 для чисел, которые в него не
+  помещаются; float64 при decimals=False);
+- MoexDate    -> date32 ('0000-00-00' -> null);
+- MoexInt     -> int64;
+- остальные — по аннотации поля (str, int, bool, ...).
+"""
+
+import logging
+from datetime import date
+from decimal import Context, Decimal, InvalidOperation
+from pathlib import Path
+from typing import Any, Iterable, Sequence, Type
+
+from pydantic import BaseModel
+
+from pymoex.utils.types import parse_decimal, parse_int, safe_date
+
+logger = logging.getLogger(__name__)
+
+# Точность decimal-колонок: 28 знаков до запятой, 10 после
+DECIMAL_PRECISION = 38
+DECIMAL_SCALE = 10
+
+# Колонки с числами от 10**28 по модулю хранятся как decimal256
+DECIMAL256_PRECISION = 76
+
+_QUANTUM = Decimal(1).scaleb(-DECIMAL_SCALE)
+_DECIMAL_CONTEXT = Context(prec=DECIMAL256_PRECISION)
+_DECIMAL128_LIMIT = Decimal(10) ** (DECIMAL_PRECISION - DECIMAL_SCALE)
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "Arrow export requires pyarrow: uv add 'pymoex[parquet]'"
+        ) from e
+    return pa, pc
+
+
+def field_kinds(model: Type[BaseModel]) -> dict[str, tuple[str, str]]:
+    """
+    Поля модели для экспорта: имя поля -> (колонка ISS, тип колонки).
+
+    Тип — 'decimal', 'date', 'int', 'bool', 'float' или 'str'.
+    """
+    validators = {parse_decimal: "decimal", safe_date: "date", parse_int: "int"}
+    kinds = {}
+
+    for name, info in model.model_fields.items():
+        kind = None
+        for meta in info.metadata:
+            kind = validators.get(getattr(meta, "func", None)) or kind
+
+        if kind is None:
+            annotation = info.annotation
+            # Optional[X] -> X
+            args = getattr(annotation, "__args__", ())
+            args = [a for a in args if a is not type(None)]
+            base = args[0] if args else annotation
+            kind = {
+                Decimal: "decimal",
+                date: "date",
+                bool: "bool",
+                int: "int",
+                float: "float",
+            }.get(base, "str")
+
+        kinds[name] = (info.alias or name, kind)
+
+    return kinds
+
+
+def table_to_arrow(
+    columns: list[str],
+    rows: Sequence[Sequence[Any]],
+    model: Type[BaseModel] | None = None,
+    decimals: bool = True,
+):
+    """
+    Таблица ISS -> pyarrow.Table.
+
+    :param columns: колонки таблицы ISS
+    :param rows: строки таблицы ISS
+    :param model: модель (Share, Bond, ...): колонки называются полями модели
+        и типизируются по ним; None — все колонки ISS с выводом типов
+    :param decimals: MoexDecimal как decimal128 (иначе float64)
+    :return: pyarrow.Table
+    """
+    pa, _ = _pyarrow()
+
+    # Транспонирование строк в колонки (одна операция на C-уровне)
+    data = dict(zip(columns, zip(*rows))) if rows else {c: () for c in columns}
+
+    if model is None:
+        return pa.table({name: _infer(values) for name, values in data.items()})
+
+    fallbacks = getattr(model, "column_fallbacks", {})
+    arrays = {}
+    for name, (alias, kind) in field_kinds(model).items():
+        values = data.get(alias) or (None,) * len(rows)
+        if alias in fallbacks:
+            sources = [data[s] for s in fallbacks[alias] if s in data]
+            values = _fallback(values, sources)
+        arrays[name] = _convert(values, kind, decimals)
+
+    return pa.table(arrays)
+
+
+def models_to_arrow(items: Iterable[BaseModel], decimals: bool = True):
+    """
+    Список моделей (например, результаты поиска) -> pyarrow.Table.
+
+    Значения читаются из атрибутов моделей без model_dump().
+
+    :param items: модели одного класса
+    :param decimals: Decimal-поля как decimal128 (иначе float64)
+    """
+    pa, _ = _pyarrow()
+
+    items = list(items)
+    if not items:
+        return pa.table({})
+
+    kinds = field_kinds(type(items[0]))
+    return pa.table(
+        {
+            name: _convert([getattr(m, name) for m in items], kind, decimals)
+            for name, (_, kind) in kinds.items()
+        }
+    )
+
+
+def columns_to_arrow(columns: dict[str, Any], timestamps: Iterable[str] = ()):
+    """
+    Колонки array('q') / array('d') -> pyarrow.Table без копирования данных.
+
+    :param columns: имя -> массив (array.array)
+    :param timestamps: int64-колонки с секундами, которые станут timestamp[s]
+    """
+    pa, _ = _pyarrow()
+
+    types = {"q": pa.int64(), "d": pa.float64()}
+    timestamps = set(timestamps)
+
+    arrays = {}
+    for name, column in columns.items():
+        array = pa.Array.from_buffers(
+            types[column.typecode], len(column), [None, pa.py_buffer(column)]
+        )
+        if name in timestamps:
+            array = array.cast(pa.timestamp("s"))
+        arrays[name] = array
+
+    return pa.table(arrays)
+
+
+def write_parquet(table, path: str | Path, **kwargs) -> None:
+    """
+    Записать pyarrow.Table в Parquet.
+
+    :param table: таблица
+    :param path: путь к файлу
+    :param kwargs: параметры pyarrow.parquet.write_table (compression и т.п.)
+    """
+    _pyarrow()
+    import pyarrow.parquet as pq
+
+    pq.write_table(table, Path(path), **kwargs)
+
+
+def _fallback(values: Sequence[Any], sources: list[Sequence[Any]]) -> list[Any]:
+    # Пустое значение берется из следующих колонок (как в валидаторе модели)
+    result = []
+    for row in zip(values, *sources):
+        value = row[0]
+        for value in row:
+            if value:
+                break
+        result.append(value)
+    return result
+
+
+def _convert(values: Sequence[Any], kind: str, decimals: bool):
+    pa, pc = _pyarrow()
+
+    if kind == "decimal" and decimals:
+        return _decimal_array(pa, values)
+
+    if kind == "decimal" or kind == "float":
+        try:
+            return pa.array(values, pa.float64())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            parsed = (parse_decimal(v) for v in values)
+            return pa.array(
+                [None if d is None else float(d) for d in parsed], pa.float64()
+            )
+
+    if kind == "date":
+        try:
+            array = pa.array(values, pa.string())
+            array = pc.if_else(
+                pc.equal(array, "0000-00-00"), pa.scalar(None, pa.string()), array
+            )
+            return array.cast(pa.date32())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            return pa.array(
+                [v if isinstance(v, date) else safe_date(v) for v in values],
+                pa.date32(),
+            )
+
+    if kind == "int":
+        try:
+            return pa.array(values, pa.int64())
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+            return pa.array([parse_int(v) for v in values], pa.int64())
+
+    if kind == "bool":
+        return pa.array([None if v is None else bool(v) for v in values], pa.bool_())
+
+    try:
+        return pa.array(values, pa.string())
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        return pa.array([None if v is None else str(v) for v in values], pa.string())
+
+
+def _decimal_array(pa, values: Sequence[Any]):
+    # Decimal строится из исходных значений (без промежуточного float),
+    # округление — до DECIMAL_SCALE знаков
+    decimals = []
+    for v in values:
+        d = v if isinstance(v, Decimal) else parse_decimal(v)
+        if d is not None and d.is_finite():
+            try:
+                d = d.quantize(_QUANTUM, context=_DECIMAL_CONTEXT)
+            except InvalidOperation:
+                logger.debug(f"Decimal value {d} out of range, exported as null")
+                d = None
+        else:
+            d = None
+        decimals.append(d)
+
+    if any(d is not None and abs(d) >= _DECIMAL128_LIMIT for d in decimals):
+        return pa.array(decimals, pa.decimal256(DECIMAL256_PRECISION, DECIMAL_SCALE))
+    return pa.array(decimals, pa.decimal128(DECIMAL_PRECISION, DECIMAL_SCALE))
+
+
+def _infer(values: Sequence[Any]):
+    pa, _ = _pyarrow()
+
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError):
+        # Смешанные типы в колонке — сохраняем как строки
+        logger.debug("Mixed column types, exporting as string")
+        return pa.array([None if v is None else str(v) for v in values], pa.string())
@@ -0,0 +1,77 @@
+"""
+Приблизительный размер объекта в памяти (для лимитов кэша в байтах).
+
+sys.getsizeof считает только сам объект; здесь обходятся вложенные
+контейнеры, атрибуты объектов (__dict__, __slots__) и pydantic-модели.
+У больших контейнеров измеряется выборка элементов, результат
+масштабируется на их число: снимок рынка на тысячи строк оценивается
+за доли миллисекунды с точностью, достаточной для бюджета кэша.
+"""
+
+import sys
+from array import array
+from datetime import date, datetime, time
+from decimal import Decimal
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+
+# Сколько элементов контейнера измеряется точно
+SAMPLE = 32
+
+_ATOMIC = (str, bytes, bytearray, int, float, bool, Decimal, date, datetime, time)
+_SKIPPED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def approx_size(obj: object) -> int:
+    """
+    Приблизительный размер объекта со всем, на что он ссылается, в байтах.
+
+    Классы, функции и модули не учитываются (общие для всех значений).
+    """
+    return _size(obj, set())
+
+
+def _size(obj: object, seen: set[int]) -> int:
+    if obj is None or isinstance(obj, _SKIPPED) or id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, _ATOMIC) or isinstance(obj, array):
+        return size
+
+    if isinstance(obj, dict):
+        return size + _sampled(obj.items(), len(obj), seen, pairs=True)
+
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + _sampled(obj, len(obj), seen)
+
+    attrs = getattr(obj, "__dict__", None)
+    if attrs is not None:
+        size += _size(attrs, seen)
+
+    for cls in type(obj).__mro__:
+        slots = getattr(cls, "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if slot not in ("__dict__", "__weakref__"):
+                size += _size(getattr(obj, slot, None), seen)
+
+    return size
+
+
+def _sampled(items, count: int, seen: set[int], pairs: bool = False) -> int:
+    total = 0
+    measured = 0
+    for item in items:
+        if measured == SAMPLE:
+            break
+        if pairs:
+            key, value = item
+            total += _size(key, seen) + _size(value, seen)
+        else:
+            total += _size(item, seen)
+        measured += 1
+
+    if measured and count > measured:
+        total = total * count // measured
+
+    return total
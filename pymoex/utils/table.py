@@ -34,3 +34,61 @@ def first_row(block: dict) -> dict[str, Any]:
         return {}
 
     return dict(zip(columns, rows[0]))
+
+
+def merge_tables(
+    blocks: list[dict], key: tuple[str, ...] = ("SECID", "BOARDID")
+) -> tuple[list[str], list[list[Any]]]:
+    """
+    Объединяет несколько MOEX-таблиц (securities, marketdata, ...) по ключу.
+
+    Строки первой таблицы задают порядок и состав результата, значения
+    следующих таблиц перекрывают предыдущие (как {**securities, **marketdata}).
+
+    :param blocks: блоки ответа ISS API в порядке приоритета (от низшего)
+    :param key: колонки ключа строки
+    :return: (колонки, строки) объединенной таблицы
+    """
+    blocks = [b for b in blocks if b and b.get("columns")]
+    if not blocks:
+        return [], []
+
+    columns: list[str] = []
+    positions: dict[str, int] = {}
+    for block in blocks:
+        for col in block["columns"]:
+            if col not in positions:
+                positions[col] = len(columns)
+                columns.append(col)
+
+    width = len(columns)
+    rows: list[list[Any]] = []
+    by_key: dict[tuple, list[Any]] = {}
+
+    base = blocks[0]
+    base_map = [positions[c] for c in base["columns"]]
+    base_key = [base["columns"].index(k) for k in key]
+
+    for src in base["data"]:
+        row = [None] * width
+        for pos, value in zip(base_map, src):
+            row[pos] = value
+        rows.append(row)
+        by_key[tuple(src[i] for i in base_key)] = row
+
+    for block in blocks[1:]:
+        cols = block["columns"]
+        if not all(k in cols for k in key):
+            continue
+
+        col_map = [positions[c] for c in cols]
+        key_idx = [cols.index(k) for k in key]
+
+        for src in block["data"]:
+            row = by_key.get(tuple(src[i] for i in key_idx))
+            if row is None:
+                continue
+            for pos, value in zip(col_map, src):
+                row[pos] = value
+
+    return columns, rows
@@ -0,0 +1,115 @@
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pymoex.analytics.yields import (  # noqa: E402
+    analyze,
+    cashflow_matrix,
+    present_value,
+    scalar_ytm,
+)
+
+
+def _annual_bond(years: int, coupon: float, face: float = 1000.0):
+    dates = np.array(
+        [np.datetime64(f"{2025 + i}-01-01") for i in range(1, years + 1)],
+        dtype="datetime64[D]",
+    )
+    amounts = np.full(years, face * coupon)
+    amounts[-1] += face
+    return dates, amounts
+
+
+def test_par_bond_yield_equals_coupon():
+    bonds = [_annual_bond(5, 0.08), _annual_bond(10, 0.12), _annual_bond(1, 0.2)]
+    cf = cashflow_matrix(
+        date(2025, 1, 1), [d for d, _ in bonds], [a for _, a in bonds]
+    )
+
+    # Бумаги по номиналу в дату купона: доходность равна купону
+    metrics = analyze(np.full(3, 1000.0), cf)
+
+    assert np.allclose(metrics.ytm, [0.08, 0.12, 0.2], atol=1e-3)
+    assert metrics.modified[1] > metrics.modified[0] > metrics.modified[2]
+    assert np.all(metrics.dv01 > 0)
+
+
+def test_vectorised_matches_scalar():
+    rng = np.random.default_rng(7)
+    bonds = [_annual_bond(int(rng.integers(1, 15)), rng.uniform(0.0, 0.2)) for _ in range(50)]
+    cf = cashflow_matrix(date(2025, 3, 15), [d for d, _ in bonds], [a for _, a in bonds])
+
+    target = rng.uniform(0.02, 0.25, size=50)
+    prices = present_value(target, cf)
+
+    metrics = analyze(prices, cf)
+    scalar = [scalar_ytm(p, t, a) for p, t, a in zip(prices, cf.times, cf.amounts)]
+
+    assert np.allclose(metrics.ytm, target, atol=1e-8)
+    assert np.allclose(metrics.ytm, scalar, atol=1e-8)
+
+
+def test_unreachable_price_is_nan():
+    dates, amounts = _annual_bond(3, 0.1)
+    cf = cashflow_matrix(date(2025, 1, 1), [dates], [amounts])
+
+    assert np.isnan(analyze(np.array([1e12]), cf).ytm[0])
+
+
+def test_cashflows_from_schedules():
+    from pymoex.analytics.yields import cashflows_from_schedules
+    from pymoex.models.schedule import BondSchedule
+
+    schedule = BondSchedule.from_tables(
+        "RU000TEST",
+        coupons=[
+            {"coupondate": "2024-06-01", "value": 50},
+            {"coupondate": "2025-06-01", "value": 50},
+            {"coupondate": "2026-06-01", "value": 50},
+        ],
+        amortizations=[{"amortdate": "2026-06-01", "value": 1000}],
+        offers=[],
+    )
+
+    cf = cashflows_from_schedules(date(2025, 1, 1), [schedule])
+
+    assert cf.amounts.tolist() == [[50.0, 1050.0]]
+    assert np.allclose(cf.times[0], [151 / 365, 516 / 365])
+
+
+def test_floater_unknown_coupons_projected():
+    from pymoex.analytics.yields import cashflows_from_schedules
+    from pymoex.models.schedule import BondSchedule
+
+    floater = BondSchedule.from_tables(
+        "RU000FLOAT",
+        coupons=[
+            {"coupondate": "2024-06-01", "value": 40},
+            {"coupondate": "2025-06-01", "value": 45},
+            {"coupondate": "2026-06-01", "value": None},
+        ],
+        amortizations=[{"amortdate": "2026-06-01", "value": 1000}],
+        offers=[],
+    )
+    fixed = BondSchedule.from_tables(
+        "RU000FIXED",
+        coupons=[{"coupondate": "2026-06-01", "value": 50}],
+        amortizations=[{"amortdate": "2026-06-01", "value": 1000}],
+        offers=[],
+    )
+    settle = date(2025, 1, 1)
+
+    cf = cashflows_from_schedules(settle, [floater, fixed])
+
+    # Неизвестный купон заменен текущим, номинал не потерян
+    assert cf.amounts[0].tolist() == [45.0, 1045.0]
+    assert cf.projected.tolist() == [True, False]
+    assert np.isfinite(analyze(np.array([1000.0, 1000.0]), cf).ytm).all()
+
+    raw = cashflows_from_schedules(settle, [floater, fixed], project=False)
+    ytm = analyze(np.array([1000.0, 1000.0]), raw).ytm
+
+    assert not raw.projected.any()
+    assert np.isnan(ytm[0]) and np.isfinite(ytm[1])
@@ -0,0 +1,99 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from pymoex.models.bond import Bond
+from pymoex.models.candles import Candles
+from pymoex.models.enums import CandleInterval
+from pymoex.models.search import Search
+from pymoex.models.snapshot import Snapshot
+from pymoex.utils.arrow import models_to_arrow
+
+pa = pytest.importorskip("pyarrow")
+
+COLUMNS = ["SECID", "SHORTNAME", "BOARDID", "FACEVALUE", "LAST", "PREVWAPRICE"]
+COLUMNS += ["MATDATE", "LISTLEVEL", "YIELD"]
+ROWS = [
+    ["SU26238RMFS4", "ОФЗ 26238", "TQOB", 1000, 68.5, 68.1, "2041-05-15", 1, 13.1],
+    ["RU000A10DS74", "Bond B", "TQCB", 1000, None, 101.2, "0000-00-00", "—", 19.4],
+]
+
+
+def test_snapshot_to_arrow_matches_models():
+    snapshot = Snapshot(Bond, COLUMNS, ROWS)
+    table = snapshot.to_arrow()
+
+    assert table.num_rows == 2
+    assert table.schema.field("face_value").type == pa.decimal128(38, 10)
+    assert table.schema.field("mat_date").type == pa.date32()
+    assert table.schema.field("list_level").type == pa.int64()
+
+    data = table.to_pydict()
+    assert data["mat_date"] == [date(2041, 5, 15), None]
+    assert data["list_level"] == [1, None]
+
+    # Пустые колонки заполняются так же, как валидатором модели
+    for i, bond in enumerate(snapshot):
+        assert data["price_percent"][i] == bond.price_percent
+        assert data["effective_yield"][i] == bond.effective_yield
+
+    floats = snapshot.to_arrow(decimals=False)
+    assert floats.column("price_percent").to_pylist() == [68.5, 101.2]
+
+
+def test_snapshot_raw_to_parquet(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    path = tmp_path / "bonds.parquet"
+    Snapshot(Bond, COLUMNS, ROWS).to_parquet(path, raw=True)
+
+    table = pq.read_table(path)
+    assert table.column_names == COLUMNS
+    assert table.column("LISTLEVEL").to_pylist() == ["1", "—"]
+
+
+def test_candles_and_search_to_arrow():
+    candles = Candles.from_rows(
+        CandleInterval.DAY_1, [(0, 86399, 1, 2, 0.5, 1.5, 100, 10)]
+    )
+    table = candles.to_arrow()
+
+    assert table.schema.field("begin").type == pa.timestamp("s")
+    assert table.column("close").to_pylist() == [1.5]
+
+    results = [
+        Search(secid="SBER", shortname="Сбербанк", is_traded=1),
+        Search(secid="SBERP", shortname="Сбербанк-п", is_traded=0),
+    ]
+    table = models_to_arrow(results)
+
+    assert table.column("sec_id").to_pylist() == ["SBER", "SBERP"]
+    assert table.column("is_traded").to_pylist() == [True, False]
+
+
+def test_decimal_values_survive_model_export():
+    bond = Bond(SECID="X", SHORTNAME="X", FACEVALUE="1000.5")
+    table = models_to_arrow([bond])
+
+    assert table.column("face_value").to_pylist() == [Decimal("1000.5")]
+
+
+def test_decimal_columns_keep_exact_values():
+    rows = [
+        ["A", "A", "TQCB", "123456789.37", None, None, None, None, None],
+        ["B", "B", "TQCB", 0.1, None, None, None, None, None],
+    ]
+    table = Snapshot(Bond, COLUMNS, rows).to_arrow()
+
+    assert table.column("face_value").to_pylist() == [
+        Decimal("123456789.37"),
+        Decimal("0.1"),
+    ]
+
+    # Число вне диапазона decimal128(38, 10) — колонка decimal256 без потерь
+    rows[0][3] = "1e30"
+    table = Snapshot(Bond, COLUMNS, rows).to_arrow()
+
+    assert table.schema.field("face_value").type == pa.decimal256(76, 10)
+    assert table.column("face_value").to_pylist()[0] == Decimal("1e30")
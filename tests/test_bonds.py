@@ -1,7 +1,14 @@
+import gc
+import weakref
+
 import pytest
+import respx
 from httpx import Response
 
+from pymoex.client import MoexClient
+from pymoex.core.config import MoexSettings
 from pymoex.exceptions import InstrumentNotFoundError
+from pymoex.utils.sizeof import approx_size
 
 # Пример ответа для облигации (ОФЗ)
 MOEX_BOND_JSON = {
@@ -46,3 +53,140 @@ async def test_get_bond_not_found(client, mock_moex):
 
     with pytest.raises(InstrumentNotFoundError):
         await client.bond("UNKNOWN")
+
+
+def _bondization_page(request):
+    start = int(request.url.params["start"])
+    coupons = [
+        ["RU000A1038V6", "2025-05-15", 35.4, 7.1, "SUR"],
+        ["RU000A1038V6", "2025-11-15", 35.4, 7.1, "SUR"],
+        ["RU000A1038V6", "2026-05-15", None, None, "SUR"],
+    ]
+    return Response(
+        200,
+        json={
+            "coupons": {
+                "columns": ["isin", "coupondate", "value", "valueprc", "faceunit"],
+                "data": coupons[start : start + 2],
+            },
+            "coupons.cursor": {
+                "columns": ["INDEX", "TOTAL", "PAGESIZE"],
+                "data": [[start, 3, 2]],
+            },
+            "amortizations": {
+                "columns": ["isin", "amortdate", "value"],
+                "data": [["RU000A1038V6", "2026-05-15", 1000]] if start == 0 else [],
+            },
+            "offers": {"columns": ["isin", "offerdate", "price"], "data": []},
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_bond_schedules_paged_and_cached(client, mock_moex):
+    route = mock_moex.get("/securities/RU000A1038V6/bondization.json").mock(
+        side_effect=_bondization_page
+    )
+    mock_moex.get("/securities/UNKNOWN/bondization.json").mock(
+        return_value=Response(200, json={"coupons": {"columns": [], "data": []}})
+    )
+
+    schedules = await client.schedules(["RU000A1038V6", "UNKNOWN"])
+
+    assert list(schedules) == ["RU000A1038V6"]
+    schedule = schedules["RU000A1038V6"]
+    assert len(schedule.coupon_dates) == 3
+    assert schedule.face_unit == "SUR"
+
+    dates, amounts = schedule.cashflows()
+    assert list(amounts)[:2] == [35.4, 35.4]
+    assert len(dates) == 3
+
+    # Две страницы по курсору, повторный запрос — из кэша
+    await client.schedule("RU000A1038V6")
+    assert route.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bonds_snapshot_picks_one_board(client, mock_moex):
+    mock_moex.get("/engines/stock/markets/bonds/securities.json").mock(
+        return_value=Response(
+            200,
+            json={
+                "securities": {
+                    "columns": ["SECID", "SHORTNAME", "BOARDID", "FACEVALUE"],
+                    "data": [
+                        ["SU26238RMFS4", "ОФЗ 26238", "TQOB", 1000],
+                        ["SU26238RMFS4", "ОФЗ 26238", "PACT", 1000],
+                        ["RU000A10DS74", "Bond B", "TQCB", 1000],
+                    ],
+                },
+                "marketdata": {
+                    "columns": ["SECID", "BOARDID", "LAST"],
+                    "data": [
+                        ["SU26238RMFS4", "TQOB", 68.5],
+                        ["SU26238RMFS4", "PACT", None],
+                        ["RU000A10DS74", "TQCB", 101.0],
+                    ],
+                },
+                "marketdata_yields": {
+                    "columns": ["SECID", "BOARDID", "EFFECTIVEYIELD"],
+                    "data": [["SU26238RMFS4", "TQOB", 12.5]],
+                },
+            },
+        )
+    )
+
+    snapshot = await client.bonds.snapshot()
+
+    assert len(snapshot) == 2
+    bond = snapshot.get("SU26238RMFS4")
+    assert bond.board_id == "TQOB"
+    assert bond.last_price == 685
+    assert bond.effective_yield == 12.5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["thread", "process"])
+async def test_bonds_snapshot_offloaded(executor):
+    settings = MoexSettings(
+        offload_threshold=100, offload_executor=executor, trading_calendar=False
+    )
+
+    async with MoexClient(settings=settings) as client:
+        with respx.mock(base_url=settings.base_url) as mock_moex:
+            mock_moex.get("/engines/stock/markets/bonds/securities.json").mock(
+                return_value=Response(200, json=MOEX_BOND_JSON)
+            )
+            snapshot = await client.bonds.snapshot()
+
+        # Модели созданы в пуле, а не при первом обращении
+        assert snapshot._models is not None
+        assert snapshot.get("SU26238RMFS4").effective_yield == 12.5
+        assert client.session.offload.kind == executor
+
+
+@pytest.mark.asyncio
+async def test_evicted_snapshot_released():
+    settings = MoexSettings(cache_policy="lru", trading_calendar=False)
+
+    with respx.mock(base_url=settings.base_url) as mock_moex:
+        mock_moex.get(url__regex=r"/boards/\w+/securities\.json").mock(
+            return_value=Response(200, json=MOEX_BOND_JSON)
+        )
+
+        async with MoexClient(settings=settings) as client:
+            size = approx_size(await client.bonds.snapshot("TQOB"))
+
+        # Бюджет вмещает только один снимок
+        settings = settings.model_copy(update={"price_cache_bytes": int(size * 1.5)})
+
+        async with MoexClient(settings=settings) as client:
+            first = weakref.ref(await client.bonds.snapshot("TQOB"))
+            second = weakref.ref(await client.bonds.snapshot("TQCB"))
+            gc.collect()
+
+            # Вытесненный из кэша снимок не удерживается сервисом
+            assert client.bonds.cache.stats.evictions == 1
+            assert first() is None
+            assert second() is not None
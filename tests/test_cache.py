@@ -2,6 +2,8 @@ import asyncio
 
 import pytest
 from httpx import Response
+
+from pymoex.core.cache import TTLCache
 from tests.conftest import MOEX_SEARCH_JSON
 
 
@@ -40,3 +42,89 @@ async def test_request_coalescing(client, mock_moex):
 
     # Но HTTP запрос должен быть ровно 1
     assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_search_views_and_prefix_refinement(client, mock_moex):
+    route = mock_moex.get("/securities.json").mock(
+        return_value=Response(200, json=MOEX_SEARCH_JSON)
+    )
+
+    # Один сырой ответ на запрос — представления по типам строятся локально
+    await client.find("sb")
+    await client.find_shares("sb")
+    await client.find_bonds("sb")
+    assert route.call_count == 1
+
+    # Ответ для "sb" полный (меньше limit) — уточнения идут без ISS
+    results = await client.find("sberp")
+    assert [r.sec_id for r in results] == ["SBERP"]
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_stats(client, mock_moex):
+    route = mock_moex.get("/securities.json").mock(
+        return_value=Response(200, json=MOEX_SEARCH_JSON)
+    )
+
+    await asyncio.gather(*(client.find("SBER") for _ in range(3)))
+    await client.find("SBER")
+
+    stats = client.cache_stats()["search"]
+    assert stats.misses >= 1
+    assert stats.hits + stats.waits >= 3
+    assert 0 < stats.hit_ratio < 1
+
+    # Проверки префиксов и более широких запросов — не промахи: промахов
+    # два (результат и сырой ответ, уточненный из кэша без запроса к ISS)
+    misses = stats.misses
+    await client.find_shares("sberbank", traded_only=True)
+
+    assert stats.probes > 0
+    assert stats.misses - misses == 2
+    assert route.call_count == 1
+
+    cache = TTLCache(ttl=60, maxsize=1)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_byte_budget():
+    cache = TTLCache(ttl=60, max_bytes=100, sizeof=len)
+
+    await cache.set("small", "x" * 10)
+    await cache.set("large", "x" * 80)
+    await cache.set("more", "x" * 20)
+
+    # Вытеснена самая старая запись, объем снова в пределах бюджета
+    assert await cache.get("small") is None
+    assert await cache.get("large") is not None
+    assert cache.stats.evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_tinylfu_resists_scans():
+    cache = TTLCache(ttl=60, maxsize=100, policy="tinylfu")
+
+    for _ in range(5):
+        for i in range(50):
+            await cache.get_or_set(f"hot{i}", lambda: asyncio.sleep(0, "v"))
+
+    # Разовый проход по множеству ключей
+    for i in range(1000):
+        await cache.set(f"scan{i}", "v")
+
+    # Частоты приблизительные: допускаем единичные потери из-за коллизий
+    hot = [await cache.get(f"hot{i}") for i in range(50)]
+    assert hot.count("v") >= 45
+    assert cache.stats.rejections > 0
+
+    lru = TTLCache(ttl=60, maxsize=100)
+    for i in range(50):
+        await lru.set(f"hot{i}", "v")
+    for i in range(1000):
+        await lru.set(f"scan{i}", "v")
+    assert await lru.get("hot0") is None
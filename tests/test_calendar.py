@@ -0,0 +1,86 @@
+import time
+from datetime import datetime
+
+import pytest
+import respx
+from httpx import Response
+
+from pymoex.client import MoexClient
+from pymoex.core.config import MoexSettings
+from pymoex.models.calendar import MSK
+from tests.conftest import MOEX_SHARE_JSON
+
+# Пн-Пт 06:50-23:50, 2 января — выходной, 4 января (суббота) — рабочий день
+MOEX_ENGINE_JSON = {
+    "timetable": {
+        "columns": ["week_day", "is_work_day", "start_time", "stop_time"],
+        "data": [
+            *[[d, 1, "06:50:00", "23:50:00"] for d in range(1, 6)],
+            [6, 0, "00:00:00", "00:00:00"],
+            [7, 0, "00:00:00", "00:00:00"],
+        ],
+    },
+    "dailytable": {
+        "columns": ["date", "is_work_day", "start_time", "stop_time"],
+        "data": [
+            ["2025-01-02", 0, "00:00:00", "00:00:00"],
+            ["2025-01-04", 1, "10:00:00", "19:00:00"],
+        ],
+    },
+}
+
+
+@pytest.mark.asyncio
+async def test_calendar_ttl(client, mock_moex):
+    mock_moex.get("/engines/stock.json").mock(
+        return_value=Response(200, json=MOEX_ENGINE_JSON)
+    )
+
+    calendar = await client.trading_calendar()
+    ttl = client.calendar.ttl
+
+    # Вторник: торги идут — обычный TTL
+    assert calendar.is_open(datetime(2025, 1, 7, 12, 0, tzinfo=MSK))
+    assert ttl(60, now=datetime(2025, 1, 7, 12, 0, tzinfo=MSK)) == 60
+
+    # Вечер вторника после закрытия: запись живет до открытия в среду
+    tuesday_night = datetime(2025, 1, 7, 23, 55, tzinfo=MSK)
+    assert ttl(60, now=tuesday_night) == 6 * 3600 + 55 * 60
+
+    # Праздник 2 января: следующее открытие — 3 января, но не дольше closed_ttl
+    assert not calendar.is_open(datetime(2025, 1, 2, 12, 0, tzinfo=MSK))
+    assert ttl(60, now=datetime(2025, 1, 2, 12, 0, tzinfo=MSK)) == 43200
+
+    # Рабочая суббота по dailytable
+    assert calendar.is_open(datetime(2025, 1, 4, 12, 0, tzinfo=MSK))
+
+    # Режим инструмента торгуется — статус важнее расписания
+    assert ttl(60, "T", now=datetime(2025, 1, 5, 12, 0, tzinfo=MSK)) == 60
+
+
+@pytest.mark.asyncio
+async def test_calendar_failure_keeps_price_ttl(client, mock_moex):
+    route = mock_moex.get("/engines/stock.json").mock(return_value=Response(500))
+
+    calendar = await client.trading_calendar()
+    await client.trading_calendar()
+
+    # Пустое расписание: торги считаются открытыми, ошибка не повторяется сразу
+    assert not calendar
+    assert client.calendar.ttl(60) == 60
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_share_uses_price_ttl():
+    settings = MoexSettings(trading_calendar=False)
+
+    async with MoexClient(price_ttl=5, settings=settings) as client:
+        with respx.mock(base_url=settings.base_url) as mock_moex:
+            mock_moex.get("/engines/stock/markets/shares/securities/SBER.json").mock(
+                return_value=Response(200, json=MOEX_SHARE_JSON)
+            )
+            await client.share("SBER")
+
+        _, expires_at = client.cache_shares._data["share:SBER"]
+        assert expires_at - time.monotonic() == pytest.approx(5, abs=1)
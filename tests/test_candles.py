@@ -0,0 +1,117 @@
+import json
+import math
+from datetime import date
+from pathlib import Path
+
+import pytest
+from httpx import Response
+
+from pymoex.models import candles as candles_model
+from pymoex.models.candles import Candles
+from pymoex.models.enums import CandleInterval
+
+FIXTURES = Path(__file__).parent / "fixtures"
+CANDLES_URL = "/engines/stock/markets/shares/securities/SBER/candles.json"
+
+_COLUMNS = ["open", "close", "high", "low", "value", "volume", "begin", "end"]
+
+
+def _fixture(name: str) -> dict:
+    return json.loads((FIXTURES / name).read_text(encoding="utf-8"))
+
+
+@pytest.mark.asyncio
+async def test_hourly_resampled_from_ten_minute(client, mock_moex):
+    route = mock_moex.get(CANDLES_URL).mock(
+        return_value=Response(200, json=_fixture("candles_sber_10m.json"))
+    )
+
+    day = date(2024, 3, 11)
+    ten = await client.candles("SBER", CandleInterval.MINUTE_10, day, day)
+    hourly = await client.candles("SBER", CandleInterval.HOUR_1, day, day)
+
+    # Часовые свечи собраны локально и совпадают со свечами ISS
+    assert route.call_count == 1
+    assert len(ten) == 12
+
+    native = _fixture("candles_sber_1h.json")["candles"]
+    expected = [dict(zip(native["columns"], row)) for row in native["data"]]
+
+    assert len(hourly) == len(expected)
+    for candle, row in zip(hourly, expected):
+        assert str(candle.begin) == row["begin"]
+        assert str(candle.end) == row["end"]
+        assert (candle.open, candle.close) == (row["open"], row["close"])
+        assert (candle.high, candle.low) == (row["high"], row["low"])
+        assert candle.volume == row["volume"]
+        assert candle.value == pytest.approx(row["value"])
+
+
+@pytest.mark.asyncio
+async def test_candles_paging(client, mock_moex):
+    row = [1, 1, 1, 1, 10, 10, "2024-03-11 00:00:00", "2024-03-11 23:59:59"]
+
+    def _page(request):
+        start = int(request.url.params["start"])
+        data = [row] * 500 if start == 0 else [row] * 3
+        return Response(200, json={"candles": {"columns": _COLUMNS, "data": data}})
+
+    route = mock_moex.get(CANDLES_URL).mock(side_effect=_page)
+
+    candles = await client.candles("SBER", CandleInterval.DAY_1)
+
+    assert len(candles) == 503
+    assert route.call_count == 2
+
+
+def _daily_candles() -> Candles:
+    # Дневные свечи за полгода, у части строк нет цен и объемов
+    candles = Candles(CandleInterval.DAY_1)
+    data = []
+    for day in range(180):
+        begin = date.fromordinal(date(2024, 1, 1).toordinal() + day)
+        price = 100.0 + day
+        row = [price, price + 1, price + 2, price - 2, 1000.0, 10.0]
+        if day % 7 == 3:
+            row[3] = None
+        if day % 11 == 0:
+            row = [None] * 6
+        data.append([*row, f"{begin} 10:00:00", f"{begin} 18:39:59"])
+    candles.extend({"columns": _COLUMNS, "data": data})
+    return candles
+
+
+def test_extend_keeps_missing_values_as_nan():
+    candles = _daily_candles()
+
+    assert math.isnan(candles.low[3])
+    assert math.isnan(candles.volume[0])
+
+
+@pytest.mark.parametrize(
+    "interval",
+    [CandleInterval.WEEK_1, CandleInterval.MONTH_1, CandleInterval.QUARTER_1],
+)
+def test_resample_numpy_matches_rows(interval, monkeypatch):
+    pytest.importorskip("numpy")
+    candles = _daily_candles()
+
+    vectorised = list(candles.resample(interval).rows())
+    monkeypatch.setattr(candles_model, "_numpy", lambda: None)
+    looped = list(candles.resample(interval).rows())
+
+    assert len(vectorised) == len(looped)
+    for a, b in zip(vectorised, looped):
+        assert a == pytest.approx(b, nan_ok=True)
+
+
+def test_resample_ignores_missing_values():
+    candles = _daily_candles()
+
+    monthly = list(candles.resample(CandleInterval.MONTH_1))
+    january = monthly[0]
+
+    # 1 января без цен: open берется со 2 января, пропуски low не дают 0
+    assert january.open == 101.0
+    assert january.low == 99.0
+    assert january.volume == 10.0 * 28
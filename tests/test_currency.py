@@ -0,0 +1,86 @@
+from decimal import Decimal
+
+import pytest
+from httpx import Response
+
+from pymoex.models.currency import CrossRates, CurrencyPair
+
+CETS_URL = "/engines/currency/markets/selt/boards/CETS/securities.json"
+
+CETS_JSON = {
+    "securities": {
+        "columns": ["SECID", "BOARDID", "SHORTNAME", "FACEUNIT", "CURRENCYID", "FACEVALUE"],
+        "data": [
+            ["USD000000TOD", "CETS", "USDRUB_TOD", "USD", "RUB", 1],
+            ["USD000UTSTOM", "CETS", "USDRUB_TOM", "USD", "RUB", 1],
+            ["CNYRUB_TOM", "CETS", "CNYRUB_TOM", "CNY", "RUB", 1],
+            ["KZTRUB_TOM", "CETS", "KZTRUB_TOM", "KZT", "RUB", 100],
+            ["EURUSD000TOM", "CETS", "EURUSD_TOM", "EUR", "USD", 1],
+            ["GLDRUB_TOM", "CETS", "GLDRUB_TOM", "GLD", "RUB", 1],
+        ],
+    },
+    "marketdata": {
+        "columns": ["SECID", "BOARDID", "LAST", "WAPRICE"],
+        "data": [
+            ["USD000000TOD", "CETS", 90.9, 90.8],
+            ["USD000UTSTOM", "CETS", 91.0, 91.1],
+            ["CNYRUB_TOM", "CETS", None, 12.5],
+            ["KZTRUB_TOM", "CETS", 20.0, 20.1],
+            ["EURUSD000TOM", "CETS", 1.1, 1.09],
+            ["GLDRUB_TOM", "CETS", 6000.0, 6010.0],
+        ],
+    },
+}  # fmt: skip
+
+
+@pytest.mark.asyncio
+async def test_fx_rates_single_request(client, mock_moex):
+    route = mock_moex.get(CETS_URL).mock(return_value=Response(200, json=CETS_JSON))
+
+    rates = await client.fx_rates()
+    again = await client.fx_rates()
+
+    assert route.call_count == 1
+    assert again is rates
+
+    # _TOM предпочтительнее _TOD, WAPRICE — если нет сделок
+    assert rates.to_rub("USD") == Decimal("91.0")
+    assert rates.to_rub("CNY") == Decimal("12.5")
+
+    # Котировка за 100 единиц и кросс-курс через USD
+    assert rates.to_rub("KZT") == Decimal("0.2")
+    assert rates.to_rub("EUR") == Decimal("1.1") * Decimal("91.0")
+
+    # SUR (валюта облигаций в ISS) — это рубль
+    assert rates.convert(1000, "SUR") == 1000
+    assert rates.convert(100, "USD", "CNY") == Decimal("728")
+
+    with pytest.raises(KeyError):
+        rates.to_rub("XXX")
+
+
+def test_cross_rates_skip_swaps():
+    def pair(short_name, base, quote, last):
+        return CurrencyPair(
+            SECID=short_name,
+            SHORTNAME=short_name,
+            FACEUNIT=base,
+            CURRENCYID=quote,
+            LAST=last,
+        )
+
+    # Своп котируется в пунктах: при отсутствии _TOM он не становится курсом
+    rates = CrossRates(
+        [
+            pair("USDRUB_TODTOM", "USD", "RUB", 0.0125),
+            pair("USDRUB_TOMSPT", "USD", "RUB", 0.013),
+            pair("USDRUB_TOD", "USD", "RUB", 90.9),
+            pair("EURUSD_TODTOM", "EUR", "USD", 0.0002),
+        ]
+    )
+
+    assert rates.to_rub("USD") == Decimal("90.9")
+    assert "EUR" not in rates
+
+    rates = CrossRates([pair("USDRUB_TOMSPT", "USD", "RUB", 0.013)])
+    assert "USD" not in rates
@@ -0,0 +1,94 @@
+import pytest
+from httpx import Response
+
+from pymoex.client import MoexClient
+from pymoex.services.directory import SecuritiesDirectory
+from tests.conftest import MOEX_SEARCH_JSON, MOEX_SHARE_JSON
+
+DIRECTORY_COLUMNS = ["secid", "shortname", "name", "isin", "group", "is_traded"]
+
+DIRECTORY_PAGES = [
+    [
+        ["SBER", "Сбербанк", "ПАО Сбербанк", "RU0009029540", "stock_shares", 1],
+        ["SBERP", "Сбербанк-п", "ПАО Сбербанк прив.", "RU0009029557", "stock_shares", 1],
+    ],
+    [
+        ["GAZP", "ГАЗПРОМ ао", "Газпром ПАО", "RU0007661625", "stock_shares", 1],
+    ],
+]
+
+
+def _page(request):
+    start = int(request.url.params["start"])
+    data = DIRECTORY_PAGES[start // 2] if start // 2 < len(DIRECTORY_PAGES) else []
+    return Response(
+        200, json={"securities": {"columns": DIRECTORY_COLUMNS, "data": data}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_local_search_uses_directory(mock_moex, tmp_path):
+    route = mock_moex.get("/securities.json").mock(side_effect=_page)
+
+    async with MoexClient(local_search=True) as client:
+        client.directory.path = tmp_path / "securities.json"
+        client.directory.page_size = 2
+
+        results = await client.find("сбер")
+        assert [r.sec_id for r in results] == ["SBER", "SBERP"]
+
+        # Повторные запросы отвечаются локально
+        assert (await client.find("GAZP"))[0].sec_id == "GAZP"
+        assert (await client.find("газпр"))[0].sec_id == "GAZP"
+
+    # Две страницы справочника — два запроса на всю сессию
+    assert route.call_count == 2
+    assert (tmp_path / "securities.json").exists()
+
+
+@pytest.mark.asyncio
+async def test_directory_loaded_from_disk(client, mock_moex, tmp_path):
+    route = mock_moex.get("/securities.json").mock(
+        return_value=Response(200, json=MOEX_SEARCH_JSON)
+    )
+    path = tmp_path / "securities.json"
+
+    await SecuritiesDirectory(client.session, path).refresh()
+    assert route.call_count == 1
+
+    # Свежая копия на диске — повторной загрузки нет
+    directory = SecuritiesDirectory(client.session, path)
+    assert len(await directory.rows()) == 2
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_registry_resolves_board(mock_moex, tmp_path):
+    directory_json = {
+        "securities": {
+            "columns": ["secid", "isin", "regnumber", "emitent_inn", "primary_boardid", "group"],
+            "data": [
+                ["SBER", "RU0009029540", "10301481B", "7707083893", "TQBR", "stock_shares"],
+                ["SU26238RMFS4", "RU000A1038V6", "26238RMFS", "7710168360", "TQOB", "stock_bonds"],
+            ],
+        }
+    }  # fmt: skip
+    mock_moex.get("/securities.json").mock(
+        return_value=Response(200, json=directory_json)
+    )
+    board_route = mock_moex.get(
+        "/engines/stock/markets/shares/boards/TQBR/securities/SBER.json"
+    ).mock(return_value=Response(200, json=MOEX_SHARE_JSON))
+
+    async with MoexClient(use_registry=True) as client:
+        client.directory.path = tmp_path / "securities.json"
+
+        refs = await client.resolve_many(["RU000A1038V6", "10301481b", "UNKNOWN"])
+        assert refs["RU000A1038V6"].secid == "SU26238RMFS4"
+        assert refs["10301481b"].primary_boardid == "TQBR"
+        assert refs["UNKNOWN"] is None
+
+        # Котировка запрашивается сразу из основного режима по ISIN
+        share = await client.share("RU0009029540")
+        assert share.sec_id == "SBER"
+        assert board_route.call_count == 1
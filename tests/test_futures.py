@@ -0,0 +1,78 @@
+from datetime import date
+
+import pytest
+from httpx import Response
+
+from pymoex.models.future import Future
+from pymoex.models.snapshot import Snapshot
+
+RFUD_URL = "/engines/futures/markets/forts/boards/RFUD/securities.json"
+
+RFUD_JSON = {
+    "securities": {
+        "columns": [
+            "SECID", "BOARDID", "SHORTNAME", "ASSETCODE", "LASTTRADEDATE",
+            "PREVSETTLEPRICE", "PREVOPENPOSITION", "LOTVOLUME", "STEPPRICE",
+        ],
+        "data": [
+            ["SiZ4", "RFUD", "Si-12.24", "Si", "2024-12-19", 94000, 100, 1000, 1],
+            ["SiH4", "RFUD", "Si-3.24", "Si", "2024-03-21", 91000, 2500000, 1000, 1],
+            ["BRJ4", "RFUD", "BR-4.24", "BR", "2024-04-01", 82.5, 300000, 10, 7.2],
+            ["SiM4", "RFUD", "Si-6.24", "Si", "2024-06-20", 92500, 90000, 1000, 1],
+        ],
+    },
+    "marketdata": {
+        "columns": ["SECID", "BOARDID", "LAST", "SETTLEPRICE", "OPENPOSITION"],
+        "data": [
+            ["SiZ4", "RFUD", None, 94100, 120],
+            ["SiH4", "RFUD", 91050, 91040, 2600000],
+            ["BRJ4", "RFUD", 82.7, 82.66, 310000],
+            ["SiM4", "RFUD", 92600, 92580, 95000],
+        ],
+    },
+}  # fmt: skip
+
+
+@pytest.mark.asyncio
+async def test_futures_chain_from_single_snapshot(client, mock_moex):
+    route = mock_moex.get(RFUD_URL).mock(return_value=Response(200, json=RFUD_JSON))
+
+    chain = await client.futures.chain("si")
+    snapshot = await client.futures.snapshot()
+
+    assert route.call_count == 1
+    assert len(snapshot) == 4
+    assert [f.sec_id for f in chain] == ["SiH4", "SiM4", "SiZ4"]
+
+    front = chain[0]
+    assert front.last_trade_date == date(2024, 3, 21)
+    assert front.open_position == 2600000
+    assert float(front.settle_price) == 91040
+
+    # Без сделок цена оценки — расчетная
+    assert float(chain[-1].reference_price) == 94100
+
+
+@pytest.mark.asyncio
+async def test_future_keeps_forts_case(client, mock_moex):
+    contract = {
+        block: {**table, "data": [r for r in table["data"] if r[0] == "SiH4"]}
+        for block, table in RFUD_JSON.items()
+    }
+    route = mock_moex.get("/engines/futures/markets/forts/securities/SiH4.json").mock(
+        return_value=Response(200, json=contract)
+    )
+
+    future = await client.future("SiH4")
+    await client.future("SiH4")
+
+    assert future.sec_id == "SiH4"
+    assert route.call_count == 1
+
+
+def test_snapshot_get_ignores_case():
+    columns = RFUD_JSON["securities"]["columns"]
+    snapshot = Snapshot(Future, columns, RFUD_JSON["securities"]["data"])
+
+    assert snapshot.get("SiH4").sec_id == "SiH4"
+    assert snapshot.get("SIH4") is snapshot.get("sih4") is snapshot.get("SiH4")
@@ -0,0 +1,164 @@
+import math
+from datetime import date
+
+import pytest
+from httpx import Response
+
+from pymoex.core.store import SeriesStore, SqliteStore
+from pymoex.exceptions import MoexError
+from pymoex.models.enums import CandleInterval
+from pymoex.services.history import HistoryService
+
+HISTORY_URL = "/history/engines/stock/markets/shares/boards/TQBR/securities/SBER.json"
+COLUMNS = ["TRADEDATE", "OPEN", "LOW", "HIGH", "CLOSE", "VALUE", "VOLUME"]
+
+DAYS = [
+    ["2024-03-11", 280.0, 278.5, 281.0, 280.5, 1.0e9, 3_500_000],
+    ["2024-03-12", 280.5, 279.0, 284.0, 283.9, 1.2e9, 4_200_000],
+    ["2024-03-13", 284.0, 282.0, 286.5, 285.1, 1.1e9, 3_900_000],
+    ["2024-03-14", 285.1, 283.3, 287.0, 286.2, 0.9e9, 3_100_000],
+]
+
+
+def _history(rows: list, total: int, index: int = 0, page: int = 100) -> dict:
+    return {
+        "history": {"columns": COLUMNS, "data": rows},
+        "history.cursor": {
+            "columns": ["INDEX", "TOTAL", "PAGESIZE"],
+            "data": [[index, total, page]],
+        },
+    }
+
+
+@pytest.fixture
+def history(client, tmp_path):
+    service = HistoryService(client.session, SqliteStore(tmp_path / "series.sqlite"))
+    yield service
+    service.close()
+
+
+@pytest.mark.asyncio
+async def test_history_fetches_only_tail(history, mock_moex):
+    # Первая загрузка: три дня двумя страницами
+    def _first(request):
+        start = int(request.url.params["start"])
+        rows = DAYS[:2] if start == 0 else DAYS[2:3]
+        return Response(200, json=_history(rows, total=3, index=start, page=2))
+
+    route = mock_moex.get(HISTORY_URL).mock(side_effect=_first)
+    candles = await history.history("SBER", "TQBR", date(2024, 3, 1))
+
+    assert len(candles) == 3
+    assert route.call_count == 2
+
+    # Повторный вызов запрашивает хвост с последнего сохраненного дня
+    route.mock(return_value=Response(200, json=_history(DAYS[2:], total=2)))
+    candles = await history.history("SBER", "TQBR", date(2024, 3, 1))
+
+    assert route.calls.last.request.url.params["from"] == "2024-03-13"
+    assert len(candles) == 4
+    assert [c.close for c in candles] == [280.5, 283.9, 285.1, 286.2]
+
+    # Период уже целиком в хранилище — без запросов
+    calls = route.call_count
+    candles = await history.history(
+        "SBER", "TQBR", date(2024, 3, 12), date(2024, 3, 13)
+    )
+
+    assert route.call_count == calls
+    assert [str(c.begin.date()) for c in candles] == ["2024-03-12", "2024-03-13"]
+
+
+@pytest.mark.asyncio
+async def test_parquet_store_roundtrip(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    from pymoex.core.store import ParquetStore, SeriesKey
+    from pymoex.models.candles import Candles
+    from pymoex.models.enums import CandleInterval
+
+    store = ParquetStore(tmp_path)
+    key = SeriesKey("history", "SBER", "TQBR", CandleInterval.DAY_1)
+    day = 86400
+
+    store.write(key, Candles.from_rows(key.interval, [(0, 1, 1, 1, 1, 1, 1, 1)]))
+    store.write(
+        key,
+        Candles.from_rows(
+            key.interval, [(0, 1, 2, 2, 2, 2, 2, 2), (day, day + 1, 3, 3, 3, 3, 3, 3)]
+        ),
+    )
+
+    assert store.last(key) == day
+    assert [c.close for c in store.read(key)] == [2.0, 3.0]
+    assert len(store.read(key, since=day)) == 1
+
+    # Начало ряда дописывается перед сохраненными свечами
+    store.write(key, Candles.from_rows(key.interval, [(-day, 1 - day, *[4] * 6)]))
+
+    assert store.span(key) == (-day, day)
+    assert [c.close for c in store.read(key)] == [4.0, 2.0, 3.0]
+
+
+def test_series_store_requires_overrides():
+    class Incomplete(SeriesStore):
+        def read(self, key, since=None, till=None):
+            raise AssertionError
+
+    with pytest.raises(TypeError, match="span"):
+        Incomplete()
+
+
+@pytest.mark.asyncio
+async def test_history_backfills_head(history, mock_moex):
+    route = mock_moex.get(HISTORY_URL).mock(
+        return_value=Response(200, json=_history(DAYS[2:], total=2))
+    )
+    await history.history("SBER", "TQBR", date(2024, 3, 13))
+
+    # Более ранний период: догружается начало ряда до первой сохраненной свечи
+    route.mock(return_value=Response(200, json=_history(DAYS[:2], total=2)))
+    candles = await history.history(
+        "SBER", "TQBR", date(2024, 3, 11), date(2024, 3, 14)
+    )
+
+    head = route.calls[1].request.url.params
+    assert (head["from"], head["till"]) == ("2024-03-11", "2024-03-12")
+    assert [c.close for c in candles] == [280.5, 283.9, 285.1, 286.2]
+
+
+@pytest.mark.asyncio
+async def test_sync_history_reports_failures(history, mock_moex):
+    mock_moex.get(HISTORY_URL).mock(
+        return_value=Response(200, json=_history(DAYS, total=4))
+    )
+    mock_moex.get(HISTORY_URL.replace("SBER", "GAZP")).mock(
+        return_value=Response(500)
+    )
+
+    counts = await history.sync_history(["SBER", "GAZP"], "TQBR", date(2024, 3, 1))
+
+    assert counts["SBER"] == 4
+    assert isinstance(counts["GAZP"], MoexError)
+
+
+@pytest.mark.asyncio
+async def test_history_keeps_missing_prices_as_nan(history, mock_moex):
+    rows = [
+        ["2024-03-11", None, None, 281.0, 280.5, 1.0e9, 3_500_000],
+        DAYS[1],
+    ]
+    mock_moex.get(HISTORY_URL).mock(
+        return_value=Response(200, json=_history(rows, total=2))
+    )
+
+    candles = await history.history("SBER", "TQBR", date(2024, 3, 11))
+
+    first = next(iter(candles))
+    assert math.isnan(first.open) and math.isnan(first.low)
+    assert first.close == 280.5
+
+    # Пропуски не попадают в минимум недели
+    weekly = next(iter(candles.resample(CandleInterval.WEEK_1)))
+    assert weekly.low == 279.0
+    assert weekly.open == 280.5
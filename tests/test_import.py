@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+# Модули, которые не должны загружаться при import pymoex
+HEAVY_MODULES = ("httpx", "pydantic", "pydantic_settings", "pymoex.client")
+
+
+def _python(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_import_is_lazy():
+    loaded = _python("import sys, pymoex; print(' '.join(sys.modules))").split()
+
+    assert not [m for m in HEAVY_MODULES if m in loaded]
+
+
+def test_lazy_exports_resolve():
+    out = _python(
+        "import pymoex; print(pymoex.MoexClient.__module__, pymoex.get_share.__name__)"
+    )
+    assert out.split() == ["pymoex.client", "get_share"]
@@ -0,0 +1,78 @@
+import pytest
+from httpx import Response
+
+ANALYTICS_URL = "/statistics/engines/stock/markets/index/analytics/IMOEX.json"
+SNAPSHOT_URL = "/engines/stock/markets/shares/boards/TQBR/securities.json"
+
+ANALYTICS_COLUMNS = ["indexid", "tradedate", "ticker", "shortnames", "secids", "weight"]
+CONSTITUENTS = [
+    ["IMOEX", "2024-03-11", "SBER", "Сбербанк", "SBER", 14.7],
+    ["IMOEX", "2024-03-11", "GAZP", "ГАЗПРОМ ао", "GAZP", 11.2],
+    ["IMOEX", "2024-03-11", "LKOH", "ЛУКОЙЛ", "LKOH", 15.9],
+]
+
+
+def _analytics(request):
+    start = int(request.url.params["start"])
+    return Response(
+        200,
+        json={
+            "analytics": {
+                "columns": ANALYTICS_COLUMNS,
+                "data": CONSTITUENTS[start : start + 2],
+            },
+            "analytics.cursor": {
+                "columns": ["INDEX", "TOTAL", "PAGESIZE"],
+                "data": [[start, len(CONSTITUENTS), 2]],
+            },
+        },
+    )
+
+
+@pytest.mark.asyncio
+async def test_index_constituents_paging(client, mock_moex):
+    route = mock_moex.get(ANALYTICS_URL).mock(side_effect=_analytics)
+
+    items = await client.index_constituents("imoex")
+
+    assert route.call_count == 2
+    assert [c.sec_id for c in items] == ["SBER", "GAZP", "LKOH"]
+    assert float(items[2].weight) == 15.9
+
+
+@pytest.mark.asyncio
+async def test_index_basket_single_snapshot(client, mock_moex):
+    mock_moex.get(ANALYTICS_URL).mock(side_effect=_analytics)
+    snapshot = mock_moex.get(SNAPSHOT_URL).mock(
+        return_value=Response(
+            200,
+            json={
+                "securities": {
+                    "columns": ["SECID", "SHORTNAME", "BOARDID"],
+                    "data": [
+                        ["GAZP", "ГАЗПРОМ ао", "TQBR"],
+                        ["LKOH", "ЛУКОЙЛ", "TQBR"],
+                        ["SBER", "Сбербанк", "TQBR"],
+                    ],
+                },
+                "marketdata": {
+                    "columns": ["SECID", "BOARDID", "LAST"],
+                    "data": [
+                        ["GAZP", "TQBR", 160.1],
+                        ["LKOH", "TQBR", 7350.0],
+                        ["SBER", "TQBR", 290.5],
+                    ],
+                },
+            },
+        )
+    )
+
+    basket = await client.index_basket("IMOEX")
+
+    # Вся корзина — одним запросом снимка
+    assert snapshot.call_count == 1
+    assert snapshot.calls.last.request.url.params["securities"] == "GAZP,LKOH,SBER"
+
+    prices = {item.sec_id: share.last_price for item, share in basket}
+    assert float(prices["SBER"]) == 290.5
+    assert float(basket.weights()["GAZP"]) == 11.2
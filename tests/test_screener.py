@@ -0,0 +1,55 @@
+from datetime import date
+
+from pymoex.analytics.screener import BondScreener
+from pymoex.models.bond import Bond
+
+
+def _bond(secid, yld, mat, level, value):
+    return Bond.model_validate(
+        {
+            "SECID": secid,
+            "SHORTNAME": secid,
+            "EFFECTIVEYIELD": yld,
+            "MATDATE": mat,
+            "LISTLEVEL": level,
+            "VALTODAY": value,
+            "CURRENCYID": "SUR",
+        }
+    )
+
+
+BONDS = [
+    _bond("A", 12.0, "2026-01-01", 1, 1_000_000),
+    _bond("B", 18.0, "2027-06-01", 2, 50_000),
+    _bond("C", 22.0, "2028-03-01", 3, 10_000),
+    _bond("D", 16.5, "2030-01-01", 1, 5_000_000),
+    _bond("E", None, "2027-01-01", 1, None),
+]
+
+
+def test_screen_and_top():
+    screener = BondScreener(BONDS)
+
+    mask = screener.screen(
+        effective_yield=(15, 25),
+        mat_date=(date(2027, 1, 1), None),
+        list_level={1, 2},
+        currency_id="SUR",
+    )
+    assert [b.sec_id for b in screener.select(mask)] == ["B", "D"]
+
+    top = screener.top(screener.all(), 2, by="effective_yield")
+    assert [b.sec_id for b in top] == ["C", "B"]
+
+    liquid = screener.top(mask, 1, by="value_today")
+    assert [b.sec_id for b in liquid] == ["D"]
+
+
+def test_masks_compose():
+    screener = BondScreener(BONDS)
+
+    low_level = screener.equals("list_level", 1)
+    high_yield = screener.between("effective_yield", 17)
+
+    assert {BONDS[i].sec_id for i in low_level | high_yield} == {"A", "B", "C", "D", "E"}
+    assert {BONDS[i].sec_id for i in low_level & ~high_yield} == {"A", "D", "E"}
@@ -31,3 +31,87 @@ async def test_find_empty(client, mock_moex):
 
     results = await client.find("NON_EXISTENT")
     assert results == []
+
+
+def test_rank_transliteration_and_typos():
+    from pymoex.core.search_index import SearchIndex, rank
+
+    rows = [
+        {"secid": "SBER", "shortname": "Сбербанк", "name": "ПАО Сбербанк"},
+        {"secid": "GAZP", "shortname": "ГАЗПРОМ ао", "name": "Газпром ПАО"},
+        {"secid": "LKOH", "shortname": "ЛУКОЙЛ", "name": "Лукойл ПАО"},
+    ]
+    index = SearchIndex(rows)
+
+    def find(query):
+        ids = index.lookup(query)
+        found = rank([rows[i] for i in ids], [index.keys[i] for i in ids], query)
+        return [r["secid"] for r in found]
+
+    # Латиница по кириллическому названию
+    assert find("sberbank") == ["SBER"]
+    # Кириллица по латинскому тикеру
+    assert find("лкох") == ["LKOH"]
+    # Опечатка
+    assert find("газпрм") == ["GAZP"]
+    assert find("xyzxyz") == []
+
+
+
+def test_search_by_emitent_title():
+    from pymoex.core.search_index import SearchIndex, rank, row_keys
+    from pymoex.services.search import _RawPage
+
+    rows = [
+        {
+            "secid": "RU000A105A95",
+            "shortname": "ГТЛК 2Р-01",
+            "name": "ГТЛК-002Р-01-боб",
+            "emitent_title": "Государственная транспортная лизинговая компания",
+        },
+        {"secid": "SBER", "shortname": "Сбербанк", "name": "ПАО Сбербанк"},
+    ]
+    index = SearchIndex(rows)
+
+    # Совпадение только в названии эмитента, в том числе латиницей
+    for query in ("лизинговая", "lizingovaya"):
+        ids = index.lookup(query)
+        found = rank([rows[i] for i in ids], [index.keys[i] for i in ids], query)
+        assert [r["secid"] for r in found] == ["RU000A105A95"]
+
+    # Уточнение полного ответа ISS по ключам строк
+    page = _RawPage(rows, [row_keys(r) for r in rows], True).refine("лизинг")
+    assert [r["secid"] for r in page.rows] == ["RU000A105A95"]
+
+@pytest.mark.asyncio
+async def test_search_pushes_filters_and_grows_limit(client, mock_moex):
+    columns = ["secid", "shortname", "name", "group", "is_traded"]
+    total = 140
+
+    # Широкий запрос: у первых строк совпадение только в названии эмитента,
+    # ранжирование отбрасывает их, и поиск догружает следующую порцию
+    def _page(request):
+        params = request.url.params
+        start, limit = int(params["start"]), int(params["limit"])
+        data = [
+            [f"B{i:03d}", f"Бумага {i}", "ПАО Банк" if i >= 60 else "ПАО"]
+            + ["stock_bonds", 1]
+            for i in range(start, min(start + limit, total))
+        ]
+        return Response(200, json={"securities": {"columns": columns, "data": data}})
+
+    route = mock_moex.get("/securities.json").mock(side_effect=_page)
+
+    results = await client.find_bonds("банк", traded_only=True)
+
+    params = route.calls[0].request.url.params
+    assert params["engine"] == "stock" and params["market"] == "bonds"
+    assert params["is_trading"] == "1"
+    assert params["limit"] == str(client.search.page_size)
+    assert "secid" in params["securities.columns"]
+
+    # В первых 50 строках нет совпадений -> догружены следующие 50,
+    # в них результатов достаточно, остаток ответа не запрашивается
+    assert len(results) == 20
+    assert route.call_count == 2
+    assert route.calls[1].request.url.params["start"] == "50"
@@ -0,0 +1,131 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import respx
+from httpx import Response
+
+from pymoex.client import MoexClient
+from pymoex.core.offload import Offloader, loads
+from pymoex.core.ratelimit import RateLimiter
+from pymoex.core.session import MoexSession
+from pymoex.exceptions import MoexNetworkError
+from tests.conftest import MOEX_SHARE_JSON
+
+SBER = "/engines/stock/markets/shares/securities/SBER.json"
+GAZP = "/engines/stock/markets/shares/securities/GAZP.json"
+
+
+async def _slow(request):
+    await asyncio.sleep(0.01)
+    return Response(200, json=MOEX_SHARE_JSON)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_coalesced(client, mock_moex):
+    route = mock_moex.get(SBER).mock(side_effect=_slow)
+
+    results = await asyncio.gather(
+        *(client.session.get(SBER, {"a": 1, "b": "x"}) for _ in range(5)),
+        client.session.get(SBER, {"b": "x", "a": "1"}),
+    )
+
+    assert route.call_count == 1
+    assert all(r is results[0] for r in results)
+
+    # Другие параметры и последующие запросы уходят отдельно
+    await asyncio.gather(client.session.get(SBER), client.session.get(SBER, {"a": 2}))
+    assert route.call_count == 3
+    assert not client.session._inflight
+
+
+@pytest.mark.asyncio
+async def test_coalesced_errors_and_cancellation(client, mock_moex):
+    mock_moex.get(SBER).mock(return_value=Response(503))
+
+    results = await asyncio.gather(
+        client.session.get(SBER), client.session.get(SBER), return_exceptions=True
+    )
+    assert all(isinstance(r, MoexNetworkError) for r in results)
+
+    route = mock_moex.get(GAZP).mock(side_effect=_slow)
+    first = asyncio.ensure_future(client.session.get(GAZP))
+    second = asyncio.ensure_future(client.session.get(GAZP))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    # Отмена одного ожидающего не отменяет общий запрос
+    assert (await second)["securities"]
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_session_between_clients():
+    with respx.mock(base_url="https://iss.moex.com/iss") as mock:
+        route = mock.get(SBER).mock(side_effect=_slow)
+
+        first = MoexClient(shared_session=True)
+        second = MoexClient(shared_session=True)
+        assert first.session is second.session
+
+        await asyncio.gather(first.share("SBER"), second.share("SBER"))
+        assert route.call_count == 1
+
+        await first.close()
+        assert not second.session.client.is_closed
+
+        await second.close()
+        assert second.session.client.is_closed
+
+        # После закрытия последним владельцем создается новая сессия
+        third = MoexClient(shared_session=True)
+        assert third.session is not second.session
+        await third.close()
+
+    assert not MoexSession._shared
+
+
+def _broken_worker():
+    # Как у скрипта без if __name__ == "__main__": процесс пула не стартует
+    raise RuntimeError("worker cannot start")
+
+
+@pytest.mark.asyncio
+async def test_offload_falls_back_to_threads():
+    assert Offloader(executor="auto").kind == "thread"
+
+    offload = Offloader(executor="process")
+    offload._executor = ProcessPoolExecutor(
+        max_workers=1,
+        initializer=_broken_worker,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+    try:
+        assert await offload.run(loads, b'{"a": 1}') == {"a": 1}
+        assert offload.kind == "thread"
+    finally:
+        offload.close()
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_releases_cancelled_permits():
+    limiter = RateLimiter(rate=10, concurrency=2)
+
+    await limiter.acquire()
+    limiter.release()
+
+    # Следующие разрешения ждут интервала; отменяем их во время ожидания
+    for _ in range(4):
+        task = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    async with asyncio.timeout(2):
+        await limiter.acquire()
+        await limiter.acquire()
+
+    assert limiter._semaphore.locked()
@@ -2,6 +2,7 @@ import pytest
 from httpx import Response
 
 from pymoex.exceptions import InstrumentNotFoundError
+from pymoex.services.base import InstrumentService
 from tests.conftest import MOEX_SHARE_JSON
 
 
@@ -33,3 +34,64 @@ async def test_get_share_not_found(client, mock_moex):
 
     with pytest.raises(InstrumentNotFoundError):
         await client.share("UNKNOWN")
+
+
+@pytest.mark.asyncio
+async def test_share_refresh_uses_remembered_board(client, mock_moex):
+    all_boards = mock_moex.get("/engines/stock/markets/shares/securities/SBER.json").mock(
+        return_value=Response(200, json=MOEX_SHARE_JSON)
+    )
+    one_board = mock_moex.get(
+        "/engines/stock/markets/shares/boards/TQBR/securities/SBER.json"
+    ).mock(return_value=Response(200, json=MOEX_SHARE_JSON))
+
+    await client.share("SBER")
+
+    # Котировка протухла — обновление идет сразу в выбранный режим
+    await client.cache_shares.delete("share:SBER")
+    share = await client.share("SBER")
+
+    assert share.board_id == "TQBR"
+    assert all_boards.call_count == 1
+    assert one_board.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_unchanged_response_reuses_model(client, mock_moex):
+    route = mock_moex.get("/engines/stock/markets/shares/securities/SBER.json").mock(
+        return_value=Response(200, json=MOEX_SHARE_JSON)
+    )
+
+    first = await client.share("SBER")
+    await client.cache_shares.clear()
+    await client.cache_boards.clear()
+    second = await client.share("SBER")
+
+    # Тело ответа не изменилось — прежняя модель без повторной валидации
+    assert route.call_count == 2
+    assert second is first
+
+    changed = {
+        **MOEX_SHARE_JSON,
+        "marketdata": {
+            "columns": ["SECID", "LAST", "OPEN", "BOARDID"],
+            "data": [["SBER", 276.0, 270.0, "TQBR"]],
+        },
+    }
+    route.mock(return_value=Response(200, json=changed))
+    await client.cache_shares.clear()
+    await client.cache_boards.clear()
+    third = await client.share("SBER")
+
+    assert third is not first
+    assert third.last_price == 276.0
+
+
+def test_instrument_service_requires_overrides():
+    class Incomplete(InstrumentService):
+        def _endpoint(self, ticker: str) -> str:
+            return ticker
+
+    # Незаданные методы обнаруживаются при создании сервиса, а не при запросе
+    with pytest.raises(TypeError, match="_parse"):
+        Incomplete(session=None, cache=None)
@@ -0,0 +1,146 @@
+import json
+import time
+
+import httpx
+import pytest
+
+from pymoex.client import MoexClient
+from pymoex.exceptions import MoexNetworkError
+from pymoex.testing import Cassette, RecordingTransport, ReplayTransport, StandIn
+from tests.conftest import MOEX_SHARE_JSON
+
+SBER_PATH = "/iss/engines/stock/markets/shares/securities/SBER.json"
+CALENDAR_PATH = "/iss/engines/stock.json"
+
+
+def _cassette(tmp_path) -> Cassette:
+    cassette = Cassette(tmp_path)
+    cassette.put(
+        "GET",
+        SBER_PATH,
+        "",
+        200,
+        "application/json",
+        json.dumps(MOEX_SHARE_JSON).encode(),
+    )
+    return cassette
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay(tmp_path):
+    calls = []
+
+    def upstream(request):
+        calls.append(request.url.path)
+        if request.url.path == SBER_PATH:
+            return httpx.Response(200, json=MOEX_SHARE_JSON)
+        return httpx.Response(404)
+
+    recorder = RecordingTransport(tmp_path, httpx.MockTransport(upstream))
+    async with MoexClient(transport=recorder) as client:
+        recorded = await client.share("SBER")
+
+    # Расписание торгов не записано (404), котировка записана
+    assert calls == [CALENDAR_PATH, SBER_PATH]
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    # Новая кассета читает записанное с диска
+    async with MoexClient(transport=ReplayTransport(tmp_path)) as client:
+        replayed = await client.share("SBER")
+
+        with pytest.raises(MoexNetworkError):
+            await client.share("GAZP")
+
+    assert replayed == recorded
+    assert replayed.last_price == 275.5
+
+
+@pytest.mark.asyncio
+async def test_standin_latency_and_errors(tmp_path):
+    standin = StandIn(_cassette(tmp_path), latency=0.05)
+
+    async with MoexClient(transport=standin.transport()) as client:
+        start = time.perf_counter()
+        share = await client.share("SBER")
+        elapsed = time.perf_counter() - start
+
+    assert share.sec_id == "SBER"
+    assert elapsed >= 0.05
+    assert standin.stats.served == 1
+
+    failing = StandIn(_cassette(tmp_path), error_rate=1.0)
+    async with MoexClient(transport=failing.transport()) as client:
+        with pytest.raises(MoexNetworkError):
+            await client.share("SBER")
+
+    # Запрос расписания торгов и запрос котировки
+    assert failing.stats.errors == 2
+
+
+@pytest.mark.asyncio
+async def test_standin_throttling(tmp_path):
+    standin = StandIn(_cassette(tmp_path), rate=1, burst=1)
+
+    async with MoexClient(transport=standin.transport()) as client:
+        await client.session.get("/engines/stock/markets/shares/securities/SBER.json")
+
+        with pytest.raises(MoexNetworkError, match="429"):
+            await client.session.get(
+                "/engines/stock/markets/shares/securities/SBER.json"
+            )
+
+    assert standin.stats.throttled == 1
+    assert standin.stats.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_standin_records_from_upstream():
+    upstream = httpx.MockTransport(
+        lambda request: httpx.Response(200, json=MOEX_SHARE_JSON)
+    )
+    standin = StandIn(Cassette(), upstream=upstream)
+
+    async with MoexClient(transport=standin.transport()) as client:
+        for _ in range(2):
+            data = await client.session.get(
+                "/engines/stock/markets/shares/securities/SBER.json"
+            )
+
+    assert data == MOEX_SHARE_JSON
+    assert standin.stats.recorded == 1
+    assert standin.stats.served == 2
+    assert standin.cassette.get("GET", SBER_PATH) is not None
+
+
+@pytest.mark.asyncio
+async def test_standin_records_from_iss_url():
+    requests = []
+
+    def upstream(request):
+        requests.append(request)
+        return httpx.Response(200, json=MOEX_SHARE_JSON)
+
+    standin = StandIn(Cassette(), upstream=httpx.MockTransport(upstream))
+
+    async with MoexClient(transport=standin.transport()) as client:
+        await client.session.get(
+            "/engines/stock/markets/shares/securities/SBER.json", {"iss.meta": "off"}
+        )
+
+    url = requests[0].url
+    assert (url.scheme, url.host) == ("https", "iss.moex.com")
+    assert url.path == SBER_PATH
+    assert url.params["iss.meta"] == "off"
+
+    # Адрес без /iss в пути заменителя дополняется путем upstream_url
+    standin = StandIn(
+        Cassette(),
+        upstream=httpx.MockTransport(upstream),
+        upstream_url="http://mirror.local/iss",
+    )
+    async with httpx.AsyncClient(
+        transport=standin.transport(), base_url="http://standin"
+    ) as http:
+        await http.get("/securities.json")
+
+    assert str(requests[1].url) == "http://mirror.local/iss/securities.json"
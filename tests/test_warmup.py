@@ -0,0 +1,80 @@
+import asyncio
+
+import pytest
+from httpx import Response
+
+from pymoex.services import warmup
+from tests.conftest import MOEX_SEARCH_JSON, MOEX_SHARE_JSON
+
+SHARES_PATH = "/engines/stock/markets/shares/securities.json"
+
+
+@pytest.mark.asyncio
+async def test_keep_warm_preloads_universe(client, mock_moex):
+    mock_moex.get("/engines/stock.json").mock(return_value=Response(404))
+    bulk = mock_moex.get(SHARES_PATH).mock(
+        return_value=Response(200, json=MOEX_SHARE_JSON)
+    )
+
+    # GAZP нет в снимке — загружается отдельным запросом
+    gazp_json = {
+        "securities": {
+            "columns": ["SECID", "SHORTNAME", "BOARDID"],
+            "data": [["GAZP", "Газпром", "TQBR"]],
+        },
+        "marketdata": {"columns": ["SECID", "LAST", "BOARDID"], "data": []},
+    }
+    single = mock_moex.get("/engines/stock/markets/shares/securities/GAZP.json").mock(
+        return_value=Response(200, json=gazp_json)
+    )
+    search = mock_moex.get("/securities.json").mock(
+        return_value=Response(200, json=MOEX_SEARCH_JSON)
+    )
+
+    warmer = await client.keep_warm(shares=["sber", "GAZP"], searches=["sber"])
+
+    assert bulk.calls[0].request.url.params["securities"] == "SBER,GAZP"
+    assert single.call_count == 1
+    assert warmer.refreshes == 3
+
+    # Обработчики видят только попадания в кэш
+    stats = client.cache_stats()
+    misses = (stats["shares"].misses, stats["search"].misses)
+
+    share = await client.share("SBER")
+    await client.share("GAZP")
+    await client.find("sber")
+
+    assert share.last_price == 275.5
+    assert (stats["shares"].misses, stats["search"].misses) == misses
+    assert (bulk.call_count, single.call_count, search.call_count) == (1, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_keep_warm_refreshes_until_close(client, mock_moex, monkeypatch):
+    # Обновление каждые 0.6 с (1% от TTL 60 с) без случайного сдвига
+    monkeypatch.setattr(warmup, "REFRESH_AHEAD", 0.99)
+    monkeypatch.setattr(warmup, "MIN_INTERVAL", 0.01)
+    monkeypatch.setattr(warmup, "JITTER", 0.0)
+
+    mock_moex.get("/engines/stock.json").mock(return_value=Response(404))
+    bulk = mock_moex.get(SHARES_PATH).mock(
+        return_value=Response(200, json=MOEX_SHARE_JSON)
+    )
+
+    warmer = await client.keep_warm(shares=["SBER"])
+
+    # Ждем двух фоновых обновлений после первичной загрузки
+    async with asyncio.timeout(5):
+        while warmer.refreshes < 3:
+            await asyncio.sleep(0.01)
+
+    assert bulk.call_count >= 3
+    assert warmer.running
+
+    await client.close()
+
+    assert not warmer.running
+    calls = bulk.call_count
+    await asyncio.sleep(0.1)
+    assert bulk.call_count == calls